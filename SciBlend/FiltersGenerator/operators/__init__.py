@@ -1,6 +1,7 @@
 from .create_emitter import FILTERS_OT_create_emitter
 from .place_emitter import FILTERS_OT_place_emitter
 from .generate_streamline import FILTERS_OT_generate_streamline
+from .generate_pathlines import FILTERS_OT_generate_pathlines
 from .volume_import import FILTERS_OT_volume_import_vdb_sequence
 from .volume_update import FILTERS_OT_volume_update_material, FILTERS_OT_volume_compute_range, FILTERS_OT_volume_cleanup_slicers
 from .volume_list_operators import (
@@ -15,6 +16,8 @@ from .clip_live import FILTERS_OT_clip_ensure_plane, FILTERS_OT_build_clip_surfa
 from .slice_live import FILTERS_OT_slice_ensure_plane, FILTERS_OT_build_slice_surface
 from .calculator import FILTERS_OT_calculator_apply, FILTERS_OT_calculator_append_var, FILTERS_OT_calculator_append_attr, FILTERS_OT_calculator_append_func
 from .interpolate import FILTERS_OT_apply_interpolation, FILTERS_OT_compute_attribute_range
+from .convert_data import FILTERS_OT_convert_data
+from .filter_sequence import FILTERS_OT_filter_sequence, FILTERS_OT_cancel_filter_sequence
 from .collection_modifiers import (
     FILTERS_OT_modifier_item_add,
     FILTERS_OT_modifier_item_remove,
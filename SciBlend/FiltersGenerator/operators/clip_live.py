@@ -1,13 +1,20 @@
 import bpy
+import numpy as np
 from bpy.types import Object, Mesh
 from bpy.props import StringProperty
 from mathutils import Vector
-from ...operators.utils.volume_mesh_data import get_model
-from ..utils.on_demand_loader import ensure_model_for_object
+from ..utils.on_demand_loader import ensure_model_for_object, is_skin_only, SKIN_ONLY_ERROR
+from ..utils.isosurface import local_plane
+from ..utils.filter_cache import cached_filter_result
+from ..utils.mesh_buffers import read_point_attributes, boundary_surface, write_surface, live_attribute_names
 
 
 PLANE_NAME_SUFFIX = "_ClipPlane"
 
+# Per source object: (id of the topology arrays, kept-cell mask) of the last clip, so live updates can skip
+# rewriting the output while the plane moves within the same cells
+_LAST_KEPT = {}
+
 
 def _ensure_clip_plane_for_object(context, obj: Object) -> Object:
 	"""Ensure a plane object exists, aligned to the object's bounding box center and oriented to +Z normal."""
@@ -38,8 +45,27 @@ def _ensure_clip_plane_for_object(context, obj: Object) -> Object:
 	return plane
 
 
-def rebuild_clip_surface_for_settings(context, settings) -> Object | None:
-	"""Rebuild or create a clipped mesh: keep whole mesh on the chosen side plus crinkle boundary faces."""
+def clip_keep_mask(arrays, local_normal, offset: float, side: str) -> np.ndarray:
+	"""Return the cells kept by a clip in model space: whole cells on the chosen side, judged by their centroid."""
+	cell_side, _ = arrays.classify_by_plane(local_normal, offset)
+	return (cell_side >= 0) if side == 'POSITIVE' else (cell_side <= 0)
+
+
+def clip_surface(arrays, keep: np.ndarray, point_fields: dict) -> tuple | None:
+	"""Return the clip result for a kept-cell mask: the outer shell of the kept cells plus the crinkle closure.
+
+	Touches no Blender data, so it can run on a worker thread.
+	"""
+	face_ids, face_cells, flip = arrays.exposed_faces(keep)
+	return boundary_surface(arrays, face_ids, face_cells, flip, point_fields)
+
+
+def rebuild_clip_surface_for_settings(context, settings, live: bool = False) -> Object | None:
+	"""Rebuild or create a clipped mesh: keep whole mesh on the chosen side plus crinkle boundary faces.
+
+	With `live`, the output is left untouched when the kept cells did not change, only attributes read by the
+	output's materials or modifiers are transferred (see live_attribute_names), and the plane stays visible.
+	"""
 	src_obj = getattr(settings, 'target_object', None)
 	plane = getattr(settings, 'plane_object', None)
 	side = getattr(settings, 'side', 'POSITIVE')
@@ -58,82 +84,37 @@ def rebuild_clip_surface_for_settings(context, settings) -> Object | None:
 	normal = (mw_p.to_3x3() @ normal).normalized()
 	point_on_plane = mw_p.translation.copy()
 
-	model = get_model(src_obj.name) or ensure_model_for_object(context, src_obj)
-	if not model or not getattr(model, 'cells', None) or not getattr(model, 'faces', None) or not getattr(model, 'vertices', None):
+	model = ensure_model_for_object(context, src_obj)
+	if model is None:
 		return None
-
-	def signed_distance_world(loc: Vector) -> float:
-		return (loc - point_on_plane).dot(normal)
-
-	# Precompute cell centers in world space and sidedness
-	cell_center_ws = {}
-	cell_keep_side = {}
-	for cell in model.cells:
-		coords = []
-		for face in getattr(cell, 'faces', []) or []:
-			for v in getattr(face, 'vertices', []) or []:
-				coords.append(v.co)
-		if not coords:
-			continue
-		cent_local = Vector((0.0, 0.0, 0.0))
-		for c in coords:
-			cent_local += Vector(c)
-		cent_local /= max(1, len(coords))
-		cent_world = src_obj.matrix_world @ cent_local
-		cell_center_ws[cell] = cent_world
-		d = signed_distance_world(cent_world)
-		cell_keep_side[cell] = (d >= 0.0) if side == 'POSITIVE' else (d <= 0.0)
-
-	# Collect faces: keep faces of kept-side cells that either
-	# - are boundary faces, or
-	# - neighbor is a non-kept-side cell (i.e., plane boundary),
-	# to ensure a closed visible half. This is effectively crinkle closure + outer shell.
-	faces_to_create = []
-	owner_cells = []
-	added = set()
-	for face in getattr(model, 'faces', []):
-		owner = getattr(face, 'owner', None)
-		neighbour = getattr(face, 'neighbour', None)
-		# Boundary face: keep if owner is on kept side
-		if neighbour is None:
-			if owner is None:
-				continue
-			if cell_keep_side.get(owner, False):
-				verts = getattr(face, 'get_vertices_for_cell', lambda c: None)(owner)
-				if not verts:
-					continue
-				indices = tuple(getattr(v, 'blender_v_index', -1) for v in verts)
-				if any(i < 0 for i in indices) or indices in added:
-					continue
-				faces_to_create.append(list(indices))
-				owner_cells.append(owner)
-				added.add(indices)
-			continue
-		# Internal face: if exactly one side is kept, add oriented to the kept cell
-		owner_kept = cell_keep_side.get(owner, False)
-		neigh_kept = cell_keep_side.get(neighbour, False)
-		if owner_kept == neigh_kept:
-			continue
-		kept_cell = owner if owner_kept else neighbour
-		verts = getattr(face, 'get_vertices_for_cell', lambda c: None)(kept_cell)
-		if not verts:
-			continue
-		indices = tuple(getattr(v, 'blender_v_index', -1) for v in verts)
-		if any(i < 0 for i in indices) or indices in added:
-			continue
-		faces_to_create.append(list(indices))
-		owner_cells.append(kept_cell)
-		added.add(indices)
-
-	blender_vertices = [getattr(v, 'co', (0.0, 0.0, 0.0)) for v in getattr(model, 'vertices', [])]
-	if not blender_vertices or not faces_to_create:
+	arrays = model.arrays
+	if arrays.num_cells == 0:
 		return None
 
+	# Cells are kept by the side of their centroid; the grid index labels whole bins away from the plane
+	local_normal, offset = local_plane(src_obj.matrix_world, point_on_plane, normal)
+	keep = clip_keep_mask(arrays, local_normal, offset, side)
+
 	out_name = f"{src_obj.name}_ClipLive"
+	existing = bpy.data.objects.get(out_name)
+	previous = _LAST_KEPT.get(src_obj.name)
+	if live and existing is not None and previous is not None and previous[0] == id(arrays) and np.array_equal(previous[1], keep):
+		return existing
+
+	# Kept cells contribute their boundary faces and the faces shared with dropped cells, oriented outwards:
+	# the visible outer shell plus the crinkle closure along the plane
+	names = live_attribute_names(existing) if live else None
+	src_mesh: Mesh = src_obj.data
+	point_fields = read_point_attributes(src_mesh, arrays.num_points, names)
+	surface = cached_filter_result(context.scene, arrays, 'CLIP', (local_normal, offset, side), point_fields, lambda: clip_surface(arrays, keep, point_fields))
+	if surface is None:
+		_LAST_KEPT.pop(src_obj.name, None)
+		return None
+
 	mesh = bpy.data.meshes.get(out_name)
 	if mesh is None:
 		mesh = bpy.data.meshes.new(out_name)
-	obj = bpy.data.objects.get(out_name)
+	obj = existing
 	if obj is None:
 		obj = bpy.data.objects.new(out_name, mesh)
 		colls = src_obj.users_collection
@@ -142,59 +123,17 @@ def rebuild_clip_surface_for_settings(context, settings) -> Object | None:
 		else:
 			context.collection.objects.link(obj)
 
-	mesh.clear_geometry()
-	mesh.from_pydata(blender_vertices, [], faces_to_create)
-	mesh.update()
-
-	# Copy point attributes if sizes match
-	src_mesh: Mesh = src_obj.data
-	try:
-		for src_attr in src_mesh.attributes:
-			if getattr(src_attr, 'domain', '') != 'POINT' or getattr(src_attr, 'data_type', '') != 'FLOAT':
-				continue
-			if src_attr.data and len(src_attr.data) == len(blender_vertices):
-				try:
-					if src_attr.name in mesh.attributes:
-						mesh.attributes.remove(mesh.attributes[src_attr.name])
-				except Exception:
-					pass
-				dst = mesh.attributes.new(name=src_attr.name, type='FLOAT', domain='POINT')
-				buf = [0.0] * len(blender_vertices)
-				src_attr.data.foreach_get('value', buf)
-				dst.data.foreach_set('value', buf)
-	except Exception:
-		pass
-
-	# Bake cell attributes to FACE domain
-	if owner_cells:
-		all_attr = set()
-		for c in owner_cells:
-			for k in getattr(c, 'attributes', {}).keys():
-				all_attr.add(k)
-		for name in sorted(all_attr):
-			values = [0.0] * len(faces_to_create)
-			for i, c in enumerate(owner_cells):
-				val = getattr(c, 'attributes', {}).get(name)
-				if val is None:
-					continue
-				try:
-					values[i] = float(val[0]) if isinstance(val, (list, tuple)) else float(val)
-				except Exception:
-					values[i] = 0.0
-			try:
-				if f"cell_{name}" in mesh.attributes:
-					mesh.attributes.remove(mesh.attributes[f"cell_{name}"])
-			except Exception:
-				pass
-			attr = mesh.attributes.new(name=f"cell_{name}", type='FLOAT', domain='FACE')
-			attr.data.foreach_set('value', values)
+	write_surface(mesh, surface, arrays.cell_attributes, names)
+	# Recorded only once the output matches the mask, so a failed build is retried on the next update
+	_LAST_KEPT[src_obj.name] = (id(arrays), keep)
 
 	# hide plane after update
-	try:
-		plane.hide_set(True)
-		plane.hide_render = True
-	except Exception:
-		pass
+	if not live:
+		try:
+			plane.hide_set(True)
+			plane.hide_render = True
+		except Exception:
+			pass
 
 	obj.display_type = 'TEXTURED'
 	obj.hide_set(False)
@@ -244,6 +183,9 @@ class FILTERS_OT_build_clip_surface(bpy.types.Operator):
 		if not settings:
 			self.report({'ERROR'}, "Clip settings not available")
 			return {'CANCELLED'}
+		if is_skin_only(getattr(settings, 'target_object', None)):
+			self.report({'ERROR'}, SKIN_ONLY_ERROR)
+			return {'CANCELLED'}
 		obj = rebuild_clip_surface_for_settings(context, settings)
 		if obj is None:
 			self.report({'WARNING'}, "No geometry created (position/orientation plane)")
@@ -256,4 +198,6 @@ __all__ = [
 	"FILTERS_OT_clip_ensure_plane",
 	"FILTERS_OT_build_clip_surface",
 	"rebuild_clip_surface_for_settings",
+	"clip_keep_mask",
+	"clip_surface",
 ] 
\ No newline at end of file
@@ -1,166 +1,195 @@
 import bpy
+import numpy as np
 from bpy.types import Object, Mesh
 from bpy.props import StringProperty
-from ...operators.utils.volume_mesh_data import get_model
-from ..utils.on_demand_loader import ensure_model_for_object
+from ..utils.on_demand_loader import ensure_model_for_object, is_skin_only, SKIN_ONLY_ERROR
+from ..utils.data_conversion import cell_to_point
+from ..utils.isosurface import TetDecomposition, cell_value_range, cells_crossing_levels, extract_isosurfaces
+from ..utils.filter_cache import cached_filter_result, cell_key_fields
+from ..utils.mesh_buffers import read_point_attributes, write_surface
 
 
-def _aggregate(values, mode: str) -> float:
-	if not values:
-		return 0.0
-	if mode == 'MIN':
-		return min(values)
-	if mode == 'MAX':
-		return max(values)
-	return sum(values) / float(len(values))
-
-
-def rebuild_contour_surface_for_settings(context, settings) -> Object | None:
-	"""Rebuild or create a contour surface object by detecting isosurface crossings using crinkle clip semantics."""
-	src_obj = getattr(settings, 'target_object', None)
-	if not src_obj or getattr(src_obj, 'type', None) != 'MESH':
-		return None
-	attr_name = getattr(settings, 'attribute', 'NONE')
-	if not attr_name or attr_name == 'NONE':
-		return None
-	iso_value = float(getattr(settings, 'iso_value', 0.0))
-	domain = getattr(settings, 'domain', 'CELL')
-	agg = getattr(settings, 'aggregator', 'MEAN')
-	model = get_model(src_obj.name) or ensure_model_for_object(context, src_obj)
-	if not model or not getattr(model, 'cells', None) or not getattr(model, 'faces', None):
-		return None
-
-	cell_scalar = {}
+def contour_fields(arrays, point_fields: dict, attr_name: str, domain: str) -> tuple:
+	"""Return (point scalar, cell scalar or None) for the contour attribute; cell data is averaged onto points."""
 	if domain == 'CELL':
-		for cell in model.cells:
-			val_tuple = getattr(cell, 'attributes', {}).get(attr_name)
-			if val_tuple is None:
+		column = arrays.cell_attributes.get(attr_name)
+		if column is None:
+			return None, None
+		cell_values = np.asarray(column[:, 0], dtype=np.float64)
+		return cell_to_point(arrays, cell_values), cell_values
+	values = point_fields.get(attr_name)
+	if values is None:
+		return None, None
+	return np.asarray(values, dtype=np.float64), None
+
+
+def contour_levels(settings) -> list:
+	"""Return the iso values requested by the contour settings, in the order they were given."""
+	mode = getattr(settings, 'iso_mode', 'SINGLE')
+	if mode == 'RANGE':
+		count = max(1, int(getattr(settings, 'iso_count', 1)))
+		return [float(v) for v in np.linspace(float(settings.iso_min), float(settings.iso_max), count)]
+	if mode == 'LIST':
+		levels = []
+		for token in str(getattr(settings, 'iso_list', '')).replace(';', ',').split(','):
+			token = token.strip()
+			if not token:
 				continue
 			try:
-				cell_scalar[cell] = float(val_tuple[0]) if isinstance(val_tuple, (list, tuple)) else float(val_tuple)
-			except Exception:
-				continue
-	else:
-		mesh_attr = None
-		try:
-			mesh_attr = src_obj.data.attributes.get(attr_name)
-		except Exception:
-			mesh_attr = None
-		if not mesh_attr or getattr(mesh_attr, 'domain', '') not in {'POINT', 'VERTEX'} or getattr(mesh_attr, 'data_type', '') != 'FLOAT':
-			return None
-		vals = []
-		try:
-			vals = [0.0] * len(src_obj.data.vertices)
-			mesh_attr.data.foreach_get('value', vals)
-		except Exception:
-			vals = []
-		if not vals:
-			return None
-		for cell in model.cells:
-			pv = []
-			for face in getattr(cell, 'faces', []) or []:
-				for v in getattr(face, 'vertices', []) or []:
-					idx = getattr(v, 'blender_v_index', -1)
-					if 0 <= idx < len(vals):
-						pv.append(float(vals[idx]))
-			if not pv:
-				continue
-			cell_scalar[cell] = _aggregate(pv, agg)
-
-	faces_to_create = []
-	owner_cells = []
-	for face in getattr(model, 'faces', []):
-		owner = getattr(face, 'owner', None)
-		neigh = getattr(face, 'neighbour', None)
-		if not owner or not neigh:
-			continue
-		vo = cell_scalar.get(owner, None)
-		vn = cell_scalar.get(neigh, None)
-		if vo is None or vn is None:
-			continue
-		if (vo < iso_value and vn > iso_value) or (vo > iso_value and vn < iso_value) or vo == iso_value or vn == iso_value:
-			verts_for_owner = getattr(face, 'get_vertices_for_cell', lambda c: None)(owner)
-			if not verts_for_owner:
-				continue
-			indices = [getattr(v, 'blender_v_index', -1) for v in verts_for_owner]
-			if any(i < 0 for i in indices):
-				continue
-			faces_to_create.append(indices)
-			owner_cells.append(owner)
+				levels.append(float(token))
+			except ValueError:
+				print(f"[Contour] Ignoring invalid iso value '{token}'")
+		return levels
+	return [float(getattr(settings, 'iso_value', 0.0))]
 
-	blender_vertices = [getattr(v, 'co', (0.0, 0.0, 0.0)) for v in getattr(model, 'vertices', [])]
-	if not blender_vertices or not faces_to_create:
-		return None
 
-	out_name = f"{src_obj.name}_ContourLive"
-	mesh = bpy.data.meshes.get(out_name)
+def _output_object(context, src_obj: Object, name: str) -> Object:
+	mesh = bpy.data.meshes.get(name)
 	if mesh is None:
-		mesh = bpy.data.meshes.new(out_name)
-	obj = bpy.data.objects.get(out_name)
+		mesh = bpy.data.meshes.new(name)
+	obj = bpy.data.objects.get(name)
 	if obj is None:
-		obj = bpy.data.objects.new(out_name, mesh)
+		obj = bpy.data.objects.new(name, mesh)
 		try:
 			colls = src_obj.users_collection
 			(colls[0] if colls else context.collection).objects.link(obj)
 		except Exception:
 			context.collection.objects.link(obj)
+	return obj
 
-	mesh.clear_geometry()
-	mesh.from_pydata(blender_vertices, [], faces_to_create)
-	mesh.update()
 
-	# Copy point attributes if sizes match
-	src_mesh: Mesh = src_obj.data
-	try:
-		for src_attr in src_mesh.attributes:
-			if getattr(src_attr, 'domain', '') != 'POINT' or getattr(src_attr, 'data_type', '') != 'FLOAT':
-				continue
-			if src_attr.data and len(src_attr.data) == len(blender_vertices):
-				try:
-					if src_attr.name in mesh.attributes:
-						mesh.attributes.remove(mesh.attributes[src_attr.name])
-				except Exception:
-					pass
-				dst = mesh.attributes.new(name=src_attr.name, type='FLOAT', domain='POINT')
-				buf = [0.0] * len(blender_vertices)
-				src_attr.data.foreach_get('value', buf)
-				dst.data.foreach_set('value', buf)
-	except Exception:
-		pass
-
-	# Bake cell attributes to FACE domain for selected faces (owner side)
-	if owner_cells:
-		all_attr = set()
-		for c in owner_cells:
-			for k in getattr(c, 'attributes', {}).keys():
-				all_attr.add(k)
-		for name in sorted(all_attr):
-			values = [0.0] * len(faces_to_create)
-			for i, c in enumerate(owner_cells):
-				val = getattr(c, 'attributes', {}).get(name)
-				if val is None:
-					continue
-				try:
-					values[i] = float(val[0]) if isinstance(val, (list, tuple)) else float(val)
-				except Exception:
-					values[i] = 0.0
-			try:
-				if f"cell_{name}" in mesh.attributes:
-					mesh.attributes.remove(mesh.attributes[f"cell_{name}"])
-			except Exception:
-				pass
-			attr = mesh.attributes.new(name=f"cell_{name}", type='FLOAT', domain='FACE')
-			attr.data.foreach_set('value', values)
+def _remove_outputs(objects: list) -> None:
+	"""Delete output objects together with their meshes, unless a mesh is still used elsewhere."""
+	for obj in objects:
+		try:
+			mesh = obj.data
+			bpy.data.objects.remove(obj, do_unlink=True)
+			if mesh is not None and mesh.users == 0:
+				bpy.data.meshes.remove(mesh)
+		except Exception:
+			pass
 
+
+def _triangle_surface(points, tris, tri_cells, attributes: dict, tri_levels) -> tuple:
+	offsets = np.arange(0, 3 * tris.shape[0] + 1, 3, dtype=np.int64)
+	return points, offsets, tris.ravel(), tri_cells, attributes, {"iso_level": tri_levels}
+
+
+def _write_surface(obj: Object, arrays, surface: tuple) -> None:
+	write_surface(obj.data, surface, arrays.cell_attributes)
 	obj.display_type = 'TEXTURED'
 	obj.hide_set(False)
 	obj.hide_render = False
 
+
+def contour_level_surfaces(arrays, point_values: np.ndarray, cell_values, levels: list, point_fields: dict) -> list:
+	"""Contour every level in one pass and return one (points, triangles, cell per triangle, attributes) per level.
+
+	The cell ranges, the tetrahedra and the carried point fields are prepared once and shared by every level.
+	Touches no Blender data, so it can run on a worker thread.
+	"""
+	lo, hi = cell_value_range(arrays, point_values, cell_values)
+	active = cells_crossing_levels(lo, hi, levels)
+	if active.shape[0] == 0:
+		return []
+	decomp = TetDecomposition(arrays, active)
+	carried = {name: decomp.extend(values) for name, values in point_fields.items()}
+	return extract_isosurfaces(decomp, decomp.extend(point_values, cell_values), levels, carried)
+
+
+def combine_contour_surfaces(levels: list, surfaces: list) -> tuple | None:
+	"""Merge per-level surfaces into one result whose `iso_level` face attribute records each triangle's level."""
+	pieces = [(level, surface) for level, surface in zip(levels, surfaces) if surface[1].shape[0] > 0]
+	if not pieces:
+		return None
+	starts = np.cumsum([0] + [surface[0].shape[0] for _, surface in pieces])
+	points = np.concatenate([surface[0] for _, surface in pieces])
+	tris = np.concatenate([surface[1] + start for (_, surface), start in zip(pieces, starts)])
+	tri_cells = np.concatenate([surface[2] for _, surface in pieces])
+	attributes = {name: np.concatenate([surface[3][name] for _, surface in pieces]) for name in pieces[0][1][3]}
+	tri_levels = np.concatenate([np.full(surface[1].shape[0], level) for level, surface in pieces])
+	return _triangle_surface(points, tris, tri_cells, attributes, tri_levels)
+
+
+def rebuild_contour_surface_for_settings(context, settings) -> Object | None:
+	"""Rebuild or create smooth contour surfaces with marching tetrahedra over the model's cells.
+
+	All requested iso values are contoured in one pass (see contour_level_surfaces). Point attributes of the
+	source are interpolated along the crossing edges; cell attributes are baked per triangle from the cell it was
+	cut from.
+	"""
+	src_obj = getattr(settings, 'target_object', None)
+	if not src_obj or getattr(src_obj, 'type', None) != 'MESH':
+		return None
+	attr_name = getattr(settings, 'attribute', 'NONE')
+	if not attr_name or attr_name == 'NONE':
+		return None
+	levels = contour_levels(settings)
+	if not levels:
+		return None
+	domain = getattr(settings, 'domain', 'CELL')
+	model = ensure_model_for_object(context, src_obj)
+	if model is None:
+		return None
+	arrays = model.arrays
+	if arrays.num_cells == 0:
+		return None
+
+	src_mesh: Mesh = src_obj.data
+	try:
+		point_fields = read_point_attributes(src_mesh, arrays.num_points)
+	except Exception:
+		point_fields = {}
+	point_values, cell_values = contour_fields(arrays, point_fields, attr_name, domain)
+	if point_values is None:
+		return None
+	out_name = f"{src_obj.name}_ContourLive"
+	level_output = getattr(settings, 'level_output', 'COMBINED')
+	params = (attr_name, domain, levels, level_output)
+	cell_fields = cell_key_fields(arrays, attr_name, domain)
+	prefix = f"{out_name}_L"
+
+	if level_output == 'PER_LEVEL':
+		# Switching from combined output leaves the single object behind otherwise
+		combined = bpy.data.objects.get(out_name)
+		if combined is not None:
+			_remove_outputs([combined])
+		surfaces = cached_filter_result(context.scene, arrays, 'CONTOUR', params, point_fields, lambda: contour_level_surfaces(arrays, point_values, cell_values, levels, point_fields), cell_fields)
+		if not surfaces:
+			# No level crosses the field: drop the previous levels rather than leave a stale surface
+			_remove_outputs([o for o in bpy.data.objects if o.name.startswith(prefix)])
+			return None
+		first_obj = None
+		produced = set()
+		for index, (level, (points, tris, tri_cells, attributes)) in enumerate(zip(levels, surfaces)):
+			if tris.shape[0] == 0:
+				continue
+			obj = _output_object(context, src_obj, f"{out_name}_L{index:02d}")
+			_write_surface(obj, arrays, _triangle_surface(points, tris, tri_cells, attributes, np.full(tris.shape[0], level)))
+			produced.add(obj.name)
+			first_obj = first_obj or obj
+		_remove_outputs([o for o in bpy.data.objects if o.name.startswith(prefix) and o.name not in produced])
+		return first_obj
+
+	_remove_outputs([o for o in bpy.data.objects if o.name.startswith(prefix)])
+
+	def _combined():
+		surfaces = contour_level_surfaces(arrays, point_values, cell_values, levels, point_fields)
+		return combine_contour_surfaces(levels, surfaces) if surfaces else None
+
+	surface = cached_filter_result(context.scene, arrays, 'CONTOUR', params, point_fields, _combined, cell_fields)
+	if surface is None:
+		existing = bpy.data.objects.get(out_name)
+		if existing is not None and getattr(existing, 'type', None) == 'MESH':
+			existing.data.clear_geometry()
+		return None
+	obj = _output_object(context, src_obj, out_name)
+	_write_surface(obj, arrays, surface)
 	return obj
 
 
 class FILTERS_OT_build_contour_surface(bpy.types.Operator):
-	"""Build or update a contour (isosurface) using crinkle clip semantics."""
+	"""Build or update a contour (isosurface) using marching tetrahedra."""
 	bl_idname = "filters.build_contour_surface"
 	bl_label = "Build Contour Surface"
 	bl_options = {'REGISTER', 'UNDO'}
@@ -176,6 +205,9 @@ class FILTERS_OT_build_contour_surface(bpy.types.Operator):
 		if not settings:
 			self.report({'ERROR'}, "Contour settings not available")
 			return {'CANCELLED'}
+		if is_skin_only(getattr(settings, 'target_object', None)):
+			self.report({'ERROR'}, SKIN_ONLY_ERROR)
+			return {'CANCELLED'}
 		obj = rebuild_contour_surface_for_settings(context, settings)
 		if obj is None:
 			self.report({'WARNING'}, "No geometry created (check attribute and iso value)")
@@ -184,4 +216,11 @@ class FILTERS_OT_build_contour_surface(bpy.types.Operator):
 		return {'FINISHED'}
 
 
-__all__ = ["FILTERS_OT_build_contour_surface", "rebuild_contour_surface_for_settings"] 
\ No newline at end of file
+__all__ = [
+	"FILTERS_OT_build_contour_surface",
+	"rebuild_contour_surface_for_settings",
+	"contour_levels",
+	"contour_fields",
+	"contour_level_surfaces",
+	"combine_contour_surfaces",
+] 
\ No newline at end of file
@@ -0,0 +1,68 @@
+import numpy as np
+from bpy.types import Operator
+from ..utils.on_demand_loader import ensure_model_for_object, is_skin_only, SKIN_ONLY_ERROR
+from ..utils.data_conversion import point_to_cell, cell_to_point
+from ..utils.mesh_buffers import read_point_attribute, set_float_attribute
+
+
+class FILTERS_OT_convert_data(Operator):
+	"""Convert an attribute between point and cell data of a volumetric mesh and store it as a new attribute."""
+	bl_idname = "filters.convert_data"
+	bl_label = "Convert Data"
+	bl_options = {'REGISTER', 'UNDO'}
+
+	def execute(self, context):
+		settings = getattr(context.scene, 'filters_conversion_settings', None)
+		if not settings:
+			self.report({'ERROR'}, "Conversion settings not available")
+			return {'CANCELLED'}
+		obj = getattr(settings, 'target_object', None)
+		if not obj or getattr(obj, 'type', None) != 'MESH':
+			self.report({'ERROR'}, "Select a Domain Mesh")
+			return {'CANCELLED'}
+		attr_name = getattr(settings, 'attribute', 'NONE')
+		if not attr_name or attr_name == 'NONE':
+			self.report({'ERROR'}, "Select an attribute")
+			return {'CANCELLED'}
+		if is_skin_only(obj):
+			self.report({'ERROR'}, SKIN_ONLY_ERROR)
+			return {'CANCELLED'}
+		model = ensure_model_for_object(context, obj)
+		if model is None:
+			self.report({'ERROR'}, "No volume data for this mesh")
+			return {'CANCELLED'}
+		arrays = model.arrays
+		mode = getattr(settings, 'mode', 'MEAN')
+		direction = getattr(settings, 'direction', 'POINT_TO_CELL')
+
+		if direction == 'CELL_TO_POINT':
+			column = arrays.cell_attributes.get(attr_name)
+			if column is None:
+				self.report({'ERROR'}, f"Cell attribute '{attr_name}' not found")
+				return {'CANCELLED'}
+			if len(obj.data.vertices) != arrays.num_points:
+				self.report({'ERROR'}, "Mesh vertices do not match the volume model")
+				return {'CANCELLED'}
+			output_name = (getattr(settings, 'output_name', '') or '').strip() or f"{attr_name}_point"
+			values = cell_to_point(arrays, column[:, 0], mode)
+			set_float_attribute(obj.data, output_name, 'POINT', np.nan_to_num(values, nan=0.0))
+			obj.data.update()
+			self.report({'INFO'}, f"Point attribute '{output_name}' written")
+			return {'FINISHED'}
+
+		point_values = read_point_attribute(obj.data, attr_name)
+		if point_values is None:
+			self.report({'ERROR'}, f"Point attribute '{attr_name}' not found")
+			return {'CANCELLED'}
+		if point_values.shape[0] != arrays.num_points:
+			self.report({'ERROR'}, "Mesh vertices do not match the volume model")
+			return {'CANCELLED'}
+		output_name = (getattr(settings, 'output_name', '') or '').strip() or f"{attr_name}_cell"
+		values = point_to_cell(arrays, point_values, mode)
+		arrays.cell_attributes[output_name] = values.reshape(-1, 1)
+		if model.is_materialized:
+			for cell, value in zip(model.cells, values.tolist()):
+				if value == value:
+					cell.attributes[output_name] = (value,)
+		self.report({'INFO'}, f"Cell attribute '{output_name}' added to the volume model")
+		return {'FINISHED'}
@@ -0,0 +1,343 @@
+import bpy
+from concurrent.futures import ThreadPoolExecutor
+from bpy.types import Operator
+from mathutils import Vector
+from ...compat import iter_action_fcurves
+from ...operators.utils.scene import keyframe_visibility_single_frame, enforce_constant_interpolation
+from ..utils.on_demand_loader import ensure_model_for_object, FRAME_NAME_RE
+from ..utils.isosurface import local_plane
+from ..utils.data_conversion import cell_scalar_from_fields
+from ..utils.filter_cache import result_budget_bytes, result_key, get_cached_result, store_result, cell_key_fields
+from ..utils.mesh_buffers import read_point_attributes, write_surface
+from .clip_live import clip_keep_mask, clip_surface
+from .slice_live import slice_surface
+from .threshold_live import threshold_surface
+from .contour_live import contour_levels, contour_fields, contour_level_surfaces, combine_contour_surfaces
+
+
+# Output object suffix per filter; results of a sequence run are skipped when the collection is filtered again
+SEQUENCE_SUFFIXES = {
+	'CLIP': "_ClipSeq",
+	'SLICE': "_SliceSeq",
+	'THRESHOLD': "_ThresholdSeq",
+	'CONTOUR': "_ContourSeq",
+}
+_SKIPPED_SUFFIXES = tuple(SEQUENCE_SUFFIXES.values()) + ("_ClipPlane", "_ClipLive", "_SliceLive", "_ContourLive", "_Threshold")
+
+_SEQUENCE_STATE = {'cancel': False, 'running': False}
+
+
+def _plane_world(settings) -> tuple | None:
+	plane = getattr(settings, 'plane_object', None)
+	if not plane or getattr(plane, 'type', None) != 'MESH':
+		return None
+	mw = plane.matrix_world
+	normal = (mw.to_3x3() @ Vector((0.0, 0.0, 1.0))).normalized()
+	return tuple(mw.translation), tuple(normal)
+
+
+def sequence_filter_params(scene, kind: str) -> dict | None:
+	"""Snapshot the scene settings of one filter as plain values, or None when they are incomplete."""
+	if kind in {'CLIP', 'SLICE'}:
+		settings = getattr(scene, 'filters_clip_settings' if kind == 'CLIP' else 'filters_slice_settings', None)
+		plane = _plane_world(settings) if settings else None
+		if plane is None:
+			return None
+		return {'plane_point': plane[0], 'plane_normal': plane[1], 'side': getattr(settings, 'side', 'POSITIVE')}
+	settings = getattr(scene, 'filters_threshold_settings' if kind == 'THRESHOLD' else 'filters_contour_settings', None)
+	attr_name = getattr(settings, 'attribute', 'NONE') if settings else 'NONE'
+	if not attr_name or attr_name == 'NONE':
+		return None
+	params = {'attribute': attr_name, 'domain': getattr(settings, 'domain', 'CELL')}
+	if kind == 'THRESHOLD':
+		params.update(aggregator=getattr(settings, 'aggregator', 'MEAN'), min_value=float(settings.min_value), max_value=float(settings.max_value))
+	else:
+		params['levels'] = contour_levels(settings)
+		if not params['levels']:
+			return None
+	return params
+
+
+def compute_sequence_surface(kind: str, arrays, params: dict, point_fields: dict) -> tuple | None:
+	"""Run one filter on one frame's model and return its surface result; touches no Blender data.
+
+	Plane filters expect `local_normal` and `offset` in `params`, already expressed in the frame's model space.
+	"""
+	if arrays.num_cells == 0:
+		return None
+	if kind == 'CLIP':
+		keep = clip_keep_mask(arrays, params['local_normal'], params['offset'], params['side'])
+		return clip_surface(arrays, keep, point_fields)
+	if kind == 'SLICE':
+		return slice_surface(arrays, params['local_normal'], params['offset'], point_fields)
+	if kind == 'THRESHOLD':
+		cell_values = cell_scalar_from_fields(arrays, point_fields, params['attribute'], params['domain'], params['aggregator'])
+		if cell_values is None:
+			return None
+		return threshold_surface(arrays, cell_values, params['min_value'], params['max_value'], point_fields)
+	point_values, cell_values = contour_fields(arrays, point_fields, params['attribute'], params['domain'])
+	if point_values is None:
+		return None
+	surfaces = contour_level_surfaces(arrays, point_values, cell_values, params['levels'], point_fields)
+	return combine_contour_surfaces(params['levels'], surfaces) if surfaces else None
+
+
+def sequence_cache_params(kind: str, params: dict) -> tuple:
+	"""Return the filter parameters in the form the single-object filters use as result cache keys."""
+	if kind == 'CLIP':
+		return (params['local_normal'], params['offset'], params['side'])
+	if kind == 'SLICE':
+		return (params['local_normal'], params['offset'])
+	if kind == 'THRESHOLD':
+		aggregator = params['aggregator'] if params['domain'] == 'POINT' else ''
+		return (params['attribute'], params['domain'], aggregator, params['min_value'], params['max_value'])
+	return (params['attribute'], params['domain'], params['levels'], 'COMBINED')
+
+
+def _sequence_objects(collection: bpy.types.Collection) -> list:
+	"""Return the source meshes of a collection ordered by frame number, then by name."""
+	objects = [obj for obj in collection.all_objects if obj.type == 'MESH' and not obj.name.endswith(_SKIPPED_SUFFIXES)]
+
+	def _order(obj):
+		match = FRAME_NAME_RE.match(obj.name)
+		return (0, int(match.group(1)), '') if match else (1, 0, obj.name)
+
+	return sorted(objects, key=_order)
+
+
+def _output_collection(context, source: bpy.types.Collection, kind: str) -> bpy.types.Collection:
+	name = f"{source.name}{SEQUENCE_SUFFIXES[kind]}"
+	collection = bpy.data.collections.get(name)
+	if collection is None:
+		collection = bpy.data.collections.new(name)
+		context.scene.collection.children.link(collection)
+	return collection
+
+
+def copy_visibility_keys(src_obj: bpy.types.Object, dst_obj: bpy.types.Object) -> bool:
+	"""Replace the visibility animation of dst_obj with the hide_viewport/hide_render keys of src_obj.
+
+	Falls back to showing dst_obj on frame n only when the source is named `Frame_{n}`. Returns False when there is
+	nothing to copy.
+	"""
+	dst_obj.animation_data_clear()
+	adt = src_obj.animation_data
+	keys = []
+	if adt and adt.action:
+		slot = getattr(adt, "action_slot", None)
+		for fcurve in iter_action_fcurves(adt.action, slot):
+			if fcurve.data_path in {"hide_viewport", "hide_render"}:
+				keys.extend((fcurve.data_path, kf.co[0], bool(kf.co[1] >= 0.5)) for kf in fcurve.keyframe_points)
+	if keys:
+		for data_path, frame, hidden in keys:
+			setattr(dst_obj, data_path, hidden)
+			dst_obj.keyframe_insert(data_path=data_path, frame=frame)
+	else:
+		match = FRAME_NAME_RE.match(src_obj.name)
+		if not match:
+			return False
+		keyframe_visibility_single_frame(dst_obj, int(match.group(1)))
+	enforce_constant_interpolation(dst_obj)
+	return True
+
+
+class FILTERS_OT_filter_sequence(Operator):
+	"""Apply the current settings of one geometry filter to every mesh in a collection, one output per frame.
+
+	Models are loaded and attributes read on the main thread; the filter itself runs on worker threads and the
+	results are written back between timer ticks. Frames found in the filter result cache skip the workers.
+	Press Esc to cancel.
+	"""
+	bl_idname = "filters.filter_sequence"
+	bl_label = "Filter Sequence"
+	bl_options = {'REGISTER'}
+
+	_timer = None
+	_executor = None
+
+	@classmethod
+	def poll(cls, context):
+		settings = getattr(context.scene, 'filters_sequence_settings', None)
+		return settings is not None and bool(settings.target_collection) and not _SEQUENCE_STATE['running']
+
+	def execute(self, context):
+		settings = context.scene.filters_sequence_settings
+		collection = bpy.data.collections.get(settings.target_collection)
+		if collection is None:
+			self.report({'ERROR'}, f"Collection not found: {settings.target_collection}")
+			return {'CANCELLED'}
+		kind = settings.filter_type
+		params = sequence_filter_params(context.scene, kind)
+		if params is None:
+			missing = "a plane object" if kind in {'CLIP', 'SLICE'} else "an attribute and levels/range"
+			self.report({'ERROR'}, f"{kind.title()} settings need {missing}")
+			return {'CANCELLED'}
+		objects = _sequence_objects(collection)
+		if not objects:
+			self.report({'WARNING'}, f"No mesh objects found in collection '{collection.name}'")
+			return {'CANCELLED'}
+
+		self._kind = kind
+		self._params = params
+		self._queue = [obj.name for obj in objects]
+		self._pending = []
+		self._total = len(objects)
+		self._done = 0
+		self._written = 0
+		self._output = _output_collection(context, collection, kind)
+		self._workers = int(settings.max_workers)
+		self._keyframe = bool(settings.keyframe_visibility)
+		self._budget = result_budget_bytes(context.scene)
+		self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="sciblend_sequence")
+		_SEQUENCE_STATE['cancel'] = False
+		_SEQUENCE_STATE['running'] = True
+		settings.is_running = True
+		settings.progress = 0.0
+		wm = context.window_manager
+		wm.progress_begin(0, self._total)
+		self._timer = wm.event_timer_add(0.05, window=context.window)
+		wm.modal_handler_add(self)
+		return {'RUNNING_MODAL'}
+
+	def modal(self, context, event):
+		if event.type == 'ESC' or _SEQUENCE_STATE['cancel']:
+			return self._finish(context, cancelled=True)
+		if event.type != 'TIMER':
+			return {'PASS_THROUGH'}
+		try:
+			self._collect(context)
+			self._submit(context)
+		except Exception as e:
+			print(f"[Filters] Sequence error: {e}")
+			return self._finish(context, cancelled=True)
+		if not self._queue and not self._pending:
+			return self._finish(context, cancelled=False)
+		return {'PASS_THROUGH'}
+
+	def _submit(self, context) -> None:
+		"""Prepare frames on the main thread until every worker has one in flight."""
+		while self._queue and len(self._pending) < self._workers:
+			name = self._queue.pop(0)
+			obj = bpy.data.objects.get(name)
+			model = ensure_model_for_object(context, obj) if obj is not None else None
+			if model is None:
+				print(f"[Filters] Sequence: no volume data for '{name}', skipped")
+				self._advance(context)
+				continue
+			arrays = model.arrays
+			params = dict(self._params)
+			if 'plane_point' in params:
+				params['local_normal'], params['offset'] = local_plane(obj.matrix_world, params['plane_point'], params['plane_normal'])
+			point_fields = read_point_attributes(obj.data, arrays.num_points)
+			key = None
+			if self._budget > 0:
+				cell_fields = cell_key_fields(arrays, params['attribute'], params['domain']) if 'attribute' in params else None
+				key = result_key(arrays, self._kind, sequence_cache_params(self._kind, params), point_fields, cell_fields)
+				hit, surface = get_cached_result(key, arrays)
+				if hit:
+					if surface is not None:
+						self._write(context, obj, arrays, surface)
+						self._written += 1
+					self._advance(context)
+					continue
+			future = self._executor.submit(compute_sequence_surface, self._kind, arrays, params, point_fields)
+			self._pending.append((name, arrays, future, key))
+
+	def _collect(self, context) -> None:
+		"""Write finished results in submission order so outputs appear frame by frame."""
+		while self._pending and self._pending[0][2].done():
+			name, arrays, future, key = self._pending.pop(0)
+			try:
+				surface = future.result()
+			except Exception as e:
+				print(f"[Filters] Sequence: filtering '{name}' failed: {e}")
+				surface = None
+			else:
+				if key is not None:
+					store_result(key, arrays, surface, self._budget)
+			src_obj = bpy.data.objects.get(name)
+			if surface is not None and src_obj is not None:
+				self._write(context, src_obj, arrays, surface)
+				self._written += 1
+			self._advance(context)
+
+	def _write(self, context, src_obj, arrays, surface) -> None:
+		out_name = f"{src_obj.name}{SEQUENCE_SUFFIXES[self._kind]}"
+		mesh = bpy.data.meshes.get(out_name) or bpy.data.meshes.new(out_name)
+		obj = bpy.data.objects.get(out_name)
+		if obj is None:
+			obj = bpy.data.objects.new(out_name, mesh)
+		elif obj.data is not mesh:
+			obj.data = mesh
+		if obj.name not in self._output.objects:
+			self._output.objects.link(obj)
+		write_surface(mesh, surface, arrays.cell_attributes)
+		obj.matrix_world = src_obj.matrix_world.copy()
+		obj.display_type = 'TEXTURED'
+		if not (self._keyframe and copy_visibility_keys(src_obj, obj)):
+			obj.hide_viewport = False
+			obj.hide_render = False
+
+	def _advance(self, context) -> None:
+		self._done += 1
+		settings = context.scene.filters_sequence_settings
+		settings.progress = self._done / float(self._total)
+		context.window_manager.progress_update(self._done)
+		try:
+			context.workspace.status_text_set(f"Filtering sequence: {self._done}/{self._total} (Esc to cancel)")
+		except Exception:
+			pass
+		for area in getattr(context.screen, 'areas', []):
+			if area.type == 'VIEW_3D':
+				area.tag_redraw()
+
+	def _finish(self, context, cancelled: bool):
+		for _, _, future, _ in self._pending:
+			future.cancel()
+		self._pending = []
+		if self._executor is not None:
+			self._executor.shutdown(wait=False, cancel_futures=True)
+			self._executor = None
+		wm = context.window_manager
+		if self._timer is not None:
+			wm.event_timer_remove(self._timer)
+			self._timer = None
+		wm.progress_end()
+		try:
+			context.workspace.status_text_set(None)
+		except Exception:
+			pass
+		_SEQUENCE_STATE['running'] = False
+		_SEQUENCE_STATE['cancel'] = False
+		settings = context.scene.filters_sequence_settings
+		settings.is_running = False
+		if cancelled:
+			self.report({'WARNING'}, f"Sequence filtering cancelled after {self._done}/{self._total} frames ({self._written} written)")
+			return {'CANCELLED'}
+		self.report({'INFO'}, f"Filtered {self._written}/{self._total} frames into '{self._output.name}'")
+		return {'FINISHED'}
+
+
+class FILTERS_OT_cancel_filter_sequence(Operator):
+	"""Stop a running sequence filter; frames already written are kept."""
+	bl_idname = "filters.cancel_filter_sequence"
+	bl_label = "Cancel Filter Sequence"
+	bl_options = {'REGISTER'}
+
+	def execute(self, context):
+		if _SEQUENCE_STATE['running']:
+			_SEQUENCE_STATE['cancel'] = True
+		else:
+			settings = getattr(context.scene, 'filters_sequence_settings', None)
+			if settings is not None:
+				settings.is_running = False
+		return {'FINISHED'}
+
+
+__all__ = [
+	"FILTERS_OT_filter_sequence",
+	"FILTERS_OT_cancel_filter_sequence",
+	"compute_sequence_surface",
+	"sequence_filter_params",
+	"copy_visibility_keys",
+]
@@ -0,0 +1,163 @@
+import bpy
+import numpy as np
+from ..utils.on_demand_loader import frame_objects
+from ..utils.integrators import advect_particles
+from ..utils.streamline_output import pack_polylines, write_streamline_mesh, apply_tube_modifier
+from .filter_sequence import copy_visibility_keys
+from .generate_streamline import find_emitter, generate_seeds, build_field_sampler
+
+PARTICLES_COLLECTION = "Pathline_Particles"
+
+
+class FILTERS_OT_generate_pathlines(bpy.types.Operator):
+    """Advect seeded particles through the Frame_{n} sequence of the unsteady field.
+
+    Frames are visited in time order and only the fields of the two frames bracketing the current interval are
+    kept; velocities are blended linearly in time between them. Writes one point cloud per frame, shown on that
+    frame, and a Pathlines mesh tracing every particle.
+    """
+    bl_idname = "filters.generate_pathlines"
+    bl_label = "Generate Pathlines"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        s = getattr(context.scene, "filters_emitter_settings", None)
+        if not s or not s.vector_attribute:
+            self.report({'ERROR'}, "Select a mesh and a vector attribute in Filters Generator.")
+            return {'CANCELLED'}
+
+        emitter = find_emitter(context)
+
+        frames = frame_objects(context.scene)
+        numbers = sorted(n for n in frames if n >= context.scene.frame_current) or sorted(frames)
+        if len(numbers) < 2:
+            self.report({'ERROR'}, "Pathlines need at least two Frame_{n} meshes from the current frame on.")
+            return {'CANCELLED'}
+
+        normalize = bool(s.normalize_field)
+        try:
+            sampler0, sample0 = build_field_sampler(context, s, frames[numbers[0]])
+        except Exception as e:
+            self.report({'ERROR'}, f"Sampler error on {frames[numbers[0]].name}: {e}")
+            return {'CANCELLED'}
+        try:
+            seeds = generate_seeds(context, s, emitter, sampler0, sample0)
+        except Exception as e:
+            self.report({'ERROR'}, f"Seeding error: {e}")
+            return {'CANCELLED'}
+        num = seeds.shape[0]
+        if num == 0:
+            self.report({'WARNING'}, "No seeds inside the field domain")
+            return {'CANCELLED'}
+        pos = seeds.copy()
+        alive = np.arange(num)
+        # Per frame: (frame number, ids of live particles, their positions, their speeds)
+        records = []
+
+        wm = context.window_manager
+        wm.progress_begin(0, len(numbers))
+        try:
+            speed = np.linalg.norm(sample0(pos), axis=1) * s.field_scale
+            records.append((numbers[0], alive.copy(), pos.copy(), speed))
+            for step, n1 in enumerate(numbers[1:], start=1):
+                if alive.shape[0] == 0:
+                    break
+                n0 = numbers[step - 1]
+                try:
+                    sampler1, sample1 = build_field_sampler(context, s, frames[n1])
+                except Exception as e:
+                    self.report({'WARNING'}, f"Stopped at {frames[n1].name}: {e}")
+                    break
+
+                def field(positions, alpha, sample0=sample0, sample1=sample1):
+                    v = (1.0 - alpha) * sample0(positions) + alpha * sample1(positions)
+                    if normalize:
+                        lengths = np.linalg.norm(v, axis=1)
+                        scale = lengths > 1e-12
+                        v[scale] /= lengths[scale, None]
+                    return v * s.field_scale
+
+                moved = advect_particles(pos[alive], (n1 - n0) * s.frame_time, s.pathline_substeps, field)
+                pos[alive] = moved
+                if s.stop_at_bounds:
+                    alive = alive[sampler1.inside_bbox_many(moved, margin=max(0.0, s.bbox_margin))]
+                speed = np.linalg.norm(sample1(pos[alive]), axis=1) * s.field_scale
+                records.append((n1, alive.copy(), pos[alive].copy(), speed))
+                # The older frame is no longer needed; keep only the newest field
+                sampler0, sample0 = sampler1, sample1
+                wm.progress_update(step)
+        finally:
+            wm.progress_end()
+
+        written = self._write_particles(context, frames, records)
+        self._write_pathlines(context, s, num, records)
+        self.report({'INFO'}, f"Advected {num} particles over {written} frames")
+        return {'FINISHED'}
+
+    def _write_particles(self, context, frames, records) -> int:
+        collection = bpy.data.collections.get(PARTICLES_COLLECTION)
+        if collection is None:
+            collection = bpy.data.collections.new(PARTICLES_COLLECTION)
+            context.scene.collection.children.link(collection)
+        for frame, ids, positions, speed in records:
+            name = f"Particles_{frame}"
+            attributes = {"particle_id": ids, "speed": speed}
+            obj = bpy.data.objects.get(name)
+            if obj is not None and getattr(obj, 'type', None) == 'MESH':
+                # Rewrite the previous run's mesh in place so reruns do not leave orphan meshes behind
+                mesh = obj.data
+                mesh.clear_geometry()
+                for attr_name in attributes:
+                    attr = mesh.attributes.get(attr_name)
+                    if attr is not None:
+                        mesh.attributes.remove(attr)
+            else:
+                if obj is not None:
+                    bpy.data.objects.remove(obj, do_unlink=True)
+                mesh = bpy.data.meshes.new(name)
+                obj = bpy.data.objects.new(name, mesh)
+                collection.objects.link(obj)
+            write_streamline_mesh(mesh, positions, np.zeros((0, 2), dtype=np.int64), attributes)
+            if not copy_visibility_keys(frames[frame], obj):
+                obj.hide_viewport = False
+                obj.hide_render = False
+        return len(records)
+
+    def _write_pathlines(self, context, s, num, records) -> None:
+        ids = np.concatenate([r[1] for r in records])
+        points = np.concatenate([r[2] for r in records])
+        speed = np.concatenate([r[3] for r in records])
+        times = np.concatenate([np.full(r[1].shape[0], float(r[0] - records[0][0]) * s.frame_time) for r in records])
+        # Records are in time order, so a stable sort by particle keeps each path chronological
+        order = np.argsort(ids, kind='stable')
+        counts = np.bincount(ids, minlength=num)
+        bounds = np.cumsum(counts)[:-1]
+        lines = np.split(points[order], bounds)
+        keep = counts >= 2
+        if not keep.any():
+            return
+        packed, edges, line_id = pack_polylines(lines)
+        speed_kept = np.concatenate([part for part, k in zip(np.split(speed[order], bounds), keep) if k])
+        time_kept = np.concatenate([part for part, k in zip(np.split(times[order], bounds), keep) if k])
+        particle_kept = np.nonzero(keep)[0][line_id]
+        mesh = bpy.data.meshes.new("Pathlines")
+        write_streamline_mesh(mesh, packed, edges, {
+            "line_id": particle_kept,
+            "speed": speed_kept,
+            "integration_time": time_kept,
+        })
+        obj = bpy.data.objects.new("Pathlines", mesh)
+        context.collection.objects.link(obj)
+        if s.streamline_tubes:
+            try:
+                apply_tube_modifier(obj, s.tube_radius, s.tube_arrows)
+            except Exception as e:
+                self.report({'WARNING'}, f"Tube setup failed: {e}")
+
+
+def register():
+    bpy.utils.register_class(FILTERS_OT_generate_pathlines)
+
+
+def unregister():
+    bpy.utils.unregister_class(FILTERS_OT_generate_pathlines)
@@ -1,7 +1,152 @@
 import bpy
-from mathutils import Vector
-from ..utils.field_sampling import VectorFieldSampler
-from ..utils.integrators import integrate_streamline
+import numpy as np
+from ..utils.field_sampling import CellFieldSampler, vector_field_sampler_for
+from ..utils.grid_field import cached_grid_field
+from ..utils.on_demand_loader import ensure_model_for_object
+from ..utils.streamline_output import pack_polylines, integration_time, write_streamline_mesh, apply_tube_modifier
+from ..utils.integrators import integrate_streamlines, integrate_streamlines_adaptive
+from ..utils.seeding import grid_seeds, random_seeds, poisson_disk_seeds, surface_seeds
+from ..utils.isosurface import TetDecomposition, cell_value_range, cells_crossing_levels, extract_isosurface
+from ..utils.mesh_buffers import read_point_attributes, world_points
+
+
+def find_emitter(context):
+    """Return the first selected StreamEmitter object, or None."""
+    for obj in context.selected_objects:
+        if obj.name.startswith("StreamEmitter"):
+            return obj
+    return None
+
+
+def emitter_seeds(emitter) -> np.ndarray:
+    """World-space (N, 3) seed positions of an emitter: its location, or its face centers for mesh emitters."""
+    emitter_type = emitter.get("filters_emitter_type", 'POINT')
+    if emitter_type == 'POINT' or emitter.type == 'EMPTY':
+        seeds = [emitter.matrix_world.translation.copy()]
+    else:
+        mesh = emitter.data
+        mw = emitter.matrix_world
+        if not hasattr(mesh, 'polygons') or len(mesh.polygons) == 0:
+            seeds = [emitter.matrix_world.translation.copy()]
+        else:
+            seeds = [mw @ p.center for p in mesh.polygons]
+    return np.array([tuple(seed) for seed in seeds], dtype=np.float64)
+
+
+def _world_mesh(obj) -> tuple:
+    """World-space (points, triangles) of a mesh object from its loop triangles."""
+    mesh = obj.data
+    mesh.calc_loop_triangles()
+    tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get('vertices', tris)
+    return world_points(obj), tris.reshape(-1, 3).astype(np.int64)
+
+
+def _emitter_box(emitter) -> tuple:
+    """World-space bounding box of an emitter; empties span their display size."""
+    if emitter.type == 'MESH' and len(emitter.data.vertices) > 0:
+        points, _ = _world_mesh(emitter)
+    else:
+        size = float(getattr(emitter, 'empty_display_size', 1.0))
+        corners = np.array([(x, y, z) for x in (-size, size) for y in (-size, size) for z in (-size, size)])
+        world = np.array([tuple(row) for row in emitter.matrix_world], dtype=np.float64)
+        points = corners @ world[:3, :3].T + world[:3, 3]
+    return points.min(axis=0), points.max(axis=0)
+
+
+def _isosurface_mesh(context, s) -> tuple:
+    """World-space (points, triangles) of the domain's iso-surface used for seeding."""
+    obj = s.target_object
+    model = ensure_model_for_object(context, obj)
+    if model is None:
+        raise ValueError("Iso-surface seeding needs the volume model of the domain mesh.")
+    arrays = model.arrays
+    values = read_point_attributes(obj.data, arrays.num_points, {s.seed_iso_attribute}).get(s.seed_iso_attribute)
+    if values is None:
+        raise ValueError(f"Point attribute '{s.seed_iso_attribute}' not found on the domain mesh")
+    values = np.asarray(values, dtype=np.float64)
+    lo, hi = cell_value_range(arrays, values)
+    decomp = TetDecomposition(arrays, cells_crossing_levels(lo, hi, [s.seed_iso_value]))
+    points, tris, _, _ = extract_isosurface(decomp, decomp.extend(values), s.seed_iso_value)
+    world = np.array([tuple(row) for row in obj.matrix_world], dtype=np.float64)
+    return points @ world[:3, :3].T + world[:3, 3], tris
+
+
+def generate_seeds(context, s, emitter, sampler, sample) -> np.ndarray:
+    """World-space (N, 3) seeds for the seeding strategy of the emitter settings.
+
+    `sampler` and `sample` come from build_field_sampler and provide the domain bounds and the field magnitude
+    for weighted surface seeding. Generated seeds where the field vanishes (outside the cells of a cell sampler)
+    are dropped. Raises ValueError when the strategy cannot run.
+    """
+    strategy = s.seed_strategy
+    if strategy == 'EMITTER':
+        if emitter is None:
+            raise ValueError("Select a StreamEmitter object.")
+        return emitter_seeds(emitter)
+    rng = np.random.default_rng(s.seed_random_seed)
+    count = max(1, s.seed_count)
+    if strategy in {'GRID', 'RANDOM', 'POISSON'}:
+        if s.seed_region == 'EMITTER':
+            if emitter is None:
+                raise ValueError("Select a StreamEmitter object to seed inside its bounds.")
+            bmin, bmax = _emitter_box(emitter)
+        else:
+            bmin, bmax = tuple(sampler.bbox_min), tuple(sampler.bbox_max)
+        if strategy == 'GRID':
+            seeds = grid_seeds(bmin, bmax, count)
+        elif strategy == 'RANDOM':
+            seeds = random_seeds(bmin, bmax, count, rng)
+        else:
+            seeds = poisson_disk_seeds(bmin, bmax, count, rng)
+    else:
+        if strategy == 'SURFACE':
+            if emitter is None or emitter.type != 'MESH':
+                raise ValueError("Surface seeding needs a mesh StreamEmitter.")
+            points, tris = _world_mesh(emitter)
+        else:
+            points, tris = _isosurface_mesh(context, s)
+        if tris.shape[0] == 0:
+            raise ValueError("The seeding surface has no faces.")
+        weights = None
+        if s.seed_weight_by_magnitude:
+            weights = np.linalg.norm(sample(points[tris].mean(axis=1), normalize=False), axis=1)
+        seeds = surface_seeds(points, tris, count, rng, weights)
+    if seeds.shape[0] > 0:
+        seeds = seeds[np.linalg.norm(sample(seeds, normalize=False), axis=1) > 0.0]
+    return seeds
+
+
+def build_field_sampler(context, s, obj):
+    """Build the sampler selected in the emitter settings for the vector attribute of `obj`.
+
+    Returns (sampler, sample) where sample(positions, normalize) evaluates (N, 3) world positions. Raises
+    ValueError when the sampler cannot be built.
+    """
+    if s.sampling_method == 'CELL':
+        model = ensure_model_for_object(context, obj)
+        if model is None:
+            raise ValueError("Cell sampling needs the volume model of the domain mesh. Re-import it or enable on-demand loading.")
+        sampler = CellFieldSampler(obj, s.vector_attribute, model.arrays)
+    elif s.sampling_method == 'GRID':
+        k_grid = max(1, s.k_neighbors)
+
+        def source_sampler():
+            idw = vector_field_sampler_for(obj, s.vector_attribute)
+            return lambda positions: idw.sample_many(positions, k_neighbors=k_grid)
+
+        sampler = cached_grid_field(obj, s.vector_attribute, s.grid_resolution, source_sampler, tag=f"idw{k_grid}")
+    else:
+        sampler = vector_field_sampler_for(obj, s.vector_attribute)
+
+    k = max(1, s.k_neighbors)
+
+    def sample(positions, normalize=False):
+        if s.sampling_method == 'IDW':
+            return sampler.sample_many(positions, k_neighbors=k, normalize=normalize)
+        return sampler.sample_many(positions, normalize=normalize)
+
+    return sampler, sample
 
 
 class FILTERS_OT_generate_streamline(bpy.types.Operator):
@@ -15,97 +160,99 @@ class FILTERS_OT_generate_streamline(bpy.types.Operator):
             self.report({'ERROR'}, "Select a mesh and a vector attribute in Filters Generator.")
             return {'CANCELLED'}
 
-        # Find selected emitter
-        emitter = None
-        for obj in context.selected_objects:
-            if obj.name.startswith("StreamEmitter"):
-                emitter = obj
-                break
-        if emitter is None:
-            self.report({'ERROR'}, "Select a StreamEmitter object.")
-            return {'CANCELLED'}
-
-        emitter_type = emitter.get("filters_emitter_type", 'POINT')
+        emitter = find_emitter(context)
 
         try:
-            sampler = VectorFieldSampler(s.target_object, s.vector_attribute)
+            sampler, sample_field = build_field_sampler(context, s, s.target_object)
         except Exception as e:
             self.report({'ERROR'}, f"Sampler error: {e}")
             return {'CANCELLED'}
 
-        def inside(p: Vector):
+        try:
+            seeds = generate_seeds(context, s, emitter, sampler, sample_field)
+        except Exception as e:
+            self.report({'ERROR'}, f"Seeding error: {e}")
+            return {'CANCELLED'}
+        if seeds.shape[0] == 0:
+            self.report({'WARNING'}, "No seeds inside the field domain")
+            return {'CANCELLED'}
+
+        normalize = bool(s.normalize_field)
+
+        def sample(positions, normalize=normalize):
+            return sample_field(positions, normalize=normalize)
+
+        def inside(positions):
             if not s.stop_at_bounds:
-                return True
-            return sampler.inside_bbox(p, margin=max(0.0, s.bbox_margin))
+                return np.ones(positions.shape[0], dtype=bool)
+            return sampler.inside_bbox_many(positions, margin=max(0.0, s.bbox_margin))
 
-        def field_func_forward(p: Vector):
-            v = sampler.sample(p, k_neighbors=max(1, s.k_neighbors), normalize=bool(s.normalize_field))
-            return v * s.field_scale
+        def field_func_forward(positions):
+            return sample(positions) * s.field_scale
 
-        def field_func_backward(p: Vector):
-            v = sampler.sample(p, k_neighbors=max(1, s.k_neighbors), normalize=bool(s.normalize_field))
-            return (-v) * s.field_scale
+        def field_func_backward(positions):
+            return sample(positions) * -s.field_scale
 
-        seeds = []
-        if emitter_type == 'POINT' or emitter.type == 'EMPTY':
-            seeds = [emitter.matrix_world.translation.copy()]
-        else:
-            mesh = emitter.data
-            mw = emitter.matrix_world
-            if not hasattr(mesh, 'polygons') or len(mesh.polygons) == 0:
-                seeds = [emitter.matrix_world.translation.copy()]
-            else:
-                seeds = [mw @ p.center for p in mesh.polygons]
-
-        created = 0
-        for seed in seeds:
-            dir_mode = s.integration_direction
-            if dir_mode in {'FORWARD', 'BOTH'}:
-                pts_f = integrate_streamline(
-                    seed,
-                    step_size=max(1e-6, s.step_size),
-                    max_steps=max(1, s.max_steps),
-                    min_vel=max(0.0, s.min_velocity),
-                    max_length=max(0.0, s.max_length),
-                    field_func=field_func_forward,
-                    inside_domain=inside,
-                )
-                if len(pts_f) >= 2:
-                    self._create_curve(context, pts_f)
-                    created += 1
-            if dir_mode in {'BACKWARD', 'BOTH'}:
-                pts_b = integrate_streamline(
-                    seed,
-                    step_size=max(1e-6, s.step_size),
-                    max_steps=max(1, s.max_steps),
-                    min_vel=max(0.0, s.min_velocity),
-                    max_length=max(0.0, s.max_length),
-                    field_func=field_func_backward,
-                    inside_domain=inside,
-                )
-                if len(pts_b) >= 2:
-                    if dir_mode == 'BOTH' and 'pts_f' in locals() and len(pts_f) >= 2:
-                        merged = list(reversed(pts_b))[0:-1] + pts_f
-                        self._create_curve(context, merged)
-                    else:
-                        self._create_curve(context, pts_b)
-                    created += 1
-
-        if created == 0:
+        params = dict(
+            step_size=max(1e-6, s.step_size),
+            max_steps=max(1, s.max_steps),
+            min_vel=max(0.0, s.min_velocity),
+            max_length=max(0.0, s.max_length),
+            inside_domain=inside,
+        )
+        integrate = integrate_streamlines
+        if s.integrator == 'RK45':
+            integrate = integrate_streamlines_adaptive
+            params.update(tolerance=s.tolerance, min_step=s.min_step, max_step=s.max_step if s.max_step > 0.0 else None)
+        dir_mode = s.integration_direction
+        forward = integrate(seeds, field_func=field_func_forward, **params) if dir_mode in {'FORWARD', 'BOTH'} else None
+        backward = integrate(seeds, field_func=field_func_backward, **params) if dir_mode in {'BACKWARD', 'BOTH'} else None
+
+        lines = []
+        seed_points = []
+        for i in range(seeds.shape[0]):
+            pts_f = forward[i] if forward is not None else None
+            pts_b = backward[i] if backward is not None else None
+            # Lines run along the flow; the seed index marks time zero
+            if pts_f is not None and pts_b is not None and len(pts_f) >= 2 and len(pts_b) >= 2:
+                # Both halves start at the seed; drop its duplicate when joining
+                lines.append(np.concatenate([pts_b[::-1][:-1], pts_f]))
+                seed_points.append(len(pts_b) - 1)
+            elif pts_f is not None and len(pts_f) >= 2:
+                lines.append(pts_f)
+                seed_points.append(0)
+            elif pts_b is not None and len(pts_b) >= 2:
+                lines.append(pts_b[::-1])
+                seed_points.append(len(pts_b) - 1)
+
+        if not lines:
             self.report({'WARNING'}, "No streamlines created from emitter")
             return {'CANCELLED'}
 
+        points, edges, line_id = pack_polylines(lines)
+        starts = np.concatenate([[0], np.cumsum([len(line) for line in lines])[:-1]])
+        speed = np.linalg.norm(sample(points, normalize=False), axis=1) * s.field_scale
+        integrated_speed = np.full(points.shape[0], s.field_scale) if normalize else speed
+        time = integration_time(points, line_id, integrated_speed, starts + np.array(seed_points))
+        self._create_streamlines(context, s, points, edges, {
+            "line_id": line_id,
+            "speed": speed,
+            "integration_time": time,
+        })
+        self.report({'INFO'}, f"Created {len(lines)} streamlines")
         return {'FINISHED'}
 
-    def _create_curve(self, context, pts):
-        curve_data = bpy.data.curves.new("Streamline", type='CURVE')
-        curve_data.dimensions = '3D'
-        spline = curve_data.splines.new('POLY')
-        spline.points.add(len(pts) - 1)
-        for i, p in enumerate(pts):
-            spline.points[i].co = (p.x, p.y, p.z, 1.0)
-        curve_obj = bpy.data.objects.new("Streamline", curve_data)
-        context.collection.objects.link(curve_obj)
+    def _create_streamlines(self, context, s, points, edges, attributes):
+        mesh = bpy.data.meshes.new("Streamlines")
+        write_streamline_mesh(mesh, points, edges, attributes)
+        obj = bpy.data.objects.new("Streamlines", mesh)
+        context.collection.objects.link(obj)
+        if s.streamline_tubes:
+            try:
+                apply_tube_modifier(obj, s.tube_radius, s.tube_arrows)
+            except Exception as e:
+                self.report({'WARNING'}, f"Tube setup failed: {e}")
+        return obj
 
 
 def register():
@@ -1,14 +1,38 @@
 import bpy
+import numpy as np
 from bpy.types import Object, Mesh
 from bpy.props import StringProperty
 from mathutils import Vector
-from ...operators.utils.volume_mesh_data import get_model
-from ..utils.on_demand_loader import ensure_model_for_object
+from ..utils.on_demand_loader import ensure_model_for_object, is_skin_only, SKIN_ONLY_ERROR
+from ..utils.isosurface import local_plane, extract_plane_section
+from ..utils.filter_cache import cached_filter_result
+from ..utils.mesh_buffers import read_point_attributes, write_surface, live_attribute_names
 from .clip_live import _ensure_clip_plane_for_object
 
 
-def rebuild_slice_surface_for_settings(context, settings) -> Object | None:
-	"""Create a crinkle slice surface using the provided plane and domain mesh."""
+def slice_surface(arrays, local_normal, offset: float, point_fields: dict) -> tuple | None:
+	"""Return the exact section of the model by the plane normal . x + offset = 0 in model space, or None.
+
+	Point fields are interpolated on the crossing edges. Touches no Blender data, so it can run on a worker thread.
+	"""
+	_, crossing_cells = arrays.classify_by_plane(local_normal, offset)
+	if crossing_cells.shape[0] == 0:
+		return None
+	distances = np.asarray(arrays.points, dtype=np.float64) @ local_normal + offset
+	carried = {name: np.asarray(values, dtype=np.float64) for name, values in point_fields.items()}
+	points, poly_offsets, poly_vertices, poly_cells, attributes = extract_plane_section(arrays, distances, local_normal, cells=crossing_cells, attributes=carried)
+	if poly_cells.shape[0] == 0:
+		return None
+	return points, poly_offsets, poly_vertices, poly_cells, attributes, {}
+
+
+def rebuild_slice_surface_for_settings(context, settings, live: bool = False) -> Object | None:
+	"""Create a flat slice surface by cutting the domain mesh cells exactly with the plane.
+
+	Candidate cells come from the model's cell grid index; every cut cell contributes one polygon whose vertices
+	and point attributes are interpolated on the crossing edges. With `live`, only attributes read by the output's
+	materials or modifiers are transferred (see live_attribute_names) and the plane stays visible; Build writes all.
+	"""
 	src_obj = getattr(settings, 'target_object', None)
 	plane = getattr(settings, 'plane_object', None)
 	if not src_obj or getattr(src_obj, 'type', None) != 'MESH':
@@ -25,60 +49,26 @@ def rebuild_slice_surface_for_settings(context, settings) -> Object | None:
 	normal = (mw_p.to_3x3() @ normal).normalized()
 	point_on_plane = mw_p.translation.copy()
 
-	model = get_model(src_obj.name) or ensure_model_for_object(context, src_obj)
-	if not model or not getattr(model, 'cells', None) or not getattr(model, 'faces', None):
+	model = ensure_model_for_object(context, src_obj)
+	if model is None:
 		return None
-
-	def signed_distance_world(loc: Vector) -> float:
-		return (loc - point_on_plane).dot(normal)
-
-	cell_center_ws = {}
-	for cell in model.cells:
-		coords = []
-		for face in getattr(cell, 'faces', []) or []:
-			for v in getattr(face, 'vertices', []) or []:
-				coords.append(v.co)
-		if not coords:
-			continue
-		cent_local = Vector((0.0, 0.0, 0.0))
-		for c in coords:
-			cent_local += Vector(c)
-		cent_local /= max(1, len(coords))
-		cent_world = src_obj.matrix_world @ cent_local
-		cell_center_ws[cell] = cent_world
-
-	faces_to_create = []
-	owner_cells = []
-	for face in getattr(model, 'faces', []):
-		owner = getattr(face, 'owner', None)
-		neighbour = getattr(face, 'neighbour', None)
-		if not owner or not neighbour:
-			continue
-		p_owner = cell_center_ws.get(owner)
-		p_neigh = cell_center_ws.get(neighbour)
-		if p_owner is None or p_neigh is None:
-			continue
-		d0 = signed_distance_world(p_owner)
-		d1 = signed_distance_world(p_neigh)
-		if d0 == 0.0 or d1 == 0.0 or (d0 < 0.0 and d1 > 0.0) or (d0 > 0.0 and d1 < 0.0):
-			verts_for_owner = getattr(face, 'get_vertices_for_cell', lambda c: None)(owner)
-			if not verts_for_owner:
-				continue
-			indices = [getattr(v, 'blender_v_index', -1) for v in verts_for_owner]
-			if any(i < 0 for i in indices):
-				continue
-			faces_to_create.append(indices)
-			owner_cells.append(owner)
-
-	blender_vertices = [getattr(v, 'co', (0.0, 0.0, 0.0)) for v in getattr(model, 'vertices', [])]
-	if not blender_vertices or not faces_to_create:
+	arrays = model.arrays
+	if arrays.num_cells == 0:
 		return None
 
+	local_normal, offset = local_plane(src_obj.matrix_world, point_on_plane, normal)
 	out_name = f"{src_obj.name}_SliceLive"
+	obj = bpy.data.objects.get(out_name)
+	names = live_attribute_names(obj) if live else None
+	src_mesh: Mesh = src_obj.data
+	point_fields = read_point_attributes(src_mesh, arrays.num_points, names)
+	surface = cached_filter_result(context.scene, arrays, 'SLICE', (local_normal, offset), point_fields, lambda: slice_surface(arrays, local_normal, offset, point_fields))
+	if surface is None:
+		return None
+
 	mesh = bpy.data.meshes.get(out_name)
 	if mesh is None:
 		mesh = bpy.data.meshes.new(out_name)
-	obj = bpy.data.objects.get(out_name)
 	if obj is None:
 		obj = bpy.data.objects.new(out_name, mesh)
 		colls = src_obj.users_collection
@@ -87,56 +77,14 @@ def rebuild_slice_surface_for_settings(context, settings) -> Object | None:
 		else:
 			context.collection.objects.link(obj)
 
-	mesh.clear_geometry()
-	mesh.from_pydata(blender_vertices, [], faces_to_create)
-	mesh.update()
+	write_surface(mesh, surface, arrays.cell_attributes, names)
 
-	src_mesh: Mesh = src_obj.data
-	try:
-		for src_attr in src_mesh.attributes:
-			if getattr(src_attr, 'domain', '') != 'POINT' or getattr(src_attr, 'data_type', '') != 'FLOAT':
-				continue
-			if src_attr.data and len(src_attr.data) == len(blender_vertices):
-				try:
-					if src_attr.name in mesh.attributes:
-						mesh.attributes.remove(mesh.attributes[src_attr.name])
-				except Exception:
-					pass
-				dst = mesh.attributes.new(name=src_attr.name, type='FLOAT', domain='POINT')
-				buf = [0.0] * len(blender_vertices)
-				src_attr.data.foreach_get('value', buf)
-				dst.data.foreach_set('value', buf)
-	except Exception:
-		pass
-
-	if owner_cells:
-		all_attr = set()
-		for c in owner_cells:
-			for k in getattr(c, 'attributes', {}).keys():
-				all_attr.add(k)
-		for name in sorted(all_attr):
-			values = [0.0] * len(faces_to_create)
-			for i, c in enumerate(owner_cells):
-				val = getattr(c, 'attributes', {}).get(name)
-				if val is None:
-					continue
-				try:
-					values[i] = float(val[0]) if isinstance(val, (list, tuple)) else float(val)
-				except Exception:
-					values[i] = 0.0
-			try:
-				if f"cell_{name}" in mesh.attributes:
-					mesh.attributes.remove(mesh.attributes[f"cell_{name}"])
-			except Exception:
-				pass
-			attr = mesh.attributes.new(name=f"cell_{name}", type='FLOAT', domain='FACE')
-			attr.data.foreach_set('value', values)
-
-	try:
-		plane.hide_set(True)
-		plane.hide_render = True
-	except Exception:
-		pass
+	if not live:
+		try:
+			plane.hide_set(True)
+			plane.hide_render = True
+		except Exception:
+			pass
 
 	obj.display_type = 'TEXTURED'
 	obj.hide_set(False)
@@ -170,7 +118,7 @@ class FILTERS_OT_slice_ensure_plane(bpy.types.Operator):
 
 
 class FILTERS_OT_build_slice_surface(bpy.types.Operator):
-	"""Build or update a slice surface using crinkle semantics; hides the plane after update."""
+	"""Build or update an exact planar slice surface; hides the plane after update."""
 	bl_idname = "filters.build_slice_surface"
 	bl_label = "Build Slice Surface"
 	bl_options = {'REGISTER', 'UNDO'}
@@ -186,6 +134,9 @@ class FILTERS_OT_build_slice_surface(bpy.types.Operator):
 		if not settings:
 			self.report({'ERROR'}, "Slice settings not available")
 			return {'CANCELLED'}
+		if is_skin_only(getattr(settings, 'target_object', None)):
+			self.report({'ERROR'}, SKIN_ONLY_ERROR)
+			return {'CANCELLED'}
 		obj = rebuild_slice_surface_for_settings(context, settings)
 		if obj is None:
 			self.report({'WARNING'}, "No geometry created (position/orientation plane)")
@@ -198,4 +149,5 @@ __all__ = [
 	"FILTERS_OT_slice_ensure_plane",
 	"FILTERS_OT_build_slice_surface",
 	"rebuild_slice_surface_for_settings",
+	"slice_surface",
 ] 
\ No newline at end of file
@@ -1,23 +1,134 @@
 import bpy
+import numpy as np
 from bpy.types import Object, Mesh
 from bpy.props import StringProperty
-from ...operators.utils.volume_mesh_data import get_model
-from ..utils.on_demand_loader import ensure_model_for_object
-
-
-def _aggregate(values, mode: str) -> float:
-	if not values:
-		return 0.0
-	if mode == 'MIN':
-		return min(values)
-	if mode == 'MAX':
-		return max(values)
-	# default MEAN
-	return sum(values) / float(len(values))
-
+from ..utils.on_demand_loader import ensure_model_for_object, is_skin_only, SKIN_ONLY_ERROR
+from ..utils.data_conversion import cell_scalar_for_attribute
+from ..utils.filter_cache import cached_filter_result, cell_key_fields, array_fingerprint
+from ..utils.mesh_buffers import read_point_attributes, weld_points, boundary_surface, write_surface
+from ...operators.utils.volume_mesh_data import csr_gather
+
+
+_WELD_TOLERANCE = 0.0001
+
+# Per source object: sorted cell values and the current selection, reused while the range is scrubbed
+_SCRUB_STATES = {}
+
+
+class ThresholdScrubState:
+	"""Incremental threshold state for one source: cells sorted by value, the passing set and per-face exposure.
+
+	A range change is resolved with searchsorted on the sorted values; only cells whose membership changed, and
+	the faces they own, are re-evaluated.
+	"""
+
+	def __init__(self, arrays, cell_values: np.ndarray, key: tuple):
+		self.arrays = arrays
+		self.key = key
+		valid = ~np.isnan(cell_values)
+		self.order = np.argsort(np.where(valid, cell_values, np.inf), kind='stable')
+		self.num_valid = int(valid.sum())
+		self.sorted_values = cell_values[self.order[:self.num_valid]]
+		self.rank = np.empty(arrays.num_cells, dtype=np.int64)
+		self.rank[self.order] = np.arange(arrays.num_cells, dtype=np.int64)
+		self.lo = 0
+		self.hi = 0
+		self.passing = np.zeros(arrays.num_cells, dtype=bool)
+		# 0: hidden, 1: exposed on the owner side, 2: exposed on the neighbour side (flipped)
+		self.face_state = np.zeros(arrays.num_faces, dtype=np.int8)
+		self.weld_map = weld_points(np.asarray(arrays.points), _WELD_TOLERANCE)
+		self.point_buffers = None
+
+	def set_range(self, min_v: float, max_v: float) -> bool:
+		"""Move the selection to [min_v, max_v]; returns True when any cell changed membership."""
+		lo = int(np.searchsorted(self.sorted_values, min_v, side='left'))
+		hi = max(lo, int(np.searchsorted(self.sorted_values, max_v, side='right')))
+		if lo == self.lo and hi == self.hi:
+			return False
+		changed = np.concatenate((
+			self.order[min(lo, self.lo):max(lo, self.lo)],
+			self.order[min(hi, self.hi):max(hi, self.hi)],
+		))
+		self.lo, self.hi = lo, hi
+		if changed.shape[0] == 0:
+			return False
+		ranks = self.rank[changed]
+		self.passing[changed] = (ranks >= lo) & (ranks < hi)
+		_, faces = csr_gather(self.arrays.cell_face_offsets, self.arrays.cell_faces, changed)
+		self._update_faces(np.unique(faces))
+		return True
 
-def rebuild_threshold_surface_for_settings(context, settings) -> Object | None:
-	"""Rebuild or create the live threshold surface object based on the provided settings."""
+	def _update_faces(self, faces: np.ndarray) -> None:
+		owner = np.asarray(self.arrays.face_owner)[faces]
+		neighbour = np.asarray(self.arrays.face_neighbour)[faces]
+		owner_in = np.zeros(faces.shape[0], dtype=bool)
+		has_owner = owner >= 0
+		owner_in[has_owner] = self.passing[owner[has_owner]]
+		neighbour_in = np.zeros(faces.shape[0], dtype=bool)
+		has_neighbour = neighbour >= 0
+		neighbour_in[has_neighbour] = self.passing[neighbour[has_neighbour]]
+		state = np.zeros(faces.shape[0], dtype=np.int8)
+		state[owner_in & ~neighbour_in] = 1
+		state[neighbour_in & ~owner_in] = 2
+		self.face_state[faces] = state
+
+	def exposed(self) -> tuple:
+		"""Return (face ids, cell per face, flip flags) of the current boundary."""
+		faces = np.flatnonzero(self.face_state)
+		flip = self.face_state[faces] == 2
+		cells = np.where(flip, np.asarray(self.arrays.face_neighbour)[faces], np.asarray(self.arrays.face_owner)[faces])
+		return faces, cells, flip
+
+	def source_point_buffers(self, src_mesh: Mesh) -> dict:
+		"""Read the source FLOAT point attributes once and keep them for later updates."""
+		if self.point_buffers is None:
+			self.point_buffers = read_point_attributes(src_mesh, self.arrays.num_points)
+		return self.point_buffers
+
+
+def threshold_surface(arrays, cell_values: np.ndarray, min_v: float, max_v: float, point_fields: dict) -> tuple | None:
+	"""Return the welded closed surface of the cells whose value lies in [min_v, max_v], recomputed from scratch.
+
+	This is the non-incremental form used for batches of frames; it touches no Blender data.
+	"""
+	with np.errstate(invalid='ignore'):
+		passing = (cell_values >= min_v) & (cell_values <= max_v)
+	face_ids, face_cells, flip = arrays.exposed_faces(passing)
+	return boundary_surface(arrays, face_ids, face_cells, flip, point_fields, weld_tolerance=_WELD_TOLERANCE)
+
+
+def clear_threshold_state(name: str = '') -> None:
+	"""Drop the scrub state of one source object, or of all of them."""
+	if name:
+		_SCRUB_STATES.pop(name, None)
+	else:
+		_SCRUB_STATES.clear()
+
+
+def _scrub_state_for(src_obj: Object, arrays, attr_name: str, domain: str, agg: str, reset: bool) -> tuple:
+	"""Return (state, created); created is True when the state was rebuilt for new data or settings."""
+	# Convert Data can overwrite a cell column in place, so its contents are part of the key
+	cell_fields = cell_key_fields(arrays, attr_name, domain)
+	key = (id(arrays), attr_name, domain, agg if domain == 'POINT' else '', tuple(array_fingerprint(v) for v in cell_fields.values()))
+	state = _SCRUB_STATES.get(src_obj.name)
+	if state is not None and state.key == key and not reset:
+		return state, False
+	cell_values = cell_scalar_for_attribute(src_obj, arrays, attr_name, domain, agg)
+	if cell_values is None:
+		_SCRUB_STATES.pop(src_obj.name, None)
+		return None, False
+	state = ThresholdScrubState(arrays, cell_values, key)
+	_SCRUB_STATES[src_obj.name] = state
+	return state, True
+
+
+def rebuild_threshold_surface_for_settings(context, settings, reset: bool = False) -> Object | None:
+	"""Rebuild or create the live threshold surface object based on the provided settings.
+
+	Cell values are sorted once per source and attribute; each call only re-evaluates the cells whose membership
+	changed since the previous range. The `{source}_Threshold` mesh is reused and its buffers rewritten in bulk.
+	Pass `reset=True` to re-read the source data.
+	"""
 	src_obj = getattr(settings, 'target_object', None)
 	if not src_obj or getattr(src_obj, 'type', None) != 'MESH':
 		return None
@@ -28,123 +139,47 @@ def rebuild_threshold_surface_for_settings(context, settings) -> Object | None:
 	max_v = float(getattr(settings, 'max_value', 1.0))
 	domain = getattr(settings, 'domain', 'CELL')
 	agg = getattr(settings, 'aggregator', 'MEAN')
-	model = get_model(src_obj.name) or ensure_model_for_object(context, src_obj)
-	if not model or not getattr(model, 'cells', None):
+	model = ensure_model_for_object(context, src_obj)
+	if model is None:
 		return None
-
-	passing_cells = set()
-	if domain == 'CELL':
-		for cell in model.cells:
-			val_tuple = getattr(cell, 'attributes', {}).get(attr_name)
-			if val_tuple is None:
-				continue
-			try:
-				value = float(val_tuple[0]) if isinstance(val_tuple, (list, tuple)) else float(val_tuple)
-			except Exception:
-				continue
-			if min_v <= value <= max_v:
-				passing_cells.add(cell)
-	else:
-		# POINT domain: reduce by cell's incident point values using the mesh attribute
-		mesh_attr = None
-		try:
-			mesh_attr = src_obj.data.attributes.get(attr_name)
-		except Exception:
-			mesh_attr = None
-		if not mesh_attr or getattr(mesh_attr, 'domain', '') != 'POINT' or getattr(mesh_attr, 'data_type', '') != 'FLOAT':
-			return None
-		point_values = []
-		try:
-			point_values = [0.0] * len(src_obj.data.vertices)
-			mesh_attr.data.foreach_get('value', point_values)
-		except Exception:
-			point_values = []
-		if not point_values:
-			return None
-		for cell in model.cells:
-			cell_point_vals = []
-			for face in getattr(cell, 'faces', []) or []:
-				for v in getattr(face, 'vertices', []) or []:
-					idx = getattr(v, 'blender_v_index', -1)
-					if 0 <= idx < len(point_values):
-						cell_point_vals.append(float(point_values[idx]))
-			if not cell_point_vals:
-				continue
-			value = _aggregate(cell_point_vals, agg)
-			if min_v <= value <= max_v:
-				passing_cells.add(cell)
-
-	if not passing_cells:
+	arrays = model.arrays
+	if arrays.num_cells == 0:
 		return None
 
-	blender_faces_to_create = []
-	face_owner_cells = []
-	for cell in passing_cells:
-		for face in getattr(cell, 'faces', []) or []:
-			other = face.neighbour if face.owner == cell else face.owner
-			if getattr(face, 'is_boundary', lambda: False)() or other not in passing_cells:
-				face_verts = face.get_vertices_for_cell(cell)
-				if not face_verts:
-					continue
-				face_indices = [v.blender_v_index for v in face_verts]
-				blender_faces_to_create.append(face_indices)
-				face_owner_cells.append(cell)
-
-	blender_vertices = [v.co for v in model.vertices]
+	state, created = _scrub_state_for(src_obj, arrays, attr_name, domain, agg, reset)
+	if state is None:
+		return None
 	new_mesh_name = f"{src_obj.name}_Threshold"
-	new_mesh = bpy.data.meshes.new(new_mesh_name)
-	new_obj = bpy.data.objects.new(new_mesh_name, new_mesh)
-	new_mesh.from_pydata(blender_vertices, [], blender_faces_to_create)
-	new_mesh.update()
-
-	src_mesh = src_obj.data
-	try:
-		for src_attr in src_mesh.attributes:
-			if getattr(src_attr, 'domain', '') != 'POINT':
-				continue
-			if getattr(src_attr, 'data_type', '') != 'FLOAT':
-				continue
-			if src_attr.data and len(src_attr.data) == len(blender_vertices):
-				dst = new_mesh.attributes.new(name=src_attr.name, type='FLOAT', domain='POINT')
-				buf = [0.0] * len(blender_vertices)
-				src_attr.data.foreach_get('value', buf)
-				dst.data.foreach_set('value', buf)
-	except Exception:
-		pass
-
-	if face_owner_cells:
-		all_attr_names = set()
-		for cell in face_owner_cells:
-			for k in cell.attributes.keys():
-				all_attr_names.add(k)
-		for attr_name in sorted(all_attr_names):
-			values = [0.0] * len(blender_faces_to_create)
-			for face_idx, cell in enumerate(face_owner_cells):
-				val = cell.attributes.get(attr_name)
-				if val is None:
-					continue
-				try:
-					if isinstance(val, (list, tuple)):
-						values[face_idx] = float(val[0]) if len(val) > 0 else 0.0
-					else:
-						values[face_idx] = float(val)
-				except Exception:
-					values[face_idx] = 0.0
-			attr = new_mesh.attributes.new(name=f"cell_{attr_name}", type='FLOAT', domain='FACE')
-			attr.data.foreach_set('value', values)
-
-	context.collection.objects.link(new_obj)
-	context.view_layer.objects.active = new_obj
-	new_obj.select_set(True)
-	try:
-		bpy.ops.object.mode_set(mode='EDIT')
-		bpy.ops.mesh.remove_doubles(threshold=0.0001)
-		bpy.ops.mesh.delete_loose()
-	finally:
-		bpy.ops.object.mode_set(mode='OBJECT')
-
-	src_obj.hide_set(True)
-	src_obj.hide_render = True
+	existing = bpy.data.objects.get(new_mesh_name)
+	# A new state starts from an empty selection, so an empty range reports no change although the
+	# existing output still shows the previous attribute's cells
+	changed = state.set_range(min_v, max_v) or created
+	if not changed and existing is not None and not reset:
+		return existing
+
+	src_mesh: Mesh = src_obj.data
+	point_fields = state.source_point_buffers(src_mesh)
+	params = (attr_name, domain, agg if domain == 'POINT' else '', min_v, max_v)
+	surface = cached_filter_result(context.scene, arrays, 'THRESHOLD', params, point_fields, lambda: boundary_surface(arrays, *state.exposed(), point_fields, weld_map=state.weld_map), cell_key_fields(arrays, attr_name, domain))
+	if surface is None:
+		if existing is not None and getattr(existing, 'type', None) == 'MESH':
+			existing.data.clear_geometry()
+		return None
+
+	new_mesh = bpy.data.meshes.get(new_mesh_name) or bpy.data.meshes.new(new_mesh_name)
+	write_surface(new_mesh, surface, arrays.cell_attributes)
+
+	new_obj = existing
+	if new_obj is None:
+		new_obj = bpy.data.objects.new(new_mesh_name, new_mesh)
+		collection = getattr(context, 'collection', None) or context.scene.collection
+		collection.objects.link(new_obj)
+		context.view_layer.objects.active = new_obj
+		new_obj.select_set(True)
+		src_obj.hide_set(True)
+		src_obj.hide_render = True
+	elif new_obj.data is not new_mesh:
+		new_obj.data = new_mesh
 
 	return new_obj
 
@@ -166,7 +201,10 @@ class FILTERS_OT_build_threshold_surface(bpy.types.Operator):
 		if not settings:
 			self.report({'ERROR'}, "Threshold settings not available")
 			return {'CANCELLED'}
-		obj = rebuild_threshold_surface_for_settings(context, settings)
+		if is_skin_only(getattr(settings, 'target_object', None)):
+			self.report({'ERROR'}, SKIN_ONLY_ERROR)
+			return {'CANCELLED'}
+		obj = rebuild_threshold_surface_for_settings(context, settings, reset=True)
 		if obj is None:
 			self.report({'WARNING'}, "No geometry created (check attribute and range)")
 			return {'CANCELLED'}
@@ -174,4 +212,4 @@ class FILTERS_OT_build_threshold_surface(bpy.types.Operator):
 		return {'FINISHED'}
 
 
-__all__ = ["FILTERS_OT_build_threshold_surface", "rebuild_threshold_surface_for_settings"] 
\ No newline at end of file
+__all__ = ["FILTERS_OT_build_threshold_surface", "rebuild_threshold_surface_for_settings", "clear_threshold_state", "threshold_surface"] 
\ No newline at end of file
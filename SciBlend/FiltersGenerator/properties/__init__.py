@@ -7,6 +7,8 @@ from .clip_settings import FiltersClipSettings
 from .slice_settings import FiltersSliceSettings
 from .calculator_settings import FiltersCalculatorSettings
 from .interpolation_settings import FiltersInterpolationSettings
+from .conversion_settings import FiltersConversionSettings
+from .sequence_settings import FiltersSequenceSettings
 
 
 def register():
@@ -1,5 +1,5 @@
 import bpy
-from bpy.props import PointerProperty, EnumProperty
+from bpy.props import PointerProperty, EnumProperty, BoolProperty
 
 
 class FiltersClipSettings(bpy.types.PropertyGroup):
@@ -7,6 +7,7 @@ class FiltersClipSettings(bpy.types.PropertyGroup):
 	
 	target_object: PointerProperty(type=bpy.types.Object, name="Domain Mesh")
 	plane_object: PointerProperty(type=bpy.types.Object, name="Clip Plane")
+	live_update: BoolProperty(name="Live Update", description="Rebuild while the plane is moved, transferring only the attributes used by the output material", default=False)
 	side: EnumProperty(
 		name="Side",
 		description="Side of the plane to keep visible",
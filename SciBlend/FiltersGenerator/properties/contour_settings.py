@@ -1,16 +1,9 @@
 import bpy
-from bpy.props import PointerProperty, FloatProperty, BoolProperty, EnumProperty
+from bpy.props import PointerProperty, FloatProperty, BoolProperty, EnumProperty, IntProperty, StringProperty
 from ...operators.utils.volume_mesh_data import get_model
 from ..utils.on_demand_loader import ensure_model_for_object
 
 
-_DEF_AGG = (
-	('MEAN', "Mean", "Average of point values in the cell"),
-	('MIN', "Min", "Minimum of point values in the cell"),
-	('MAX', "Max", "Maximum of point values in the cell"),
-)
-
-
 def _point_attribute_items(self, context):
 	items = []
 	obj = getattr(self, 'target_object', None)
@@ -35,11 +28,10 @@ def _cell_attribute_items(self, context):
 	if domain == 'POINT':
 		return _point_attribute_items(self, context)
 	model = get_model(obj.name) or ensure_model_for_object(context, obj)
-	if not model or not getattr(model, 'cells', None):
+	if not model:
 		return [("NONE", "(no volume data)", "")] 
 	try:
-		first = model.cells[0]
-		attrs = list(getattr(first, 'attributes', {}).keys())
+		attrs = model.cell_attribute_names()
 	except Exception:
 		attrs = []
 	if not attrs:
@@ -49,13 +41,33 @@ def _cell_attribute_items(self, context):
 
 
 class FiltersContourSettings(bpy.types.PropertyGroup):
-	"""Settings for building an isosurface contour from a volumetric mesh using crinkle clip semantics."""
+	"""Settings for building isosurface contours from a volumetric mesh using marching tetrahedra; one or many iso values."""
 	
 	domain: EnumProperty(name="Domain", items=(('CELL', "Cell", "Use cell data"), ('POINT', "Point", "Use point/vertex data")), default='CELL')
-	aggregator: EnumProperty(name="Aggregator", description="How to reduce point values to a cell scalar", items=_DEF_AGG, default='MEAN')
 	target_object: PointerProperty(type=bpy.types.Object, name="Domain Mesh")
 	attribute: EnumProperty(name="Attribute", items=_cell_attribute_items)
 	iso_value: FloatProperty(name="Iso Value", default=0.0)
+	iso_mode: EnumProperty(
+		name="Levels",
+		items=(
+			('SINGLE', "Single", "Contour one iso value"),
+			('RANGE', "Range", "Contour evenly spaced iso values between a minimum and a maximum"),
+			('LIST', "List", "Contour a comma-separated list of iso values"),
+		),
+		default='SINGLE',
+	)
+	iso_min: FloatProperty(name="Min Level", default=0.0)
+	iso_max: FloatProperty(name="Max Level", default=1.0)
+	iso_count: IntProperty(name="Count", default=10, min=1, max=256)
+	iso_list: StringProperty(name="Iso Values", default="", description="Comma-separated iso values")
+	level_output: EnumProperty(
+		name="Output",
+		items=(
+			('COMBINED', "Single Object", "One mesh with a per-face iso_level attribute"),
+			('PER_LEVEL', "Object per Level", "One object per iso value"),
+		),
+		default='COMBINED',
+	)
 
 
 def register():
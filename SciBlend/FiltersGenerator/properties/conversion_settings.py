@@ -0,0 +1,49 @@
+import bpy
+from bpy.props import PointerProperty, StringProperty, EnumProperty
+from ...operators.utils.volume_mesh_data import get_model
+from ..utils.data_conversion import REDUCTION_ITEMS
+
+
+def _source_attribute_items(self, context):
+	"""Enumerate point attributes of the mesh or cell attributes of its volume model, by conversion direction."""
+	obj = getattr(self, 'target_object', None)
+	if not obj or getattr(obj, 'type', None) != 'MESH':
+		return [("NONE", "(select a volumetric mesh)", "")]
+	items = []
+	if getattr(self, 'direction', 'POINT_TO_CELL') == 'POINT_TO_CELL':
+		for a in getattr(obj.data, 'attributes', []):
+			if getattr(a, 'data_type', '') == 'FLOAT' and getattr(a, 'domain', '') in {'POINT', 'VERTEX'} and not a.name.startswith('.'):
+				items.append((a.name, a.name, "Point attribute"))
+		return items or [("NONE", "(no point attributes)", "")]
+	model = get_model(obj.name)
+	if model is None:
+		return [("NONE", "(load the volume model first)", "")]
+	# Runs on every redraw, so it must not build the array view of a large model
+	for name in model.cell_attribute_names():
+		items.append((name, name, f"Cell attribute '{name}'"))
+	return items or [("NONE", "(no cell attributes)", "")]
+
+
+class FiltersConversionSettings(bpy.types.PropertyGroup):
+	"""Settings for converting attributes between the point and cell domains of a volumetric mesh."""
+
+	target_object: PointerProperty(type=bpy.types.Object, name="Domain Mesh")
+	direction: EnumProperty(
+		name="Direction",
+		items=(
+			('POINT_TO_CELL', "Point to Cell", "Reduce point values over each cell's points"),
+			('CELL_TO_POINT', "Cell to Point", "Reduce cell values over the cells around each point"),
+		),
+		default='POINT_TO_CELL',
+	)
+	attribute: EnumProperty(name="Attribute", items=_source_attribute_items)
+	mode: EnumProperty(name="Reduction", items=REDUCTION_ITEMS, default='MEAN')
+	output_name: StringProperty(name="Output Name", default="", description="Name of the new attribute; empty uses '<attribute>_cell' or '<attribute>_point'")
+
+
+def register():
+	bpy.utils.register_class(FiltersConversionSettings)
+
+
+def unregister():
+	bpy.utils.unregister_class(FiltersConversionSettings)
@@ -56,6 +56,20 @@ def _vector_attr_items(self, context):
     return items
 
 
+def _scalar_attr_items(self, context):
+    items = []
+    obj = getattr(self, "target_object", None)
+    if obj and getattr(obj, "type", None) == 'MESH':
+        attrs = getattr(obj.data, "attributes", None)
+        if attrs:
+            for a in attrs:
+                if getattr(a, "data_type", "") == 'FLOAT' and getattr(a, "domain", "") in {'POINT', 'VERTEX'} and not a.name.startswith('.'):
+                    items.append((a.name, a.name, "Scalar point attribute"))
+    if not items:
+        items = [("", "(no scalar attributes)", "")]
+    return items
+
+
 class FiltersEmitterSettings(bpy.types.PropertyGroup):
     target_object: bpy.props.PointerProperty(type=bpy.types.Object)
     vector_attribute: bpy.props.EnumProperty(name="Vector Field", items=_vector_attr_items)
@@ -70,6 +84,54 @@ class FiltersEmitterSettings(bpy.types.PropertyGroup):
         default='POINT',
     )
 
+    # seeding
+    seed_strategy: bpy.props.EnumProperty(
+        name="Seeding",
+        description="Where streamlines and pathline particles start",
+        items=(
+            ('EMITTER', "Emitter", "The emitter location, or every face center of a mesh emitter"),
+            ('GRID', "Uniform Grid", "A regular lattice filling the seeding box"),
+            ('RANDOM', "Random", "Uniformly random points in the seeding box"),
+            ('POISSON', "Poisson Disk", "Random points in the seeding box that keep a minimum spacing"),
+            ('SURFACE', "Emitter Surface", "Random points on the faces of a mesh emitter"),
+            ('ISOSURFACE', "Iso-Surface", "Random points on an iso-surface of a scalar attribute of the domain"),
+        ),
+        default='EMITTER',
+    )
+    seed_count: bpy.props.IntProperty(
+        name="Seed Count",
+        description="Number of seeds to generate",
+        default=1000,
+        min=1,
+        soft_max=100000,
+    )
+    seed_region: bpy.props.EnumProperty(
+        name="Region",
+        description="Box filled by grid, random and Poisson-disk seeding",
+        items=(
+            ('DOMAIN', "Domain Bounds", "Bounding box of the domain mesh"),
+            ('EMITTER', "Emitter Bounds", "Bounding box of the selected emitter"),
+        ),
+        default='DOMAIN',
+    )
+    seed_weight_by_magnitude: bpy.props.BoolProperty(
+        name="Weight by Magnitude",
+        description="Place more surface seeds where the field is stronger",
+        default=False,
+    )
+    seed_iso_attribute: bpy.props.EnumProperty(name="Iso Attribute", items=_scalar_attr_items)
+    seed_iso_value: bpy.props.FloatProperty(
+        name="Iso Value",
+        description="Value of the iso-surface to seed on",
+        default=0.0,
+    )
+    seed_random_seed: bpy.props.IntProperty(
+        name="Random Seed",
+        description="Seed of the random generator, for reproducible seeding",
+        default=0,
+        min=0,
+    )
+
     integration_direction: bpy.props.EnumProperty(
         name="Direction",
         description="Integration direction for streamlines",
@@ -82,13 +144,45 @@ class FiltersEmitterSettings(bpy.types.PropertyGroup):
     )
 
     # sampling & integrator settings
+    integrator: bpy.props.EnumProperty(
+        name="Integrator",
+        description="Numerical integration scheme for streamlines",
+        items=(
+            ('RK4', "RK4 (Fixed Step)", "Classic Runge-Kutta with a constant step size"),
+            ('RK45', "RK45 (Adaptive)", "Dormand-Prince with per-streamline step size control"),
+        ),
+        default='RK4',
+    )
     step_size: bpy.props.FloatProperty(
         name="Step Size",
-        description="Integration step size",
+        description="Integration step size (initial step for the adaptive integrator)",
         default=0.1,
         min=1e-06,
         soft_max=10.0,
     )
+    tolerance: bpy.props.FloatProperty(
+        name="Tolerance",
+        description="Largest local error per adaptive step, in world units",
+        default=1e-4,
+        min=1e-12,
+        soft_max=0.1,
+        precision=6,
+    )
+    min_step: bpy.props.FloatProperty(
+        name="Min Step",
+        description="Smallest adaptive step; steps at this size are accepted regardless of error",
+        default=1e-4,
+        min=1e-09,
+        soft_max=1.0,
+        precision=6,
+    )
+    max_step: bpy.props.FloatProperty(
+        name="Max Step",
+        description="Largest adaptive step; 0 uses four times the step size",
+        default=0.0,
+        min=0.0,
+        soft_max=100.0,
+    )
     max_steps: bpy.props.IntProperty(
         name="Max Steps",
         description="Maximum number of integration steps",
@@ -96,6 +190,23 @@ class FiltersEmitterSettings(bpy.types.PropertyGroup):
         min=1,
         soft_max=200000,
     )
+    sampling_method: bpy.props.EnumProperty(
+        name="Sampling",
+        description="How the vector field is evaluated between mesh points",
+        items=(
+            ('IDW', "Nearest Points", "Inverse-distance weighting of the k nearest mesh points"),
+            ('CELL', "Containing Cell", "Barycentric interpolation inside the containing volume cell (needs the loaded volume model)"),
+            ('GRID', "Resampled Grid", "Resample the nearest-points field onto a cached regular grid once, then interpolate trilinearly"),
+        ),
+        default='IDW',
+    )
+    grid_resolution: bpy.props.IntProperty(
+        name="Grid Resolution",
+        description="Grid nodes along the longest side of the domain when resampling the field",
+        default=64,
+        min=2,
+        soft_max=512,
+    )
     k_neighbors: bpy.props.IntProperty(
         name="k-Neighbors",
         description="Number of neighbors for IDW sampling",
@@ -143,6 +254,41 @@ class FiltersEmitterSettings(bpy.types.PropertyGroup):
         soft_max=1.0,
     )
 
+    # pathlines
+    frame_time: bpy.props.FloatProperty(
+        name="Time per Frame",
+        description="Time between consecutive Frame_{n} meshes, in the time unit of the vector field",
+        default=1.0,
+        min=0.0,
+        soft_max=100.0,
+    )
+    pathline_substeps: bpy.props.IntProperty(
+        name="Substeps",
+        description="RK4 steps per frame interval when advecting pathline particles",
+        default=4,
+        min=1,
+        soft_max=64,
+    )
+
+    # output
+    streamline_tubes: bpy.props.BoolProperty(
+        name="Tubes",
+        description="Render streamlines as tubes with the shared geometry-nodes group",
+        default=True,
+    )
+    tube_radius: bpy.props.FloatProperty(
+        name="Tube Radius",
+        description="Radius of the streamline tubes",
+        default=0.02,
+        min=0.0,
+        soft_max=1.0,
+    )
+    tube_arrows: bpy.props.BoolProperty(
+        name="Arrows",
+        description="Add arrow heads along the streamlines in flow direction",
+        default=False,
+    )
+
 
 def register():
     bpy.utils.register_class(FiltersEmitterSettings)
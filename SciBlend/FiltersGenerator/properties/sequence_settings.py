@@ -0,0 +1,41 @@
+import bpy
+from bpy.props import EnumProperty, IntProperty, BoolProperty, FloatProperty
+
+
+def _collection_items(self, context):
+	items = [("", "None", "No collection selected")]
+	try:
+		for c in bpy.data.collections:
+			items.append((c.name, c.name, c.name))
+	except Exception:
+		pass
+	return items
+
+
+class FiltersSequenceSettings(bpy.types.PropertyGroup):
+	"""Settings for applying one of the geometry filters to every mesh of a time-series collection."""
+
+	target_collection: EnumProperty(name="Collection", description="Collection holding the Frame_{n} meshes to filter", items=_collection_items)
+	filter_type: EnumProperty(
+		name="Filter",
+		description="Geometry filter to apply, using its current settings",
+		items=(
+			('CLIP', "Clip", "Clip every frame with the clip plane"),
+			('SLICE', "Slice", "Slice every frame with the slice plane"),
+			('THRESHOLD', "Threshold", "Threshold every frame with the threshold range"),
+			('CONTOUR', "Contour", "Contour every frame at the contour levels"),
+		),
+		default='CLIP',
+	)
+	max_workers: IntProperty(name="Workers", description="Frames filtered concurrently on worker threads", default=2, min=1, max=16)
+	keyframe_visibility: BoolProperty(name="Keyframe Visibility", description="Show each result only on the frames its source mesh is shown", default=True)
+	is_running: BoolProperty(name="Running", default=False)
+	progress: FloatProperty(name="Progress", default=0.0, min=0.0, max=1.0, subtype='FACTOR')
+
+
+def register():
+	bpy.utils.register_class(FiltersSequenceSettings)
+
+
+def unregister():
+	bpy.utils.unregister_class(FiltersSequenceSettings)
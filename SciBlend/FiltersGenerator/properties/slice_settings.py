@@ -1,12 +1,13 @@
 import bpy
-from bpy.props import PointerProperty
+from bpy.props import PointerProperty, BoolProperty
 
 
 class FiltersSliceSettings(bpy.types.PropertyGroup):
-	"""Settings for slicing a volumetric mesh by a plane, generating a crinkle surface only."""
+	"""Settings for slicing a volumetric mesh by a plane into a flat cut surface."""
 	
 	target_object: PointerProperty(type=bpy.types.Object, name="Domain Mesh")
 	plane_object: PointerProperty(type=bpy.types.Object, name="Slice Plane")
+	live_update: BoolProperty(name="Live Update", description="Rebuild while the plane is moved, transferring only the attributes used by the output material", default=False)
 
 
 def register():
@@ -8,6 +8,7 @@ _DEF_AGG = (
 	('MEAN', "Mean", "Average of point values in the cell"),
 	('MIN', "Min", "Minimum of point values in the cell"),
 	('MAX', "Max", "Maximum of point values in the cell"),
+	('VOLUME', "Volume Weighted", "Average of point values weighted by their share of cell volume"),
 )
 
 
@@ -35,11 +36,10 @@ def _cell_attribute_items(self, context):
 	if domain == 'POINT':
 		return _point_attribute_items(self, context)
 	model = get_model(obj.name) or ensure_model_for_object(context, obj)
-	if not model or not getattr(model, 'cells', None):
+	if not model:
 		return [("NONE", "(no volume data)", "")] 
 	try:
-		first = model.cells[0]
-		attrs = list(getattr(first, 'attributes', {}).keys())
+		attrs = model.cell_attribute_names()
 	except Exception:
 		attrs = []
 	if not attrs:
@@ -48,15 +48,52 @@ def _cell_attribute_items(self, context):
 	return items
 
 
+_LIVE_TIMER = None
+
+
+def _schedule_live_threshold_update():
+	"""Debounce slider drags: rebuild the threshold surface shortly after the last range change."""
+	global _LIVE_TIMER
+
+	def _do_update():
+		global _LIVE_TIMER
+		_LIVE_TIMER = None
+		try:
+			from ..operators.threshold_live import rebuild_threshold_surface_for_settings
+			settings = getattr(bpy.context.scene, 'filters_threshold_settings', None)
+			if settings is not None:
+				rebuild_threshold_surface_for_settings(bpy.context, settings)
+		except Exception as e:
+			print(f"[Threshold] Live update failed: {e}")
+		return None
+
+	if _LIVE_TIMER is not None:
+		try:
+			bpy.app.timers.unregister(_LIVE_TIMER)
+		except Exception:
+			pass
+	_LIVE_TIMER = _do_update
+	try:
+		bpy.app.timers.register(_do_update, first_interval=0.05)
+	except Exception:
+		pass
+
+
+def _on_range_update(self, context):
+	if getattr(self, 'live_update', False):
+		_schedule_live_threshold_update()
+
+
 class FiltersThresholdSettings(bpy.types.PropertyGroup):
-	"""Settings for building a threshold surface from a volumetric mesh. Manual update only."""
+	"""Settings for building a threshold surface from a volumetric mesh. Range changes rebuild it when Live Update is on."""
 	
 	domain: EnumProperty(name="Domain", items=(('CELL', "Cell", "Use cell data"), ('POINT', "Point", "Use point data")), default='CELL')
 	aggregator: EnumProperty(name="Aggregator", description="How to reduce point values to a cell scalar", items=_DEF_AGG, default='MEAN')
 	target_object: PointerProperty(type=bpy.types.Object, name="Domain Mesh")
 	attribute: EnumProperty(name="Attribute", items=_cell_attribute_items)
-	min_value: FloatProperty(name="Minimum", default=0.0)
-	max_value: FloatProperty(name="Maximum", default=1.0)
+	min_value: FloatProperty(name="Minimum", default=0.0, update=_on_range_update)
+	max_value: FloatProperty(name="Maximum", default=1.0, update=_on_range_update)
+	live_update: BoolProperty(name="Live Update", description="Update the threshold surface while the range is changed, reusing the sorted cell values", default=False)
 
 
 def register():
@@ -33,26 +33,66 @@ class FILTERSGENERATOR_PT_stream_tracers(bpy.types.Panel):
         layout.prop(s, "vector_attribute", text="Vector Field")
         layout.prop(s, "emitter_type", text="Emitter")
 
+        box = layout.box()
+        box.label(text="Seeding", icon='PARTICLE_POINT')
+        col = box.column(align=True)
+        col.prop(s, "seed_strategy")
+        if s.seed_strategy != 'EMITTER':
+            col.prop(s, "seed_count")
+            if s.seed_strategy in {'GRID', 'RANDOM', 'POISSON'}:
+                col.prop(s, "seed_region")
+            if s.seed_strategy == 'ISOSURFACE':
+                col.prop(s, "seed_iso_attribute")
+                col.prop(s, "seed_iso_value")
+            if s.seed_strategy in {'SURFACE', 'ISOSURFACE'}:
+                col.prop(s, "seed_weight_by_magnitude")
+            if s.seed_strategy != 'GRID':
+                col.prop(s, "seed_random_seed")
+
         box = layout.box()
         box.label(text="Integrator", icon='MOD_PHYSICS')
         col = box.column(align=True)
         col.prop(s, "integration_direction", text="Direction")
+        col.prop(s, "integrator")
         col.prop(s, "step_size")
+        if s.integrator == 'RK45':
+            col.prop(s, "tolerance")
+            col.prop(s, "min_step")
+            col.prop(s, "max_step")
         col.prop(s, "max_steps")
         col.prop(s, "max_length")
         col.prop(s, "min_velocity")
-        col.prop(s, "k_neighbors")
+        col.prop(s, "sampling_method")
+        if s.sampling_method in {'IDW', 'GRID'}:
+            col.prop(s, "k_neighbors")
+        if s.sampling_method == 'GRID':
+            col.prop(s, "grid_resolution")
         col.prop(s, "field_scale")
         col.prop(s, "normalize_field")
         col.prop(s, "stop_at_bounds")
         col.prop(s, "bbox_margin")
 
+        box = layout.box()
+        box.label(text="Output", icon='CURVE_DATA')
+        col = box.column(align=True)
+        col.prop(s, "streamline_tubes")
+        if s.streamline_tubes:
+            col.prop(s, "tube_radius")
+            col.prop(s, "tube_arrows")
+
         row = layout.row(align=True)
         row.operator("filters.create_emitter", text="Create Emitter", icon='PARTICLES')
         row.operator("filters.place_emitter", text="Place", icon='MOUSE_LMB')
 
         layout.operator("filters.generate_streamline", text="Generate Streamline", icon='CURVE_DATA')
 
+        box = layout.box()
+        box.label(text="Pathlines (Frame_{n} sequence)", icon='TIME')
+        col = box.column(align=True)
+        col.prop(s, "frame_time")
+        col.prop(s, "pathline_substeps")
+        box.operator("filters.generate_pathlines", text="Generate Pathlines", icon='PARTICLES')
+
 
 class FILTERSGENERATOR_PT_volume_filter(bpy.types.Panel):
     bl_label = "Volume Filter"
@@ -172,6 +212,7 @@ class FILTERSGENERATOR_PT_geometry_filters(bpy.types.Panel):
             row = col.row(align=True)
             row.prop(s, "min_value")
             row.prop(s, "max_value")
+            col.prop(s, "live_update")
             col.operator("filters.build_threshold_surface", text="Build/Update", icon='MESH_DATA')
 
         box = layout.box()
@@ -184,11 +225,20 @@ class FILTERSGENERATOR_PT_geometry_filters(bpy.types.Panel):
             col.prop(c, "target_object", text="Domain Mesh")
             row = col.row(align=True)
             row.prop(c, "domain", text="Domain")
-            if getattr(c, 'domain', 'CELL') == 'POINT':
-                row = col.row(align=True)
-                row.prop(c, "aggregator", text="Aggregator")
             col.prop(c, "attribute", text="Attribute")
-            col.prop(c, "iso_value", text="Iso Value")
+            col.prop(c, "iso_mode", text="Levels")
+            mode = getattr(c, 'iso_mode', 'SINGLE')
+            if mode == 'RANGE':
+                row = col.row(align=True)
+                row.prop(c, "iso_min", text="Min")
+                row.prop(c, "iso_max", text="Max")
+                col.prop(c, "iso_count", text="Count")
+            elif mode == 'LIST':
+                col.prop(c, "iso_list", text="Values")
+            else:
+                col.prop(c, "iso_value", text="Iso Value")
+            if mode != 'SINGLE':
+                col.prop(c, "level_output", text="Output")
             col.operator("filters.build_contour_surface", text="Build/Update", icon='MESH_DATA')
 
         box = layout.box()
@@ -202,6 +252,7 @@ class FILTERSGENERATOR_PT_geometry_filters(bpy.types.Panel):
             row = col.row(align=True)
             row.prop(sl, "plane_object", text="Slice Plane")
             row.operator("filters.slice_ensure_plane", text="Ensure", icon='MESH_PLANE')
+            col.prop(sl, "live_update")
             col.operator("filters.build_slice_surface", text="Build/Update", icon='MESH_DATA')
 
         box = layout.box()
@@ -216,8 +267,41 @@ class FILTERSGENERATOR_PT_geometry_filters(bpy.types.Panel):
         row.prop(cl, "plane_object", text="Clip Plane")
         row.operator("filters.clip_ensure_plane", text="Ensure", icon='MESH_PLANE')
         col.prop(cl, "side", text="Side")
+        col.prop(cl, "live_update")
         col.operator("filters.build_clip_surface", text="Build/Update", icon='MESH_DATA')
 
+        box = layout.box()
+        box.label(text="Point/Cell Data Conversion", icon='MOD_DATA_TRANSFER')
+        cv = getattr(context.scene, "filters_conversion_settings", None)
+        if not cv:
+            box.label(text="Conversion settings unavailable", icon='ERROR')
+            return
+        col = box.column(align=True)
+        col.prop(cv, "target_object", text="Domain Mesh")
+        col.prop(cv, "direction", text="Direction")
+        col.prop(cv, "attribute", text="Attribute")
+        col.prop(cv, "mode", text="Reduction")
+        col.prop(cv, "output_name", text="Output")
+        col.operator("filters.convert_data", text="Convert", icon='MOD_DATA_TRANSFER')
+
+        box = layout.box()
+        box.label(text="Filter Sequence (collection)", icon='SEQUENCE')
+        sq = getattr(context.scene, "filters_sequence_settings", None)
+        if not sq:
+            box.label(text="Sequence settings unavailable", icon='ERROR')
+            return
+        col = box.column(align=True)
+        col.prop(sq, "target_collection", text="Collection")
+        col.prop(sq, "filter_type", text="Filter")
+        col.prop(sq, "max_workers")
+        col.prop(sq, "keyframe_visibility")
+        if getattr(sq, 'is_running', False):
+            row = col.row(align=True)
+            row.prop(sq, "progress", text="Progress", slider=True)
+            row.operator("filters.cancel_filter_sequence", text="", icon='CANCEL')
+        else:
+            col.operator("filters.filter_sequence", text="Filter Sequence", icon='SEQUENCE')
+
 
 class FILTERSGENERATOR_PT_attribute_interpolation(bpy.types.Panel):
     bl_label = "Attribute Smoothing"
@@ -0,0 +1,213 @@
+import numpy as np
+from ...operators.utils.volume_mesh_data import VolumeMeshArrays, csr_gather
+
+# Barycentric coordinates down to this value still count as inside, so points on shared faces are found
+_INSIDE_TOLERANCE = -1e-9
+
+
+class CellLocator:
+	"""Point location in the cells of a VolumeMeshArrays with linear interpolation weights.
+
+	Every cell is split on the fly into tetrahedra joining its centroid to the fan triangles of its faces, which
+	gives exact weights for linear fields on any convex cell. Queries first test hint cells and their face
+	neighbours, then fall back to a uniform bucket grid over the cell bounds.
+	"""
+
+	def __init__(self, arrays: VolumeMeshArrays):
+		self.arrays = arrays
+		self.points = np.asarray(arrays.points, dtype=np.float64)
+		self.centroids = arrays.cell_centroids()
+		self.face_offsets = np.asarray(arrays.face_offsets)
+		self.face_vertices = np.asarray(arrays.face_vertices)
+		self.cell_face_offsets = np.asarray(arrays.cell_face_offsets)
+		self.cell_faces = np.asarray(arrays.cell_faces)
+		self._neighbours = None
+		self._build_buckets()
+		self._build_planes()
+
+	def _build_buckets(self) -> None:
+		lo, hi = self.arrays.cell_bounds()
+		cells = np.flatnonzero(np.all(np.isfinite(lo), axis=1) & ~np.isnan(self.centroids[:, 0]))
+		self.origin = lo[cells].min(axis=0) if cells.shape[0] else np.zeros(3)
+		top = hi[cells].max(axis=0) if cells.shape[0] else np.ones(3)
+		extent = np.maximum(top - self.origin, 1e-12)
+		# Buckets about the size of a typical cell, capped at a few buckets per cell
+		size = float(np.median((hi[cells] - lo[cells]).max(axis=1))) if cells.shape[0] else 1.0
+		size = max(size, float(extent.max()) / 1024.0, 1e-12)
+		while np.prod(np.ceil(extent / size)) > max(1, 4 * cells.shape[0]):
+			size *= 1.25
+		self.dims = np.maximum(np.ceil(extent / size), 1).astype(np.int64)
+		self.bucket_size = extent / self.dims
+		first = self._bucket_coords(lo[cells])
+		last = self._bucket_coords(hi[cells])
+		span = last - first + 1
+		counts = np.prod(span, axis=1)
+		owner = np.repeat(np.arange(cells.shape[0]), counts)
+		local = np.arange(owner.shape[0]) - np.repeat(np.cumsum(counts) - counts, counts)
+		ny_nz = (span[:, 1] * span[:, 2])[owner]
+		coords = first[owner] + np.stack([local // ny_nz, (local // span[owner, 2]) % span[owner, 1], local % span[owner, 2]], axis=1)
+		buckets = self._flat(coords)
+		order = np.argsort(buckets, kind='stable')
+		self.bucket_cells = cells[owner[order]]
+		self.bucket_offsets = np.zeros(int(np.prod(self.dims)) + 1, dtype=np.int64)
+		np.cumsum(np.bincount(buckets, minlength=int(np.prod(self.dims))), out=self.bucket_offsets[1:])
+
+	def _build_planes(self) -> None:
+		"""Area-weighted unit normal and centre of every face, for the half-space prefilter."""
+		sizes = np.diff(self.face_offsets)
+		tri_count = np.maximum(sizes - 2, 0)
+		tri_face = np.repeat(np.arange(sizes.shape[0]), tri_count)
+		fan = np.arange(tri_face.shape[0]) - np.repeat(np.cumsum(tri_count) - tri_count, tri_count) + 1
+		base = self.face_offsets[:-1][tri_face]
+		p0 = self.points[self.face_vertices[base]]
+		cross = np.cross(self.points[self.face_vertices[base + fan]] - p0, self.points[self.face_vertices[base + fan + 1]] - p0)
+		normals = np.stack([np.bincount(tri_face, weights=cross[:, k], minlength=sizes.shape[0]) for k in range(3)], axis=1)
+		self.face_normals = normals / np.maximum(np.linalg.norm(normals, axis=1), 1e-300)[:, None]
+		face_of_entry = np.repeat(np.arange(sizes.shape[0]), sizes)
+		self.face_centers = np.stack([np.bincount(face_of_entry, weights=self.points[self.face_vertices, k], minlength=sizes.shape[0]) for k in range(3)], axis=1) / np.maximum(sizes, 1)[:, None]
+		# Warped faces deviate from their plane; widen each face by its largest vertex deviation to stay conservative
+		deviation = np.abs(np.einsum('ij,ij->i', self.face_normals[face_of_entry], self.points[self.face_vertices] - self.face_centers[face_of_entry]))
+		self.face_tolerance = np.zeros(sizes.shape[0])
+		filled = sizes > 0
+		if filled.any():
+			self.face_tolerance[filled] = np.maximum.reduceat(deviation, self.face_offsets[:-1][filled])
+		self.face_tolerance += 1e-9 * float(self.bucket_size.mean())
+
+	def _prefilter(self, positions: np.ndarray, queries: np.ndarray, cells: np.ndarray) -> np.ndarray:
+		"""Return a mask of (query, cell) pairs whose query lies on the inner side of every face plane of the cell."""
+		face_rows, faces = csr_gather(self.cell_face_offsets, self.cell_faces, cells)
+		pair = np.repeat(np.arange(queries.shape[0]), np.diff(face_rows))
+		normals = self.face_normals[faces]
+		centers = self.face_centers[faces]
+		side_query = np.einsum('ij,ij->i', normals, positions[queries[pair]] - centers)
+		side_cell = np.einsum('ij,ij->i', normals, self.centroids[cells[pair]] - centers)
+		outside = side_query * np.sign(side_cell) < -self.face_tolerance[faces]
+		return np.bincount(pair[outside], minlength=queries.shape[0]) == 0
+
+	def _bucket_coords(self, positions: np.ndarray) -> np.ndarray:
+		coords = np.floor((positions - self.origin) / self.bucket_size).astype(np.int64)
+		return np.clip(coords, 0, self.dims - 1)
+
+	def _flat(self, coords: np.ndarray) -> np.ndarray:
+		return (coords[:, 0] * self.dims[1] + coords[:, 1]) * self.dims[2] + coords[:, 2]
+
+	def neighbours(self) -> tuple:
+		"""Return the face adjacency of the cells as CSR (offsets, neighbour cells)."""
+		if self._neighbours is None:
+			owner = np.asarray(self.arrays.face_owner)[self.cell_faces]
+			neighbour = np.asarray(self.arrays.face_neighbour)[self.cell_faces]
+			cell_of_entry = np.repeat(np.arange(self.arrays.num_cells), np.diff(self.cell_face_offsets))
+			other = np.where(owner == cell_of_entry, neighbour, owner)
+			keep = other >= 0
+			offsets = np.zeros(self.arrays.num_cells + 1, dtype=np.int64)
+			np.cumsum(np.bincount(cell_of_entry[keep], minlength=self.arrays.num_cells), out=offsets[1:])
+			self._neighbours = (offsets, other[keep])
+		return self._neighbours
+
+	def _test(self, positions: np.ndarray, queries: np.ndarray, cells: np.ndarray) -> tuple:
+		"""Test (query, cell) pairs; returns (hit, (M, 3) point ids, (M, 4) weights) with the centroid weight first."""
+		num = queries.shape[0]
+		ids = np.zeros((num, 3), dtype=np.int64)
+		weights = np.zeros((num, 4))
+		hit = np.zeros(num, dtype=bool)
+		if num == 0:
+			return hit, ids, weights
+		face_rows, faces = csr_gather(self.cell_face_offsets, self.cell_faces, cells)
+		face_pair = np.repeat(np.arange(num), np.diff(face_rows))
+		tri_count = np.maximum(np.diff(self.face_offsets)[faces] - 2, 0)
+		tri_pair = np.repeat(face_pair, tri_count)
+		base = np.repeat(self.face_offsets[faces], tri_count)
+		fan = np.arange(tri_pair.shape[0]) - np.repeat(np.cumsum(tri_count) - tri_count, tri_count) + 1
+		a = self.face_vertices[base]
+		b = self.face_vertices[base + fan]
+		c = self.face_vertices[base + fan + 1]
+		o = self.centroids[cells[tri_pair]]
+		ea = self.points[a] - o
+		eb = self.points[b] - o
+		ec = self.points[c] - o
+		eq = positions[queries[tri_pair]] - o
+		det = np.einsum('ij,ij->i', ea, np.cross(eb, ec))
+		valid = np.abs(det) > 1e-300
+		safe = np.where(valid, det, 1.0)
+		wa = np.einsum('ij,ij->i', eq, np.cross(eb, ec)) / safe
+		wb = np.einsum('ij,ij->i', ea, np.cross(eq, ec)) / safe
+		wc = np.einsum('ij,ij->i', ea, np.cross(eb, eq)) / safe
+		wo = 1.0 - wa - wb - wc
+		inside = valid & (wa >= _INSIDE_TOLERANCE) & (wb >= _INSIDE_TOLERANCE) & (wc >= _INSIDE_TOLERANCE) & (wo >= _INSIDE_TOLERANCE)
+		tris = np.flatnonzero(inside)
+		pairs, first = np.unique(tri_pair[tris], return_index=True)
+		tris = tris[first]
+		hit[pairs] = True
+		ids[pairs] = np.stack([a[tris], b[tris], c[tris]], axis=1)
+		weights[pairs] = np.stack([wo[tris], wa[tris], wb[tris], wc[tris]], axis=1)
+		return hit, ids, weights
+
+	def _resolve(self, positions, queries, cells, result) -> np.ndarray:
+		"""Test candidate pairs and store the first hit of every query; returns the queries that were found."""
+		keep = self._prefilter(positions, queries, cells)
+		queries, cells = queries[keep], cells[keep]
+		hit, ids, weights = self._test(positions, queries, cells)
+		found = np.flatnonzero(hit)
+		found_queries, first = np.unique(queries[found], return_index=True)
+		found = found[first]
+		result[0][found_queries] = cells[found]
+		result[1][found_queries] = ids[found]
+		result[2][found_queries] = weights[found]
+		return found_queries
+
+	def locate(self, positions, hints=None) -> tuple:
+		"""Locate (N, 3) model-space positions; returns (cells, (N, 3) point ids, (N, 4) weights).
+
+		Cells are -1 outside the mesh. Weights apply to the cell centroid and the three point ids. `hints` are
+		cells to try first, e.g. the cells of the previous call for coherent queries.
+		"""
+		positions = np.ascontiguousarray(positions, dtype=np.float64).reshape(-1, 3)
+		num = positions.shape[0]
+		result = (np.full(num, -1, dtype=np.int64), np.zeros((num, 3), dtype=np.int64), np.zeros((num, 4)))
+		pending = np.ones(num, dtype=bool)
+		if hints is not None:
+			hints = np.asarray(hints, dtype=np.int64)
+			queries = np.flatnonzero(hints >= 0)
+			pending[self._resolve(positions, queries, hints[queries], result)] = False
+			# Walk one layer of face neighbours around the hints that missed
+			queries = np.flatnonzero(pending & (hints >= 0))
+			offsets, others = self.neighbours()
+			rows, candidates = csr_gather(offsets, others, hints[queries])
+			owner = queries[np.repeat(np.arange(queries.shape[0]), np.diff(rows))]
+			pending[self._resolve(positions, owner, candidates, result)] = False
+		queries = np.flatnonzero(pending)
+		if queries.shape[0]:
+			outside = np.any((positions[queries] < self.origin) | (positions[queries] > self.origin + self.dims * self.bucket_size), axis=1)
+			queries = queries[~outside]
+			buckets = self._flat(self._bucket_coords(positions[queries]))
+			rows, candidates = csr_gather(self.bucket_offsets, self.bucket_cells, buckets)
+			owner = queries[np.repeat(np.arange(queries.shape[0]), np.diff(rows))]
+			self._resolve(positions, owner, candidates, result)
+		return result
+
+	def cell_means(self, values: np.ndarray) -> np.ndarray:
+		"""Return the mean point value of every cell, the value the interpolation assigns to cell centroids."""
+		offsets, pts = self.arrays.cell_points()
+		counts = np.maximum(np.diff(offsets), 1)
+		values = np.asarray(values, dtype=np.float64).reshape(self.points.shape[0], -1)
+		owners = np.repeat(np.arange(self.arrays.num_cells), np.diff(offsets))
+		sums = np.stack([np.bincount(owners, weights=values[pts, k], minlength=self.arrays.num_cells) for k in range(values.shape[1])], axis=1)
+		return sums / counts[:, None]
+
+	def interpolate(self, located: tuple, values: np.ndarray, cell_values: np.ndarray) -> np.ndarray:
+		"""Interpolate point values (P, C) at located positions using the per-cell means from cell_means; NaN outside."""
+		cells, ids, weights = located
+		values = np.asarray(values, dtype=np.float64).reshape(self.points.shape[0], -1)
+		inside = cells >= 0
+		result = np.full((cells.shape[0], values.shape[1]), np.nan)
+		result[inside] = weights[inside, :1] * cell_values[cells[inside]] + np.einsum('nk,nkc->nc', weights[inside, 1:], values[ids[inside]])
+		return result
+
+
+def cell_locator_for(arrays: VolumeMeshArrays) -> CellLocator:
+	"""Return the cached CellLocator of an array view, building it on first use."""
+	locator = arrays._derived.get('cell_locator')
+	if locator is None:
+		locator = CellLocator(arrays)
+		arrays._derived['cell_locator'] = locator
+	return locator
@@ -0,0 +1,88 @@
+import bpy
+import numpy as np
+from typing import Optional
+from ...operators.utils.volume_mesh_data import VolumeMeshArrays
+from .mesh_buffers import read_point_attribute
+
+
+REDUCTION_ITEMS = (
+	('MEAN', "Mean", "Average of the values"),
+	('MIN', "Min", "Minimum of the values"),
+	('MAX', "Max", "Maximum of the values"),
+	('VOLUME', "Volume Weighted", "Average weighted by cell volume"),
+)
+
+
+def _grouped_reduce(offsets: np.ndarray, gathered: np.ndarray, weights: Optional[np.ndarray], mode: str, count: int) -> np.ndarray:
+	"""Reduce CSR-grouped values per row ignoring NaN; rows without valid values get NaN."""
+	result = np.full(count, np.nan, dtype=np.float64)
+	nonempty = np.diff(offsets) > 0
+	if gathered.shape[0] == 0 or not nonempty.any():
+		return result
+	starts = offsets[:-1][nonempty]
+	with np.errstate(invalid='ignore', divide='ignore'):
+		if mode == 'MIN':
+			result[nonempty] = np.fmin.reduceat(gathered, starts)
+		elif mode == 'MAX':
+			result[nonempty] = np.fmax.reduceat(gathered, starts)
+		else:
+			valid = ~np.isnan(gathered)
+			w = valid.astype(np.float64) if weights is None or mode != 'VOLUME' else np.where(valid, weights, 0.0)
+			sums = np.add.reduceat(np.where(valid, gathered, 0.0) * w, starts)
+			totals = np.add.reduceat(w, starts)
+			result[nonempty] = np.where(totals > 0, sums / np.where(totals > 0, totals, 1.0), np.nan)
+	return result
+
+
+def point_to_cell(arrays: VolumeMeshArrays, point_values: np.ndarray, mode: str = 'MEAN') -> np.ndarray:
+	"""Reduce point values to one value per cell over the cell's unique points.
+
+	`mode` is 'MIN', 'MAX', 'MEAN' or 'VOLUME' (mean weighted by each point's share of the cell's volume, see
+	VolumeMeshArrays.cell_point_volumes). NaN point values are ignored; cells without valid points get NaN. Raises
+	ValueError unless there is exactly one value per model point.
+	"""
+	if int(point_values.shape[0]) != arrays.num_points:
+		raise ValueError(f"Expected {arrays.num_points} point values, got {int(point_values.shape[0])}")
+	offsets, pts = arrays.cell_points()
+	values = np.asarray(point_values, dtype=np.float64)
+	weights = arrays.cell_point_volumes() if mode == 'VOLUME' else None
+	return _grouped_reduce(offsets, values[pts], weights, mode, arrays.num_cells)
+
+
+def cell_to_point(arrays: VolumeMeshArrays, cell_values: np.ndarray, mode: str = 'MEAN') -> np.ndarray:
+	"""Reduce the values of the cells around each point using the cached point-to-cell incidence.
+
+	`mode` is 'MIN', 'MAX', 'MEAN' or 'VOLUME' (mean weighted by cell volume). NaN cell values are ignored; unused
+	points get NaN.
+	"""
+	offsets, cells = arrays.point_cells()
+	values = np.asarray(cell_values, dtype=np.float64)
+	weights = arrays.cell_volumes()[cells] if mode == 'VOLUME' else None
+	return _grouped_reduce(offsets, values[cells], weights, mode, arrays.num_points)
+
+
+def cell_scalar_from_fields(arrays: VolumeMeshArrays, point_fields: dict, attr_name: str, domain: str, aggregator: str) -> Optional[np.ndarray]:
+	"""Like cell_scalar_for_attribute, with point data taken from already read buffers; touches no Blender data."""
+	if domain == 'CELL':
+		column = arrays.cell_attributes.get(attr_name)
+		if column is None:
+			return None
+		return np.asarray(column[:, 0], dtype=np.float64)
+	point_values = point_fields.get(attr_name)
+	if point_values is None or point_values.shape[0] != arrays.num_points:
+		return None
+	return point_to_cell(arrays, point_values, aggregator)
+
+
+def cell_scalar_for_attribute(src_obj: bpy.types.Object, arrays: VolumeMeshArrays, attr_name: str, domain: str, aggregator: str) -> Optional[np.ndarray]:
+	"""Return one scalar per cell for a filter: a cell attribute's first component, or point data reduced per cell.
+
+	Returns None when the attribute is not available in the requested domain, including point data whose length
+	does not match the model's points.
+	"""
+	point_fields = {}
+	if domain != 'CELL':
+		point_values = read_point_attribute(getattr(src_obj, 'data', None), attr_name)
+		if point_values is not None:
+			point_fields[attr_name] = point_values
+	return cell_scalar_from_fields(arrays, point_fields, attr_name, domain, aggregator)
@@ -1,113 +1,36 @@
 import bpy
-import math
-from mathutils import Vector, kdtree
+import numpy as np
+from mathutils import Vector
+from .point_grid import PointGrid
+from .cell_locator import cell_locator_for
+from .filter_cache import array_fingerprint
+from .mesh_buffers import world_points
+
+
+# Built samplers keyed by (object name, attribute), each with the fingerprint of the data it was built from
+_SAMPLER_CACHE = {}
+_MAX_CACHED_SAMPLERS = 4
 
 
 class VectorFieldSampler:
-    def __init__(self, obj: bpy.types.Object, attribute_name: str):
+    """Inverse-distance weighted sampling of a point vector attribute in world space.
+
+    Points and vectors are read with foreach_get and indexed by a PointGrid, so building costs a few array passes.
+    Use vector_field_sampler_for to reuse a built sampler until the mesh, its transform or the attribute changes.
+    """
+
+    def __init__(self, obj: bpy.types.Object, attribute_name: str, points=None, vectors=None):
         if obj.type != 'MESH':
             raise ValueError("Domain object must be a mesh")
         self.obj = obj
         self.attribute_name = attribute_name
-        self._points = []
-        self._vectors = []
-        self._kdtree = None
-        self._bbox_min = Vector((0, 0, 0))
-        self._bbox_max = Vector((0, 0, 0))
-        self._build()
-
-    def _build(self):
-        mesh = self.obj.data
-        attrs = getattr(mesh, "attributes", None)
-        if not attrs:
-            raise ValueError("Mesh has no attributes")
-
-        is_composite = False
-        comp_names = None
-        if isinstance(self.attribute_name, str) and self.attribute_name.startswith("__COMP__:"):
-            is_composite = True
-            try:
-                payload = self.attribute_name.split(":", 1)[1]
-                parts = payload.split("|")
-                if len(parts) != 3:
-                    raise ValueError
-                comp_names = (parts[0], parts[1], parts[2])
-            except Exception:
-                raise ValueError("Invalid composite attribute spec")
-
-        if not is_composite:
-            if self.attribute_name not in attrs:
-                raise ValueError(f"Attribute '{self.attribute_name}' not found on mesh")
-            attr = attrs[self.attribute_name]
-            data_type = getattr(attr, "data_type", "")
-            domain = getattr(attr, "domain", "")
-            if data_type != 'FLOAT_VECTOR' or domain not in {'POINT', 'VERTEX'}:
-                raise ValueError("Selected attribute is not a vector field on points/verts")
-        else:
-            for n in comp_names:
-                if n not in attrs:
-                    raise ValueError(f"Component attribute '{n}' not found")
-                a = attrs[n]
-                if getattr(a, 'data_type', '') != 'FLOAT' or getattr(a, 'domain', '') not in {'POINT', 'VERTEX'}:
-                    raise ValueError("Component attributes must be FLOAT on POINT/VERTEX domain")
-
-        self._points.clear()
-        self._vectors.clear()
-        world = self.obj.matrix_world
-
-        if not is_composite:
-            domain = getattr(attrs[self.attribute_name], 'domain', '')
-            if domain == 'POINT':
-                for i, v in enumerate(attrs[self.attribute_name].data):
-                    co = world @ mesh.vertices[i].co
-                    vec = Vector(v.vector)
-                    self._points.append(co)
-                    self._vectors.append(vec)
-            else:
-                vectors = [Vector(x.vector) for x in attrs[self.attribute_name].data]
-                for i, vert in enumerate(mesh.vertices):
-                    co = world @ vert.co
-                    self._points.append(co)
-                    self._vectors.append(vectors[i])
-        else:
-            a_x, a_y, a_z = (attrs[comp_names[0]], attrs[comp_names[1]], attrs[comp_names[2]])
-            domain = getattr(a_x, 'domain', '')  # assume consistent
-            if domain == 'POINT':
-                for i in range(len(mesh.vertices)):
-                    co = world @ mesh.vertices[i].co
-                    vx = a_x.data[i].value
-                    vy = a_y.data[i].value
-                    vz = a_z.data[i].value
-                    self._points.append(co)
-                    self._vectors.append(Vector((vx, vy, vz)))
-            else:
-                vals_x = [d.value for d in a_x.data]
-                vals_y = [d.value for d in a_y.data]
-                vals_z = [d.value for d in a_z.data]
-                for i, vert in enumerate(mesh.vertices):
-                    co = world @ vert.co
-                    self._points.append(co)
-                    self._vectors.append(Vector((vals_x[i], vals_y[i], vals_z[i])))
-
-        # KDTree
-        size = len(self._points)
-        tree = kdtree.KDTree(size)
-        for i, p in enumerate(self._points):
-            tree.insert(p, i)
-        tree.balance()
-        self._kdtree = tree
-
-        mins = Vector((float('inf'),) * 3)
-        maxs = Vector((float('-inf'),) * 3)
-        for p in self._points:
-            mins.x = min(mins.x, p.x)
-            mins.y = min(mins.y, p.y)
-            mins.z = min(mins.z, p.z)
-            maxs.x = max(maxs.x, p.x)
-            maxs.y = max(maxs.y, p.y)
-            maxs.z = max(maxs.z, p.z)
-        self._bbox_min = mins
-        self._bbox_max = maxs
+        self._point_array = world_points(obj) if points is None else points
+        self._vector_array = read_vector_attribute(obj.data, attribute_name) if vectors is None else vectors
+        if self._vector_array.shape[0] != self._point_array.shape[0]:
+            raise ValueError("Vector attribute does not have one value per vertex")
+        self._grid = PointGrid(self._point_array)
+        self._bbox_min = Vector(tuple(self._grid.bbox_min))
+        self._bbox_max = Vector(tuple(self._grid.bbox_max))
 
     @property
     def bbox_min(self):
@@ -118,36 +41,169 @@ class VectorFieldSampler:
         return self._bbox_max
 
     def sample(self, position: Vector, k_neighbors: int = 8, normalize: bool = False) -> Vector:
-        if self._kdtree is None:
-            return Vector((0.0, 0.0, 0.0))
-        co, idx, dist = self._kdtree.find(position)
-        if idx is None:
-            return Vector((0.0, 0.0, 0.0))
-        neighbors = self._kdtree.find_n(position, max(1, k_neighbors))
-        weighted = Vector((0.0, 0.0, 0.0))
-        total_w = 0.0
-        for _co, i, d in neighbors:
-            v = self._vectors[i]
-            w = 1.0 / max(d, 1e-8)
-            weighted += v * w
-            total_w += w
-        if total_w <= 0.0:
-            return Vector((0.0, 0.0, 0.0))
-        v = weighted / total_w
-        if normalize:
-            l = v.length
-            if l > 1e-12:
-                v = v / l
-        return v
+        return Vector(tuple(self.sample_many(np.array([tuple(position)]), k_neighbors, normalize)[0]))
 
     def inside_bbox(self, position: Vector, margin: float = 0.0) -> bool:
-        bmin = self._bbox_min.copy()
-        bmax = self._bbox_max.copy()
+        return bool(self.inside_bbox_many(np.array([tuple(position)]), margin)[0])
+
+    def sample_many(self, positions, k_neighbors: int = 8, normalize: bool = False) -> np.ndarray:
+        """Inverse-distance weighted samples of the k nearest points for (N, 3) positions in one batched query."""
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        grid = self._grid
+        result = np.zeros((positions.shape[0], 3))
+        if grid.points.shape[0] == 0 or positions.shape[0] == 0:
+            return result
+        idx, dist = grid.query(positions, max(1, k_neighbors))
+        weights = np.where(idx >= 0, 1.0 / np.maximum(dist, 1e-8), 0.0)
+        total = weights.sum(axis=1)
+        weighted = np.einsum('nk,nkc->nc', weights, self._vector_array[np.maximum(idx, 0)])
+        valid = total > 0.0
+        result[valid] = weighted[valid] / total[valid, None]
+        if normalize:
+            lengths = np.linalg.norm(result, axis=1)
+            scale = lengths > 1e-12
+            result[scale] /= lengths[scale, None]
+        return result
+
+    def inside_bbox_many(self, positions, margin: float = 0.0) -> np.ndarray:
+        """Vectorized bounding-box test for (N, 3) positions; margin expands the box by a fraction of its size."""
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        bmin = np.array(tuple(self._bbox_min), dtype=np.float64)
+        bmax = np.array(tuple(self._bbox_max), dtype=np.float64)
+        if margin > 0.0:
+            expand = (bmax - bmin) * margin
+            bmin = bmin - expand
+            bmax = bmax + expand
+        return np.all((positions >= bmin) & (positions <= bmax), axis=1)
+
+
+def vector_field_sampler_for(obj: bpy.types.Object, attribute_name: str) -> VectorFieldSampler:
+    """Return a cached VectorFieldSampler, rebuilt only when the world points or the vectors changed.
+
+    Reading the arrays with foreach_get is cheap next to indexing them, so every call re-reads and fingerprints
+    them and only a mismatch pays for a new PointGrid.
+    """
+    if obj.type != 'MESH':
+        raise ValueError("Domain object must be a mesh")
+    points = world_points(obj)
+    vectors = read_vector_attribute(obj.data, attribute_name)
+    key = (obj.name, attribute_name)
+    fingerprint = (array_fingerprint(points), array_fingerprint(vectors))
+    entry = _SAMPLER_CACHE.pop(key, None)
+    if entry is not None and entry[0] == fingerprint:
+        sampler = entry[1]
+    else:
+        sampler = VectorFieldSampler(obj, attribute_name, points, vectors)
+    # Re-inserted last, so the oldest entry is first in line for eviction
+    _SAMPLER_CACHE[key] = (fingerprint, sampler)
+    while len(_SAMPLER_CACHE) > _MAX_CACHED_SAMPLERS:
+        _SAMPLER_CACHE.pop(next(iter(_SAMPLER_CACHE)))
+    return sampler
+
+
+def clear_sampler_cache() -> None:
+    _SAMPLER_CACHE.clear()
+
+
+def read_vector_attribute(mesh: bpy.types.Mesh, attribute_name: str) -> np.ndarray:
+    """Read a point vector field as an (N, 3) float64 array with foreach_get.
+
+    Accepts a FLOAT_VECTOR attribute or a composite spec '__COMP__:x|y|z' naming three FLOAT attributes.
+    """
+    attrs = getattr(mesh, "attributes", None)
+    if not attrs:
+        raise ValueError("Mesh has no attributes")
+    if isinstance(attribute_name, str) and attribute_name.startswith("__COMP__:"):
+        parts = attribute_name.split(":", 1)[1].split("|")
+        if len(parts) != 3:
+            raise ValueError("Invalid composite attribute spec")
+        columns = []
+        for n in parts:
+            if n not in attrs:
+                raise ValueError(f"Component attribute '{n}' not found")
+            a = attrs[n]
+            if getattr(a, 'data_type', '') != 'FLOAT' or getattr(a, 'domain', '') not in {'POINT', 'VERTEX'}:
+                raise ValueError("Component attributes must be FLOAT on POINT/VERTEX domain")
+            column = np.empty(len(a.data), dtype=np.float32)
+            a.data.foreach_get('value', column)
+            columns.append(column)
+        if not (columns[0].shape == columns[1].shape == columns[2].shape):
+            raise ValueError("Component attributes differ in length")
+        return np.stack(columns, axis=1).astype(np.float64)
+    if attribute_name not in attrs:
+        raise ValueError(f"Attribute '{attribute_name}' not found on mesh")
+    attr = attrs[attribute_name]
+    if getattr(attr, "data_type", "") != 'FLOAT_VECTOR' or getattr(attr, "domain", "") not in {'POINT', 'VERTEX'}:
+        raise ValueError("Selected attribute is not a vector field on points/verts")
+    flat = np.empty(len(attr.data) * 3, dtype=np.float32)
+    attr.data.foreach_get('vector', flat)
+    return flat.reshape(-1, 3).astype(np.float64)
+
+
+class CellFieldSampler:
+    """Samples a point vector field by locating the containing volume cell and interpolating barycentrically.
+
+    Exact for fields that vary linearly across a cell, unlike the neighbour-weighted VectorFieldSampler, and
+    zero outside the mesh. Positions are world space; like VectorFieldSampler, vectors are not rotated.
+    """
+
+    def __init__(self, obj: bpy.types.Object, attribute_name: str, arrays):
+        if obj.type != 'MESH':
+            raise ValueError("Domain object must be a mesh")
+        self.obj = obj
+        self.attribute_name = attribute_name
+        self.arrays = arrays
+        vectors = read_vector_attribute(obj.data, attribute_name)
+        if vectors.shape[0] != arrays.num_points:
+            raise ValueError(f"Attribute has {vectors.shape[0]} values but the volume model has {arrays.num_points} points")
+        self._vectors = vectors
+        self._locator = cell_locator_for(arrays)
+        self._cell_vectors = self._locator.cell_means(vectors)
+        world = np.array([tuple(row) for row in obj.matrix_world], dtype=np.float64)
+        self._to_local = np.linalg.inv(world)
+        self._last_cells = None
+        points = np.asarray(arrays.points, dtype=np.float64)
+        if points.shape[0] == 0:
+            self._bbox_min = np.zeros(3)
+            self._bbox_max = np.zeros(3)
+        else:
+            world_points = points @ world[:3, :3].T + world[:3, 3]
+            self._bbox_min = world_points.min(axis=0)
+            self._bbox_max = world_points.max(axis=0)
+
+    @property
+    def bbox_min(self):
+        return Vector(tuple(self._bbox_min))
+
+    @property
+    def bbox_max(self):
+        return Vector(tuple(self._bbox_max))
+
+    def sample(self, position: Vector, normalize: bool = False) -> Vector:
+        return Vector(tuple(self.sample_many(np.array([tuple(position)]), normalize=normalize)[0]))
+
+    def sample_many(self, positions, normalize: bool = False) -> np.ndarray:
+        """Interpolated vectors for (N, 3) world positions; zero where no cell contains the position."""
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        local = positions @ self._to_local[:3, :3].T + self._to_local[:3, 3]
+        # Integrator batches move a little each step, so the previous cells are good starting guesses
+        hints = self._last_cells if self._last_cells is not None and self._last_cells.shape[0] == positions.shape[0] else None
+        located = self._locator.locate(local, hints)
+        self._last_cells = located[0]
+        result = np.nan_to_num(self._locator.interpolate(located, self._vectors, self._cell_vectors), nan=0.0)
+        if normalize:
+            lengths = np.linalg.norm(result, axis=1)
+            scale = lengths > 1e-12
+            result[scale] /= lengths[scale, None]
+        return result
+
+    def inside_bbox_many(self, positions, margin: float = 0.0) -> np.ndarray:
+        """Vectorized bounding-box test for (N, 3) world positions, as VectorFieldSampler.inside_bbox_many."""
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        bmin = self._bbox_min
+        bmax = self._bbox_max
         if margin > 0.0:
-            size = bmax - bmin
-            expand = size * margin
-            bmin -= expand
-            bmax += expand
-        return (bmin.x <= position.x <= bmax.x and
-                bmin.y <= position.y <= bmax.y and
-                bmin.z <= position.z <= bmax.z) 
\ No newline at end of file
+            expand = (bmax - bmin) * margin
+            bmin = bmin - expand
+            bmax = bmax + expand
+        return np.all((positions >= bmin) & (positions <= bmax), axis=1)
@@ -0,0 +1,141 @@
+import hashlib
+import weakref
+import numpy as np
+from collections import OrderedDict
+from typing import Optional
+
+# Filter results keyed by (model arrays id, filter kind, quantized parameters, point and cell field fingerprints),
+# least recently used first. Values are (weak reference to the arrays, result, footprint in bytes); the weak
+# reference guards against a new model reusing the id of a freed one.
+_RESULT_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_RESULT_STATS = {'hits': 0, 'misses': 0, 'evictions': 0}
+_RESULT_STATE = {'nbytes': 0}
+
+# Parameters are rounded to this many significant digits, so values that differ only by float noise share a result
+_SIGNIFICANT_DIGITS = 7
+
+
+def _quantize(value):
+	if isinstance(value, (float, np.floating)):
+		return float(f"{float(value):.{_SIGNIFICANT_DIGITS}g}")
+	if isinstance(value, np.ndarray):
+		return tuple(_quantize(v) for v in value.ravel().tolist())
+	if isinstance(value, (list, tuple)):
+		return tuple(_quantize(v) for v in value)
+	if isinstance(value, dict):
+		return tuple(sorted((k, _quantize(v)) for k, v in value.items()))
+	return value
+
+
+def _nbytes(value) -> int:
+	if isinstance(value, np.ndarray):
+		return int(value.nbytes)
+	if isinstance(value, (list, tuple)):
+		return sum(_nbytes(v) for v in value)
+	if isinstance(value, dict):
+		return sum(_nbytes(v) for v in value.values())
+	return 0
+
+
+def result_budget_bytes(scene) -> int:
+	"""Return the result cache budget of a scene in bytes; 0 disables caching."""
+	return int(float(getattr(scene, 'filters_result_cache_mb', 0.0) or 0.0) * 1024 * 1024)
+
+
+def array_fingerprint(values) -> tuple:
+	"""Content key of an array: length, dtype and a hash of all its bytes.
+
+	Every value enters the hash, so permutations or edits that keep the sum still change the key.
+	"""
+	flat = np.ascontiguousarray(values).reshape(-1)
+	return (int(flat.shape[0]), flat.dtype.str, hashlib.sha1(flat.view(np.uint8)).hexdigest())
+
+
+def cell_key_fields(arrays, attr_name: str, domain: str) -> dict:
+	"""Return the cell column a CELL-domain filter reads, keyed by name, for use as `cell_fields` in result_key."""
+	if domain != 'CELL':
+		return {}
+	column = arrays.cell_attributes.get(attr_name)
+	return {} if column is None else {attr_name: column}
+
+
+def result_key(arrays, kind: str, params, point_fields: Optional[dict] = None, cell_fields: Optional[dict] = None) -> tuple:
+	"""Build a cache key for one filter run.
+
+	Point fields and the cell columns a filter reads enter the key by name and array_fingerprint, so editing a
+	source attribute or overwriting a converted cell attribute misses the cache.
+	"""
+	fingerprints = tuple(
+		tuple(sorted((name, array_fingerprint(values)) for name, values in fields.items())) if fields else ()
+		for fields in (point_fields, cell_fields)
+	)
+	return (id(arrays), kind, _quantize(params)) + fingerprints
+
+
+def get_cached_result(key: tuple, arrays) -> tuple:
+	"""Return (hit, result) for a key; empty results are cached too and come back as (True, None)."""
+	entry = _RESULT_CACHE.get(key)
+	if entry is None or entry[0]() is not arrays:
+		if entry is not None:
+			_drop(key)
+		_RESULT_STATS['misses'] += 1
+		return False, None
+	_RESULT_CACHE.move_to_end(key)
+	_RESULT_STATS['hits'] += 1
+	return True, entry[1]
+
+
+def store_result(key: tuple, arrays, result, budget_bytes: int) -> None:
+	"""Cache a result and evict least recently used entries beyond the byte budget."""
+	if key in _RESULT_CACHE:
+		_drop(key)
+	nbytes = _nbytes(result)
+	if 0 < budget_bytes and nbytes <= budget_bytes:
+		try:
+			_RESULT_CACHE[key] = (weakref.ref(arrays), result, nbytes)
+			_RESULT_STATE['nbytes'] += nbytes
+		except TypeError:
+			pass
+	while _RESULT_STATE['nbytes'] > budget_bytes and _RESULT_CACHE:
+		oldest = next(iter(_RESULT_CACHE))
+		_drop(oldest)
+		_RESULT_STATS['evictions'] += 1
+	# Entries of freed models can never hit again
+	for stale in [k for k, entry in _RESULT_CACHE.items() if entry[0]() is None]:
+		_drop(stale)
+
+
+def _drop(key: tuple) -> None:
+	entry = _RESULT_CACHE.pop(key, None)
+	if entry is not None:
+		_RESULT_STATE['nbytes'] -= entry[2]
+
+
+def cached_filter_result(scene, arrays, kind: str, params, point_fields: Optional[dict], compute, cell_fields: Optional[dict] = None):
+	"""Return the memoized result of `compute()` for these inputs, running and storing it on a miss."""
+	budget = result_budget_bytes(scene)
+	if budget <= 0:
+		return compute()
+	key = result_key(arrays, kind, params, point_fields, cell_fields)
+	hit, result = get_cached_result(key, arrays)
+	if hit:
+		return result
+	result = compute()
+	store_result(key, arrays, result, budget)
+	return result
+
+
+def get_result_cache_stats() -> dict:
+	"""Return entry count, footprint in bytes and hit/miss/eviction counters of the result cache."""
+	stats = dict(_RESULT_STATS)
+	stats['entries'] = len(_RESULT_CACHE)
+	stats['nbytes'] = _RESULT_STATE['nbytes']
+	return stats
+
+
+def clear_result_cache() -> None:
+	"""Drop every cached filter result and reset the counters."""
+	_RESULT_CACHE.clear()
+	_RESULT_STATE['nbytes'] = 0
+	for key in _RESULT_STATS:
+		_RESULT_STATS[key] = 0
@@ -0,0 +1,243 @@
+import bpy
+import os
+import hashlib
+import tempfile
+import numpy as np
+from collections import OrderedDict
+from bpy.app.handlers import persistent
+from mathutils import Vector
+from .field_sampling import read_vector_attribute
+from .mesh_buffers import world_points
+
+GRID_CACHE_DIRNAME = "sciblend_field_grids"
+
+# Open grids keyed by content hash, least recently used first; the values behind them are memory-mapped files
+_GRID_CACHE: "OrderedDict[str, GridVectorField]" = OrderedDict()
+_MAX_OPEN_GRIDS = 8
+
+# Grid files kept in the cache directory; the least recently used ones beyond either limit are deleted
+_MAX_GRID_FILES = 32
+_MAX_GRID_BYTES = 2 << 30
+
+# Grid nodes resampled per batch, limiting the temporary memory of the source sampler
+_RESAMPLE_BATCH = 1 << 16
+
+
+class GridVectorField:
+    """Vector field stored on a regular grid of nodes spanning a world-space box, sampled trilinearly.
+
+    Drop-in for the streamline samplers: sample_many and inside_bbox_many take (N, 3) world positions. Positions
+    outside the grid sample as zero.
+    """
+
+    def __init__(self, bbox_min, bbox_max, values):
+        self.values = values
+        self.dims = np.array(values.shape[:3], dtype=np.int64)
+        self._bbox_min = np.asarray(bbox_min, dtype=np.float64)
+        self._bbox_max = np.asarray(bbox_max, dtype=np.float64)
+        extent = self._bbox_max - self._bbox_min
+        self.spacing = np.where(extent > 0.0, extent / np.maximum(self.dims - 1, 1), 1.0)
+        self._flat_values = values.reshape(-1, 3)
+
+    @property
+    def bbox_min(self):
+        return Vector(tuple(self._bbox_min))
+
+    @property
+    def bbox_max(self):
+        return Vector(tuple(self._bbox_max))
+
+    def sample_many(self, positions, normalize: bool = False) -> np.ndarray:
+        """Trilinearly interpolated vectors for (N, 3) world positions."""
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        f = (positions - self._bbox_min) / self.spacing
+        inside = np.all((f >= 0.0) & (f <= self.dims - 1), axis=1)
+        base = np.clip(np.floor(f), 0, np.maximum(self.dims - 2, 0)).astype(np.int64)
+        t = np.clip(f - base, 0.0, 1.0)
+        # Flat axes have a single node layer and no upper neighbour
+        upper = (self.dims > 1).astype(np.int64)
+        result = np.zeros((positions.shape[0], 3))
+        for corner in range(8):
+            offset = np.array([(corner >> 2) & 1, (corner >> 1) & 1, corner & 1], dtype=np.int64)
+            weight = np.prod(np.where(offset == 1, t, 1.0 - t), axis=1)
+            node = base + offset * upper
+            flat = (node[:, 0] * self.dims[1] + node[:, 1]) * self.dims[2] + node[:, 2]
+            result += weight[:, None] * self._flat_values[flat]
+        result[~inside] = 0.0
+        if normalize:
+            lengths = np.linalg.norm(result, axis=1)
+            scale = lengths > 1e-12
+            result[scale] /= lengths[scale, None]
+        return result
+
+    def inside_bbox_many(self, positions, margin: float = 0.0) -> np.ndarray:
+        """Vectorized bounding-box test for (N, 3) world positions, as VectorFieldSampler.inside_bbox_many."""
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        bmin = self._bbox_min
+        bmax = self._bbox_max
+        if margin > 0.0:
+            expand = (bmax - bmin) * margin
+            bmin = bmin - expand
+            bmax = bmax + expand
+        return np.all((positions >= bmin) & (positions <= bmax), axis=1)
+
+
+def grid_dims(bbox_min, bbox_max, resolution: int) -> tuple:
+    """Node counts per axis: `resolution` nodes along the longest side, proportionally fewer on the others."""
+    extent = np.asarray(bbox_max, dtype=np.float64) - np.asarray(bbox_min, dtype=np.float64)
+    longest = float(extent.max()) if extent.size else 0.0
+    resolution = max(2, int(resolution))
+    if longest <= 0.0:
+        return (1, 1, 1)
+    dims = np.where(extent > 0.0, np.maximum(2, np.round((resolution - 1) * extent / longest).astype(np.int64) + 1), 1)
+    return tuple(int(d) for d in dims)
+
+
+def resample_to_grid(sample_func, bbox_min, bbox_max, resolution: int, out=None) -> np.ndarray:
+    """Evaluate sample_func ((N, 3) world positions -> (N, 3) vectors) at every grid node.
+
+    Returns a float32 (nx, ny, nz, 3) array, written into `out` when given (e.g. a memory-mapped file).
+    """
+    bbox_min = np.asarray(bbox_min, dtype=np.float64)
+    bbox_max = np.asarray(bbox_max, dtype=np.float64)
+    dims = grid_dims(bbox_min, bbox_max, resolution)
+    axes = [np.linspace(bbox_min[i], bbox_max[i], dims[i]) if dims[i] > 1 else np.array([bbox_min[i]]) for i in range(3)]
+    values = out if out is not None else np.empty(dims + (3,), dtype=np.float32)
+    flat = values.reshape(-1, 3)
+    total = flat.shape[0]
+    for start in range(0, total, _RESAMPLE_BATCH):
+        index = np.arange(start, min(total, start + _RESAMPLE_BATCH))
+        i, rest = np.divmod(index, dims[1] * dims[2])
+        j, k = np.divmod(rest, dims[2])
+        nodes = np.stack([axes[0][i], axes[1][j], axes[2][k]], axis=1)
+        flat[index] = sample_func(nodes)
+    return values
+
+
+def grid_field_key(points: np.ndarray, vectors: np.ndarray, attribute_name: str, resolution: int, tag: str) -> str:
+    """Content hash of the world-space points, the vectors and the resampling parameters."""
+    h = hashlib.sha1()
+    h.update(f"{attribute_name}|{int(resolution)}|{tag}".encode('utf-8'))
+    h.update(np.ascontiguousarray(points, dtype=np.float32).tobytes())
+    h.update(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+    return h.hexdigest()
+
+
+def grid_cache_dir() -> str:
+    """Cache directory of this Blender process, so no other instance deletes grids it has memory-mapped."""
+    return os.path.join(tempfile.gettempdir(), GRID_CACHE_DIRNAME, str(os.getpid()))
+
+
+def cached_grid_field(obj: bpy.types.Object, attribute_name: str, resolution: int, sampler_factory, tag: str = "") -> GridVectorField:
+    """Return the resampled grid of a mesh's vector attribute, building it once per content and resolution.
+
+    sampler_factory() must return a function mapping (N, 3) world positions to vectors; it is only called on a
+    miss. Grids are written to the temporary directory and reopened memory-mapped, so they survive reloading the
+    add-on and only the pages a query touches are read. The per-process directory is bounded by prune_grid_files
+    and removed when the add-on is unregistered. `tag` names the source sampler settings in the key.
+    """
+    if obj.type != 'MESH':
+        raise ValueError("Domain object must be a mesh")
+    points = world_points(obj)
+    if points.shape[0] == 0:
+        raise ValueError("Domain mesh has no points")
+    vectors = read_vector_attribute(obj.data, attribute_name)
+    if vectors.shape[0] != points.shape[0]:
+        raise ValueError("Vector attribute does not have one value per point")
+    key = grid_field_key(points, vectors, attribute_name, resolution, tag)
+    field = _GRID_CACHE.get(key)
+    if field is not None:
+        _GRID_CACHE.move_to_end(key)
+        return field
+    bbox_min = points.min(axis=0)
+    bbox_max = points.max(axis=0)
+    path = os.path.join(grid_cache_dir(), f"{key}.npy")
+    values = None
+    if os.path.isfile(path):
+        try:
+            os.utime(path)
+            values = np.load(path, mmap_mode='r')
+            if values.shape != grid_dims(bbox_min, bbox_max, resolution) + (3,):
+                values = None
+        except Exception as e:
+            print(f"Resampled grid: could not open cached grid {path}: {e}")
+            values = None
+    if values is None:
+        sample_func = sampler_factory()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            out = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.float32, shape=grid_dims(bbox_min, bbox_max, resolution) + (3,))
+            resample_to_grid(sample_func, bbox_min, bbox_max, resolution, out=out)
+            out.flush()
+            del out
+            os.replace(tmp_path, path)
+            values = np.load(path, mmap_mode='r')
+            prune_grid_files(keep=(key,))
+        except OSError as e:
+            print(f"Resampled grid: could not write {path}, keeping the grid in memory: {e}")
+            values = resample_to_grid(sample_func, bbox_min, bbox_max, resolution)
+    field = GridVectorField(bbox_min, bbox_max, values)
+    _GRID_CACHE[key] = field
+    while len(_GRID_CACHE) > _MAX_OPEN_GRIDS:
+        _GRID_CACHE.popitem(last=False)
+    return field
+
+
+def prune_grid_files(max_files: int = _MAX_GRID_FILES, max_bytes: int = _MAX_GRID_BYTES, keep=()) -> None:
+    """Delete the least recently used grid files until the cache directory is within both limits.
+
+    Files of open grids and of the keys in `keep` are never deleted.
+    """
+    directory = grid_cache_dir()
+    if not os.path.isdir(directory):
+        return
+    protected = set(_GRID_CACHE) | set(keep)
+    entries = []
+    for name in os.listdir(directory):
+        if not name.endswith(".npy"):
+            continue
+        try:
+            stat = os.stat(os.path.join(directory, name))
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, name))
+    entries.sort()
+    count = len(entries)
+    total = sum(size for _, size, _ in entries)
+    for _, size, name in entries:
+        if count <= max_files and total <= max_bytes:
+            break
+        if name[:-len(".npy")] in protected:
+            continue
+        try:
+            os.remove(os.path.join(directory, name))
+        except OSError:
+            continue
+        count -= 1
+        total -= size
+
+
+def clear_grid_field_cache(remove_files: bool = False) -> None:
+    """Close every open grid; optionally delete this process's grid files, including unfinished ones, as well."""
+    _GRID_CACHE.clear()
+    if remove_files:
+        directory = grid_cache_dir()
+        if os.path.isdir(directory):
+            for name in os.listdir(directory):
+                if name.endswith((".npy", ".npy.tmp")):
+                    try:
+                        os.remove(os.path.join(directory, name))
+                    except OSError:
+                        pass
+            try:
+                os.rmdir(directory)
+            except OSError:
+                pass
+
+
+@persistent
+def grid_field_load_post_handler(*_args) -> None:
+    """Close the grids of the previous file when a .blend file is loaded and bound the files left behind."""
+    _GRID_CACHE.clear()
+    prune_grid_files()
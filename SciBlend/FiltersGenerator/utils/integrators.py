@@ -1,3 +1,4 @@
+import numpy as np
 from mathutils import Vector
 
 
@@ -30,4 +31,180 @@ def integrate_streamline(start: Vector, step_size: float, max_steps: int, min_ve
             break
         points.append(next_pos)
         pos = next_pos
-    return points 
\ No newline at end of file
+    return points
+
+
+def rk4_step_batch(pos: np.ndarray, h: float, field_func, k1: np.ndarray = None) -> np.ndarray:
+    """Advance (N, 3) positions one RK4 step; `field_func` maps (N, 3) positions to (N, 3) vectors."""
+    if k1 is None:
+        k1 = field_func(pos)
+    k2 = field_func(pos + (h * 0.5) * k1)
+    k3 = field_func(pos + (h * 0.5) * k2)
+    k4 = field_func(pos + h * k3)
+    return pos + (h / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+
+
+def _split_paths(num_seeds: int, step_ids: list, step_points: list) -> list:
+    """Group per-step (seed ids, positions) records into one (M, 3) array per seed, in step order."""
+    ids = np.concatenate(step_ids)
+    points = np.concatenate(step_points)
+    order = np.argsort(ids, kind='stable')
+    counts = np.bincount(ids, minlength=num_seeds)
+    return np.split(points[order], np.cumsum(counts)[:-1])
+
+
+def integrate_streamlines(seeds, step_size: float, max_steps: int, min_vel: float,
+                          max_length: float, field_func, inside_domain) -> list:
+    """Integrate all seeds together with RK4; same stopping rules as integrate_streamline.
+
+    `field_func` maps (N, 3) positions to (N, 3) vectors and `inside_domain` maps them to an (N,) bool mask.
+    Only live seeds are evaluated each step. Returns one (M, 3) array per seed, starting at the seed.
+    """
+    pos = np.array(seeds, dtype=np.float64).reshape(-1, 3)
+    num = pos.shape[0]
+    alive = np.arange(num)
+    length = np.zeros(num)
+    step_ids = [alive.copy()]
+    step_points = [pos.copy()]
+    for _ in range(max_steps):
+        if alive.shape[0] == 0:
+            break
+        current = pos[alive]
+        v = field_func(current)
+        moving = np.linalg.norm(v, axis=1) >= min_vel
+        alive, current, v = alive[moving], current[moving], v[moving]
+        if alive.shape[0] == 0:
+            break
+        next_pos = rk4_step_batch(current, step_size, field_func, k1=v)
+        length[alive] += np.linalg.norm(next_pos - current, axis=1)
+        step_ids.append(alive)
+        step_points.append(next_pos)
+        pos[alive] = next_pos
+        stop = (max_length > 0.0) & (length[alive] >= max_length)
+        stop |= ~inside_domain(next_pos)
+        alive = alive[~stop]
+    return _split_paths(num, step_ids, step_points)
+
+
+# Dormand-Prince 5(4) tableau: stage nodes are implied by the rows; B5 is also the last stage row (FSAL)
+_DP_A = (
+    (),
+    (1.0 / 5.0,),
+    (3.0 / 40.0, 9.0 / 40.0),
+    (44.0 / 45.0, -56.0 / 15.0, 32.0 / 9.0),
+    (19372.0 / 6561.0, -25360.0 / 2187.0, 64448.0 / 6561.0, -212.0 / 729.0),
+    (9017.0 / 3168.0, -355.0 / 33.0, 46732.0 / 5247.0, 49.0 / 176.0, -5103.0 / 18656.0),
+)
+_DP_B5 = (35.0 / 384.0, 0.0, 500.0 / 1113.0, 125.0 / 192.0, -2187.0 / 6784.0, 11.0 / 84.0)
+# Difference between the 5th and embedded 4th order weights, over all seven stages
+_DP_E = (71.0 / 57600.0, 0.0, -71.0 / 16695.0, 71.0 / 1920.0, -17253.0 / 339200.0, 22.0 / 525.0, -1.0 / 40.0)
+# Default largest adaptive step as a multiple of the initial step, so curved lines keep enough points
+ADAPTIVE_MAX_STEP_FACTOR = 4.0
+# Step attempts allowed per accepted step, bounding the rejections a seed can spend
+_MAX_ATTEMPTS_PER_STEP = 16
+
+
+def dopri5_step_batch(pos: np.ndarray, h: np.ndarray, field_func, k1: np.ndarray) -> tuple:
+    """Take one Dormand-Prince step of per-row size h (N,) from (N, 3) positions whose field is k1.
+
+    Returns (new positions, field at the new positions, error estimate length per row). The returned field is
+    the first stage of the next step.
+    """
+    h = np.asarray(h, dtype=np.float64).reshape(-1, 1)
+    stages = [k1]
+    for row in _DP_A[1:]:
+        offset = sum(a * k for a, k in zip(row, stages) if a != 0.0)
+        stages.append(field_func(pos + h * offset))
+    new_pos = pos + h * sum(b * k for b, k in zip(_DP_B5, stages) if b != 0.0)
+    k7 = field_func(new_pos)
+    stages.append(k7)
+    error = h * sum(e * k for e, k in zip(_DP_E, stages) if e != 0.0)
+    return new_pos, k7, np.linalg.norm(error, axis=1)
+
+
+def integrate_streamlines_adaptive(seeds, step_size: float, max_steps: int, min_vel: float,
+                                   max_length: float, field_func, inside_domain,
+                                   tolerance: float = 1e-3, min_step: float = 1e-4, max_step: float = None) -> list:
+    """Integrate all seeds together with adaptive Dormand-Prince RK45; same arguments and result as
+    integrate_streamlines plus error control.
+
+    `step_size` is the initial step. Each seed keeps its own step, which grows where the local error estimate
+    is below `tolerance` (world units per step) and shrinks, rejecting the step, where it is above. Steps stay
+    within [min_step, max_step], where max_step defaults to ADAPTIVE_MAX_STEP_FACTOR times `step_size`; a step
+    already at min_step is always accepted. The field at the end of an accepted step is reused as the first stage
+    of the next one, so a step costs six evaluations. `max_steps` bounds accepted steps per seed, and a seed
+    stops at its last accepted point when the field turns non-finite or its attempts run out.
+    """
+    pos = np.array(seeds, dtype=np.float64).reshape(-1, 3)
+    num = pos.shape[0]
+    min_step = max(1e-12, float(min_step))
+    if max_step is None:
+        max_step = ADAPTIVE_MAX_STEP_FACTOR * float(step_size)
+    max_step = max(min_step, float(max_step))
+    tolerance = max(1e-12, float(tolerance))
+    h = np.full(num, min(max(float(step_size), min_step), max_step))
+    length = np.zeros(num)
+    steps = np.zeros(num, dtype=np.int64)
+    attempts = np.zeros(num, dtype=np.int64)
+    max_attempts = _MAX_ATTEMPTS_PER_STEP * max(0, int(max_steps))
+    step_ids = [np.arange(num)]
+    step_points = [pos.copy()]
+    k1 = np.zeros((num, 3))
+    if num > 0:
+        k1[:] = field_func(pos)
+    moving = np.isfinite(k1).all(axis=1) & (np.linalg.norm(k1, axis=1) >= min_vel)
+    alive = np.arange(num)[moving & (max_steps > 0)]
+    while alive.shape[0] > 0:
+        current = pos[alive]
+        new_pos, k7, error = dopri5_step_batch(current, h[alive], field_func, k1[alive])
+        attempts[alive] += 1
+        # A NaN or infinite field would never pass the error test and would drive the step to NaN
+        broken = ~(np.isfinite(error) & np.isfinite(k7).all(axis=1))
+        ratio = np.where(broken, 0.0, error / tolerance)
+        accept = ~broken & ((ratio <= 1.0) | (h[alive] <= min_step * (1.0 + 1e-9)))
+        # Standard controller: safety 0.9, growth limited to [0.2, 5] per attempt
+        with np.errstate(divide='ignore'):
+            factor = np.clip(0.9 * np.power(np.maximum(ratio, 1e-10), -0.2), 0.2, 5.0)
+        factor[~accept] = np.minimum(factor[~accept], 1.0)
+        h[alive] = np.clip(h[alive] * factor, min_step, max_step)
+        finished = np.zeros(num, dtype=bool)
+        finished[alive[broken | (attempts[alive] >= max_attempts)]] = True
+        done = alive[accept]
+        if done.shape[0] > 0:
+            new_pos, k7, current = new_pos[accept], k7[accept], current[accept]
+            length[done] += np.linalg.norm(new_pos - current, axis=1)
+            steps[done] += 1
+            step_ids.append(done)
+            step_points.append(new_pos)
+            pos[done] = new_pos
+            k1[done] = k7
+            stop = (max_length > 0.0) & (length[done] >= max_length)
+            stop |= ~inside_domain(new_pos)
+            stop |= np.linalg.norm(k7, axis=1) < min_vel
+            stop |= steps[done] >= max_steps
+            finished[done[stop]] = True
+        alive = alive[~finished[alive]]
+    return _split_paths(num, step_ids, step_points)
+
+
+def advect_particles(pos: np.ndarray, duration: float, substeps: int, field_func) -> np.ndarray:
+    """Advance (N, 3) particle positions through an unsteady field over `duration` with RK4 substeps.
+
+    `field_func(positions, alpha)` returns (N, 3) velocities at the fraction `alpha` in [0, 1] of the interval, so
+    the caller can blend the fields of the two frames bracketing it.
+    """
+    pos = np.array(pos, dtype=np.float64).reshape(-1, 3)
+    substeps = max(1, int(substeps))
+    h = float(duration) / substeps
+    if pos.shape[0] == 0 or h == 0.0:
+        return pos
+    for i in range(substeps):
+        a0 = i / substeps
+        a_mid = (i + 0.5) / substeps
+        a1 = (i + 1) / substeps
+        k1 = field_func(pos, a0)
+        k2 = field_func(pos + (h * 0.5) * k1, a_mid)
+        k3 = field_func(pos + (h * 0.5) * k2, a_mid)
+        k4 = field_func(pos + h * k3, a1)
+        pos = pos + (h / 6.0) * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+    return pos
@@ -1,21 +1,31 @@
 """Attribute interpolation and smoothing utilities for creating derived scalar attributes.
 
 Provides multiple methods:
-- Nearest Neighbor Smoothing (kdtree-based) - replaces with nearest neighbor's value
-- Inverse Distance Weighting Smoothing (kdtree-based) - weighted average of neighbors
+- Nearest Neighbor Smoothing (batched grid kNN) - replaces with nearest neighbor's value
+- Inverse Distance Weighting Smoothing (batched grid kNN) - weighted average of neighbors
 - Shepard Interpolation (VTK-based) - global smooth interpolation
 - Laplacian Smoothing - topology-based averaging
 """
 
 import bpy
+import numpy as np
 from mathutils import Vector, kdtree
 from typing import List, Tuple, Optional
 import logging
+from .point_grid import PointGrid
+from .mesh_buffers import world_points
 
 logger = logging.getLogger(__name__)
 
+# Vertices queried per kNN batch, bounding the (batch, k) neighbour arrays
+_QUERY_CHUNK = 1 << 18
 
-def get_attribute_values(obj: bpy.types.Object, attribute_name: str) -> Tuple[List[float], str]:
+# Edge adjacency per mesh name: (topology key, adjacency), least recently used first
+_ADJACENCY_CACHE = {}
+_MAX_CACHED_ADJACENCY = 4
+
+
+def get_attribute_values(obj: bpy.types.Object, attribute_name: str) -> Tuple[np.ndarray, str]:
     """Extract scalar values from a mesh attribute.
     
     Parameters
@@ -27,8 +37,8 @@ def get_attribute_values(obj: bpy.types.Object, attribute_name: str) -> Tuple[Li
         
     Returns
     -------
-    Tuple[List[float], str]
-        (values list, data_type string)
+    Tuple[np.ndarray, str]
+        (float64 values array, data_type string); vector attributes give their lengths
     """
     if obj.type != 'MESH':
         raise ValueError("Object must be a mesh")
@@ -45,13 +55,19 @@ def get_attribute_values(obj: bpy.types.Object, attribute_name: str) -> Tuple[Li
     if domain not in {'POINT', 'VERTEX'}:
         raise ValueError(f"Attribute must be on POINT/VERTEX domain, got: {domain}")
     
-    values = []
+    count = len(attr.data)
     if data_type == 'FLOAT':
-        values = [d.value for d in attr.data]
+        buf = np.empty(count, dtype=np.float32)
+        attr.data.foreach_get('value', buf)
+        values = buf.astype(np.float64)
     elif data_type == 'FLOAT_VECTOR':
-        values = [Vector(d.vector).length for d in attr.data]
+        buf = np.empty(count * 3, dtype=np.float32)
+        attr.data.foreach_get('vector', buf)
+        values = np.linalg.norm(buf.reshape(-1, 3).astype(np.float64), axis=1)
     elif data_type in {'INT', 'INT8', 'INT32'}:
-        values = [float(d.value) for d in attr.data]
+        buf = np.empty(count, dtype=np.int32)
+        attr.data.foreach_get('value', buf)
+        values = buf.astype(np.float64)
     else:
         raise ValueError(f"Unsupported attribute type: {data_type}")
     
@@ -81,11 +97,37 @@ def build_kdtree(obj: bpy.types.Object) -> Tuple[kdtree.KDTree, List[Vector]]:
     return tree, positions
 
 
+def build_point_grid(obj: bpy.types.Object) -> Tuple[PointGrid, np.ndarray]:
+    """Build a bucket grid over the world-space vertices for batched kNN queries.
+    
+    Returns
+    -------
+    Tuple[PointGrid, np.ndarray]
+        (grid, (N, 3) world positions)
+    """
+    positions = world_points(obj)
+    return PointGrid(positions), positions
+
+
+def _neighbor_chunks(obj: bpy.types.Object, k: int):
+    """Yield (vertex ids, neighbour indices, distances) for consecutive batches of vertices.
+    
+    Each batch is one grid query of its vertices against all vertices; neighbour rows are sorted by
+    distance and padded with -1 / inf when the mesh has fewer than k vertices. Vertices are batched in
+    grid bucket order, so every batch covers a compact region and touches few buckets.
+    """
+    grid, positions = build_point_grid(obj)
+    for start in range(0, positions.shape[0], _QUERY_CHUNK):
+        rows = grid.order[start:start + _QUERY_CHUNK]
+        idx, dist = grid.query(positions[rows], k)
+        yield rows, idx, dist
+
+
 def smooth_nearest_neighbor(
     obj: bpy.types.Object,
     attribute_name: str,
     k_neighbors: int = 1
-) -> List[float]:
+) -> np.ndarray:
     """Nearest neighbor smoothing - replace each value with the k-th nearest neighbor's value.
     
     This excludes the vertex itself, so k=1 means the closest OTHER vertex.
@@ -101,28 +143,21 @@ def smooth_nearest_neighbor(
         
     Returns
     -------
-    List[float]
+    np.ndarray
         Smoothed values.
     """
     values, _ = get_attribute_values(obj, attribute_name)
-    tree, positions = build_kdtree(obj)
-    
-    results = []
-    # We need k_neighbors + 1 because the first result is the vertex itself
+    results = values.copy()
+    # We need k_neighbors + 1 because one of the results is the vertex itself
     k = k_neighbors + 1
     
-    for i, pos in enumerate(positions):
-        neighbors = tree.find_n(pos, k)
-        # Skip self (index 0 in results, which is the query point itself)
-        other_neighbors = [(co, idx, dist) for co, idx, dist in neighbors if idx != i]
-        
-        if other_neighbors and len(other_neighbors) >= k_neighbors:
-            # Get the k-th neighbor (0-indexed, so k_neighbors-1)
-            _, neighbor_idx, _ = other_neighbors[min(k_neighbors - 1, len(other_neighbors) - 1)]
-            results.append(values[neighbor_idx])
-        else:
-            # Fallback to original value
-            results.append(values[i])
+    for rows, idx, _ in _neighbor_chunks(obj, k):
+        other = (idx >= 0) & (idx != rows[:, None])
+        # Position of the k-th other neighbour in each row; rows with fewer keep their own value
+        hit = other & (np.cumsum(other, axis=1) == k_neighbors)
+        found = hit.any(axis=1)
+        picked = idx[found, np.argmax(hit[found], axis=1)]
+        results[rows[found]] = values[picked]
     
     return results
 
@@ -133,7 +168,7 @@ def smooth_idw(
     k_neighbors: int = 8,
     power: float = 2.0,
     include_self: bool = False
-) -> List[float]:
+) -> np.ndarray:
     """Inverse Distance Weighting smoothing - weighted average of neighbor values.
     
     Parameters
@@ -151,51 +186,83 @@ def smooth_idw(
         
     Returns
     -------
-    List[float]
+    np.ndarray
         Smoothed values.
     """
     values, _ = get_attribute_values(obj, attribute_name)
-    tree, positions = build_kdtree(obj)
-    
-    results = []
+    results = values.copy()
     # Request extra neighbors to account for excluding self
     k = k_neighbors + (0 if include_self else 1)
     
-    for i, pos in enumerate(positions):
-        neighbors = tree.find_n(pos, k)
-        
-        weighted_sum = 0.0
-        total_weight = 0.0
-        
-        for co, idx, dist in neighbors:
-            if not include_self and idx == i:
-                continue
-            
-            if dist < 1e-10:
-                # Very close point - give it high weight but not infinite
-                weight = 1e10
-            else:
-                weight = 1.0 / (dist ** power)
-            
-            weighted_sum += values[idx] * weight
-            total_weight += weight
-        
-        if total_weight > 0:
-            results.append(weighted_sum / total_weight)
-        else:
-            results.append(values[i])
+    for rows, idx, dist in _neighbor_chunks(obj, k):
+        use = idx >= 0
+        if not include_self:
+            use &= idx != rows[:, None]
+        # Very close points get a high but finite weight
+        weight = np.where(dist < 1e-10, 1e10, 1.0 / np.maximum(dist, 1e-10) ** power)
+        weight[~use] = 0.0
+        total = weight.sum(axis=1)
+        weighted = (weight * values[np.maximum(idx, 0)]).sum(axis=1)
+        ok = total > 0
+        results[rows[ok]] = weighted[ok] / total[ok]
     
     return results
 
 
+def vertex_adjacency(mesh: bpy.types.Mesh) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Edge adjacency of a mesh in CSR order, built once per topology.
+    
+    The result is cached under the mesh name and rebuilt only when the vertex count or the edge array
+    changes, so repeated smoothing runs and different attributes of the same mesh share it.
+    
+    Parameters
+    ----------
+    mesh : bpy.types.Mesh
+        Mesh data.
+        
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        (row, neighbor, inverse degree): row and neighbor list every directed edge sorted by row, inverse
+        degree is 1 / neighbor count per vertex (0 for vertices without edges)
+    """
+    num_verts = len(mesh.vertices)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get('vertices', edges)
+    key = (num_verts, edges.shape[0], hash(edges.tobytes()))
+    entry = _ADJACENCY_CACHE.pop(mesh.name, None)
+    if entry is not None and entry[0] == key:
+        adjacency = entry[1]
+    else:
+        edges = edges.reshape(-1, 2).astype(np.int64)
+        # Every edge links both ways; duplicate edges count once per copy, as in per-vertex neighbour lists
+        source = np.concatenate([edges[:, 0], edges[:, 1]])
+        target = np.concatenate([edges[:, 1], edges[:, 0]])
+        order = np.argsort(source, kind='stable')
+        degree = np.bincount(source, minlength=num_verts).astype(np.float64)
+        inverse_degree = np.divide(1.0, degree, out=np.zeros(num_verts), where=degree > 0)
+        adjacency = (source[order], target[order], inverse_degree)
+    # Re-inserted last, so the oldest entry is first in line for eviction
+    _ADJACENCY_CACHE[mesh.name] = (key, adjacency)
+    while len(_ADJACENCY_CACHE) > _MAX_CACHED_ADJACENCY:
+        _ADJACENCY_CACHE.pop(next(iter(_ADJACENCY_CACHE)))
+    return adjacency
+
+
+def clear_adjacency_cache() -> None:
+    _ADJACENCY_CACHE.clear()
+
+
 def smooth_laplacian(
     obj: bpy.types.Object,
     attribute_name: str,
     iterations: int = 1,
     factor: float = 0.5
-) -> List[float]:
+) -> np.ndarray:
     """Laplacian smoothing based on mesh topology (connected vertices).
     
+    Each iteration is one sparse product of the degree-normalized adjacency with the current values.
+    
     Parameters
     ----------
     obj : bpy.types.Object
@@ -209,35 +276,20 @@ def smooth_laplacian(
         
     Returns
     -------
-    List[float]
+    np.ndarray
         Smoothed values.
     """
     values, _ = get_attribute_values(obj, attribute_name)
-    mesh = obj.data
-    
-    # Build adjacency from edges
-    num_verts = len(mesh.vertices)
-    adjacency = [[] for _ in range(num_verts)]
+    row, neighbor, inverse_degree = vertex_adjacency(obj.data)
+    # Vertices without edges keep their value
+    connected = inverse_degree > 0
     
-    for edge in mesh.edges:
-        v0, v1 = edge.vertices
-        adjacency[v0].append(v1)
-        adjacency[v1].append(v0)
-    
-    current = values[:]
+    current = values.copy()
     
     for _ in range(iterations):
-        new_values = []
-        for i in range(num_verts):
-            neighbors = adjacency[i]
-            if neighbors:
-                avg = sum(current[n] for n in neighbors) / len(neighbors)
-                # Blend between original and average
-                new_val = current[i] * (1 - factor) + avg * factor
-                new_values.append(new_val)
-            else:
-                new_values.append(current[i])
-        current = new_values
+        avg = np.bincount(row, weights=current[neighbor], minlength=current.shape[0]) * inverse_degree
+        # Blend between original and average
+        current[connected] = current[connected] * (1 - factor) + avg[connected] * factor
     
     return current
 
@@ -247,7 +299,7 @@ def smooth_gaussian(
     attribute_name: str,
     k_neighbors: int = 8,
     sigma: float = 1.0
-) -> List[float]:
+) -> np.ndarray:
     """Gaussian smoothing - weighted average with gaussian kernel.
     
     Parameters
@@ -263,33 +315,20 @@ def smooth_gaussian(
         
     Returns
     -------
-    List[float]
+    np.ndarray
         Smoothed values.
     """
-    import math
-    
     values, _ = get_attribute_values(obj, attribute_name)
-    tree, positions = build_kdtree(obj)
-    
-    results = []
+    results = values.copy()
     k = k_neighbors + 1  # +1 to include self in neighborhood
     
-    for i, pos in enumerate(positions):
-        neighbors = tree.find_n(pos, k)
-        
-        weighted_sum = 0.0
-        total_weight = 0.0
-        
-        for co, idx, dist in neighbors:
-            # Gaussian weight: exp(-d²/(2σ²))
-            weight = math.exp(-(dist ** 2) / (2 * sigma ** 2))
-            weighted_sum += values[idx] * weight
-            total_weight += weight
-        
-        if total_weight > 0:
-            results.append(weighted_sum / total_weight)
-        else:
-            results.append(values[i])
+    for rows, idx, dist in _neighbor_chunks(obj, k):
+        # Gaussian weight: exp(-d²/(2σ²)); padding entries have infinite distance and weigh nothing
+        weight = np.exp(-(dist ** 2) / (2 * sigma ** 2))
+        total = weight.sum(axis=1)
+        weighted = (weight * values[np.maximum(idx, 0)]).sum(axis=1)
+        ok = total > 0
+        results[rows[ok]] = weighted[ok] / total[ok]
     
     return results
 
@@ -434,7 +473,7 @@ def write_attribute_to_mesh(
         
         expected_len = len(mesh.vertices) if domain == 'POINT' else len(mesh.polygons)
         if len(values) == expected_len:
-            new_attr.data.foreach_set('value', values)
+            new_attr.data.foreach_set('value', np.ascontiguousarray(values, dtype=np.float32))
         else:
             logger.warning(f"Value count mismatch: {len(values)} vs {expected_len}")
             for i, val in enumerate(values[:len(new_attr.data)]):
@@ -449,8 +488,11 @@ def write_attribute_to_mesh(
 __all__ = [
     'get_attribute_values',
     'build_kdtree',
+    'build_point_grid',
     'smooth_nearest_neighbor',
     'smooth_idw',
+    'vertex_adjacency',
+    'clear_adjacency_cache',
     'smooth_laplacian',
     'smooth_gaussian',
     'interpolate_shepard_vtk',
@@ -0,0 +1,290 @@
+import numpy as np
+from typing import Optional
+from ...operators.utils.volume_mesh_data import VolumeMeshArrays, csr_gather
+
+# Tetrahedron edges as pairs of local vertex indices
+TET_EDGES = np.array([[0, 1], [0, 2], [0, 3], [1, 2], [1, 3], [2, 3]], dtype=np.int64)
+
+# Marching-tetrahedra cases: bit i is set when local vertex i lies above the iso value. Each case lists up to two
+# triangles as tet edge indices, -1 pads unused slots. Complementary cases cut the same edges.
+_TRIS_V0 = ((0, 1, 2), (-1, -1, -1))
+_TRIS_V1 = ((0, 3, 4), (-1, -1, -1))
+_TRIS_V2 = ((1, 3, 5), (-1, -1, -1))
+_TRIS_V3 = ((2, 4, 5), (-1, -1, -1))
+_TRIS_V01 = ((1, 3, 4), (1, 4, 2))
+_TRIS_V02 = ((0, 3, 5), (0, 5, 2))
+_TRIS_V12 = ((0, 1, 5), (0, 5, 4))
+_TRIS_NONE = ((-1, -1, -1), (-1, -1, -1))
+TET_TRIANGLES = np.array([
+	_TRIS_NONE, _TRIS_V0, _TRIS_V1, _TRIS_V01,
+	_TRIS_V2, _TRIS_V02, _TRIS_V12, _TRIS_V3,
+	_TRIS_V3, _TRIS_V12, _TRIS_V02, _TRIS_V2,
+	_TRIS_V01, _TRIS_V1, _TRIS_V0, _TRIS_NONE,
+], dtype=np.int64)
+
+_CASE_BITS = np.array([1, 2, 4, 8], dtype=np.int64)
+_SNAP_EPS = 1e-9
+
+
+def cell_value_range(arrays: VolumeMeshArrays, point_values: np.ndarray, cell_values: Optional[np.ndarray] = None) -> tuple:
+	"""Return per-cell (min, max) of the point values of each cell, widened by the cell value when given."""
+	offsets, pts = arrays.cell_points()
+	lo = np.full(arrays.num_cells, np.nan, dtype=np.float64)
+	hi = np.full(arrays.num_cells, np.nan, dtype=np.float64)
+	nonempty = np.diff(offsets) > 0
+	if nonempty.any():
+		gathered = point_values[pts]
+		starts = offsets[:-1][nonempty]
+		lo[nonempty] = np.fmin.reduceat(gathered, starts)
+		hi[nonempty] = np.fmax.reduceat(gathered, starts)
+	if cell_values is not None:
+		lo = np.fmin(lo, cell_values)
+		hi = np.fmax(hi, cell_values)
+	return lo, hi
+
+
+class TetDecomposition:
+	"""Cells split into tetrahedra: each face is fanned from its first vertex and joined to the cell centroid.
+
+	A shared face is fanned identically from both of its cells, so surfaces cut from neighbouring cells meet edge
+	to edge. Centroids are appended after the model points, one per decomposed cell.
+	"""
+
+	def __init__(self, arrays: VolumeMeshArrays, cells: np.ndarray):
+		offsets, pts = arrays.cell_points()
+		cells = np.asarray(cells, dtype=np.int64)
+		cells = cells[np.diff(offsets)[cells] > 0]
+		self.cells = cells
+		self.num_points = arrays.num_points
+		self._cp_offsets, self._cp = csr_gather(offsets, pts, cells)
+		points = np.asarray(arrays.points, dtype=np.float64)
+		self.points = np.concatenate((points, self._cell_mean(points)))
+
+		face_offsets, faces = csr_gather(arrays.cell_face_offsets, arrays.cell_faces, cells)
+		face_cell = np.repeat(np.arange(cells.shape[0], dtype=np.int64), np.diff(face_offsets))
+		poly_offsets, poly = csr_gather(arrays.face_offsets, arrays.face_vertices, faces)
+		tri_count = np.maximum(np.diff(poly_offsets) - 2, 0)
+		tri_face = np.repeat(np.arange(faces.shape[0], dtype=np.int64), tri_count)
+		tri_first = np.cumsum(tri_count) - tri_count
+		fan = np.arange(tri_face.shape[0], dtype=np.int64) - tri_first[tri_face] + 1
+		base = poly_offsets[:-1][tri_face]
+		self.tets = np.stack((poly[base], poly[base + fan], poly[base + fan + 1], self.num_points + face_cell[tri_face]), axis=1)
+		self.tet_cells = cells[face_cell[tri_face]]
+
+	def _cell_mean(self, values: np.ndarray) -> np.ndarray:
+		if self.cells.shape[0] == 0:
+			return np.zeros((0,) + values.shape[1:], dtype=np.float64)
+		gathered = values[self._cp]
+		starts = self._cp_offsets[:-1]
+		if gathered.ndim > 1:
+			return np.add.reduceat(gathered, starts, axis=0) / np.diff(self._cp_offsets)[:, None]
+		valid = ~np.isnan(gathered)
+		sums = np.add.reduceat(np.where(valid, gathered, 0.0), starts)
+		counts = np.add.reduceat(valid.astype(np.int64), starts)
+		with np.errstate(invalid='ignore', divide='ignore'):
+			return np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+
+	def extend(self, point_values: np.ndarray, cell_values: Optional[np.ndarray] = None) -> np.ndarray:
+		"""Extend model point values with centroid values: the cell value when given, else the mean of the cell's points."""
+		point_values = np.asarray(point_values, dtype=np.float64)
+		centroid = cell_values[self.cells] if cell_values is not None else self._cell_mean(point_values)
+		return np.concatenate((point_values, np.asarray(centroid, dtype=np.float64)))
+
+
+def cells_crossing_levels(lo: np.ndarray, hi: np.ndarray, levels: np.ndarray) -> np.ndarray:
+	"""Return the cells whose value range [lo, hi) contains at least one of the levels."""
+	levels = np.sort(np.asarray(levels, dtype=np.float64))
+	if levels.shape[0] == 0:
+		return np.zeros(0, dtype=np.int64)
+	valid = ~(np.isnan(lo) | np.isnan(hi))
+	first = np.searchsorted(levels, np.where(valid, lo, np.inf), side='left')
+	nearest = levels[np.minimum(first, levels.shape[0] - 1)]
+	return np.flatnonzero(valid & (first < levels.shape[0]) & (nearest < hi))
+
+
+def _dedupe_keys(keys: np.ndarray) -> tuple:
+	"""Return (index of the first occurrence of each distinct key, inverse map) using one stable sort."""
+	order = np.argsort(keys, kind='stable')
+	sorted_keys = keys[order]
+	is_new = np.empty(sorted_keys.shape[0], dtype=bool)
+	is_new[:1] = True
+	is_new[1:] = sorted_keys[1:] != sorted_keys[:-1]
+	inverse = np.empty(keys.shape[0], dtype=np.int64)
+	inverse[order] = np.cumsum(is_new) - 1
+	return order[is_new], inverse
+
+
+def _empty_surface(attributes: dict) -> tuple:
+	return np.zeros((0, 3)), np.zeros((0, 3), dtype=np.int64), np.zeros(0, dtype=np.int64), {name: np.zeros(0) for name in attributes}
+
+
+def _contour_tets(decomp: TetDecomposition, values: np.ndarray, tet_ids: np.ndarray, tet_values: np.ndarray, iso_value: float, attributes: dict) -> tuple:
+	above = tet_values > iso_value
+	case = above.astype(np.int64) @ _CASE_BITS
+	case[np.isnan(tet_values.sum(axis=1))] = 0
+	tri_edges = TET_TRIANGLES[case]
+	local, slot = np.nonzero(tri_edges[:, :, 0] >= 0)
+	if local.shape[0] == 0:
+		return _empty_surface(attributes)
+	edges = tri_edges[local, slot]
+	corners = decomp.tets[tet_ids[local]]
+	rows = np.arange(local.shape[0])[:, None]
+	a = corners[rows, TET_EDGES[edges, 0]]
+	b = corners[rows, TET_EDGES[edges, 1]]
+	lo = np.minimum(a, b).ravel()
+	hi = np.maximum(a, b).ravel()
+	t = (iso_value - values[lo]) / (values[hi] - values[lo])
+	hi[t <= _SNAP_EPS] = lo[t <= _SNAP_EPS]
+	lo[t >= 1.0 - _SNAP_EPS] = hi[t >= 1.0 - _SNAP_EPS]
+	t[lo == hi] = 0.0
+
+	first, inverse = _dedupe_keys(lo * np.int64(values.shape[0]) + hi)
+	vlo, vhi, vt = lo[first], hi[first], t[first]
+	points = decomp.points[vlo] + vt[:, None] * (decomp.points[vhi] - decomp.points[vlo])
+	out_attributes = {name: vals[vlo] + vt * (vals[vhi] - vals[vlo]) for name, vals in attributes.items()}
+
+	tris = inverse.reshape(-1, 3)
+	keep = (tris[:, 0] != tris[:, 1]) & (tris[:, 1] != tris[:, 2]) & (tris[:, 0] != tris[:, 2])
+	tris = tris[keep]
+	local = local[keep]
+	# The cut separates every above corner from every below corner, so one pair of them orients the triangle
+	up = above[local]
+	cut_corners = decomp.tets[tet_ids[local]]
+	rows = np.arange(local.shape[0])
+	rise = decomp.points[cut_corners[rows, up.argmax(axis=1)]] - decomp.points[cut_corners[rows, up.argmin(axis=1)]]
+	normals = np.cross(points[tris[:, 1]] - points[tris[:, 0]], points[tris[:, 2]] - points[tris[:, 0]])
+	flip = (normals * rise).sum(axis=1) > 0.0
+	tris[flip] = tris[flip][:, ::-1]
+	return points, tris, decomp.tet_cells[tet_ids[local]], out_attributes
+
+
+def extract_isosurface(decomp: TetDecomposition, values: np.ndarray, iso_value: float, attributes: Optional[dict] = None) -> tuple:
+	"""Contour extended point values at `iso_value` with marching tetrahedra in one vectorized pass.
+
+	`values` and the optional `attributes` (name -> values) are indexed like `decomp.points`. Crossing edges are
+	keyed by their sorted endpoint ids, so each edge yields one shared vertex; hits within rounding of a vertex are
+	snapped onto it. Triangles face towards decreasing values. Returns (points, triangles (M, 3), source cell per
+	triangle, interpolated attributes).
+	"""
+	attributes = attributes or {}
+	if decomp.tets.shape[0] == 0:
+		return _empty_surface(attributes)
+	tet_ids = np.arange(decomp.tets.shape[0], dtype=np.int64)
+	return _contour_tets(decomp, values, tet_ids, values[decomp.tets], float(iso_value), attributes)
+
+
+def extract_isosurfaces(decomp: TetDecomposition, values: np.ndarray, levels, attributes: Optional[dict] = None) -> list:
+	"""Contour several iso values over one decomposition, returning one extract_isosurface result per level.
+
+	Corner values are gathered once. Each tet's range [min, max) is located in the sorted levels with two
+	searchsorted calls, and one stable sort groups the (tet, level) pairs, so a level only classifies the tets
+	it actually cuts.
+	"""
+	attributes = attributes or {}
+	levels = np.asarray(levels, dtype=np.float64)
+	if decomp.tets.shape[0] == 0 or levels.shape[0] == 0:
+		return [_empty_surface(attributes) for _ in levels]
+	tet_values = values[decomp.tets]
+	columns = tet_values.T
+	tet_min = np.minimum(np.minimum(columns[0], columns[1]), np.minimum(columns[2], columns[3]))
+	tet_max = np.maximum(np.maximum(columns[0], columns[1]), np.maximum(columns[2], columns[3]))
+	unusable = np.isnan(tet_min)
+	tet_min[unusable] = np.inf
+	tet_max[unusable] = -np.inf
+	level_order = np.argsort(levels, kind='stable')
+	sorted_levels = levels[level_order]
+	first = np.searchsorted(sorted_levels, tet_min, side='left')
+	last = np.maximum(np.searchsorted(sorted_levels, tet_max, side='left'), first)
+	count = last - first
+	pair_tets = np.repeat(np.arange(decomp.tets.shape[0], dtype=np.int64), count)
+	pair_levels = np.arange(pair_tets.shape[0], dtype=np.int64) - np.repeat(np.cumsum(count) - count - first, count)
+	# Level ranks are small integers; a stable sort on a narrow type is a linear radix sort
+	order = np.argsort(pair_levels.astype(np.int32 if levels.shape[0] > 32767 else np.int16), kind='stable')
+	bounds = np.searchsorted(pair_levels[order], np.arange(levels.shape[0] + 1), side='left')
+	results = [None] * levels.shape[0]
+	for rank, index in enumerate(level_order):
+		tet_ids = pair_tets[order[bounds[rank]:bounds[rank + 1]]]
+		if tet_ids.shape[0] == 0:
+			results[index] = _empty_surface(attributes)
+			continue
+		results[index] = _contour_tets(decomp, values, tet_ids, tet_values[tet_ids], float(levels[index]), attributes)
+	return results
+
+
+def local_plane(matrix_world, plane_point, plane_normal) -> tuple:
+	"""Express a world-space plane in an object's space as (normal, offset) with normal . x + offset = signed distance.
+
+	The world transform is folded into the plane instead of transforming every point.
+	"""
+	matrix = np.array(matrix_world, dtype=np.float64).reshape(4, 4)
+	normal = np.asarray(plane_normal, dtype=np.float64)
+	return matrix[:3, :3].T @ normal, float((matrix[:3, 3] - np.asarray(plane_point, dtype=np.float64)) @ normal)
+
+
+def extract_plane_section(arrays: VolumeMeshArrays, distances: np.ndarray, normal: np.ndarray, cells: Optional[np.ndarray] = None, attributes: Optional[dict] = None) -> tuple:
+	"""Cut cells by the zero level of per-point signed distances, one flat polygon per cut cell.
+
+	Crossing edges are found on the faces of the candidate cells, interpolated once per edge (shared by all cells
+	around it) and ordered by angle around each cell's section centre, so every polygon faces along `normal`.
+	`cells` defaults to every cell whose distance range straddles zero. Returns (points, polygon offsets, polygon
+	vertices, cell per polygon, interpolated attributes).
+	"""
+	attributes = attributes or {}
+	empty = (np.zeros((0, 3)), np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), {name: np.zeros(0) for name in attributes})
+	if cells is None:
+		lo, hi = cell_value_range(arrays, distances)
+		cells = np.flatnonzero((lo <= 0.0) & (hi > 0.0))
+	cells = np.asarray(cells, dtype=np.int64)
+	if cells.shape[0] == 0:
+		return empty
+	face_offsets, faces = csr_gather(arrays.cell_face_offsets, arrays.cell_faces, cells)
+	face_cell = np.repeat(np.arange(cells.shape[0], dtype=np.int64), np.diff(face_offsets))
+	poly_offsets, poly = csr_gather(arrays.face_offsets, arrays.face_vertices, faces)
+	sizes = np.diff(poly_offsets)
+	following = np.arange(1, poly.shape[0] + 1, dtype=np.int64)
+	nonempty = sizes > 0
+	following[poly_offsets[1:][nonempty] - 1] = poly_offsets[:-1][nonempty]
+	a = poly
+	b = poly[following]
+	crossing = (distances[a] > 0.0) != (distances[b] > 0.0)
+	if not crossing.any():
+		return empty
+	edge_cell = np.repeat(face_cell, sizes)[crossing]
+	lo = np.minimum(a, b)[crossing]
+	hi = np.maximum(a, b)[crossing]
+	t = (0.0 - distances[lo]) / (distances[hi] - distances[lo])
+	hi[t <= _SNAP_EPS] = lo[t <= _SNAP_EPS]
+	lo[t >= 1.0 - _SNAP_EPS] = hi[t >= 1.0 - _SNAP_EPS]
+	t[lo == hi] = 0.0
+
+	first, vertex = _dedupe_keys(lo * np.int64(arrays.num_points) + hi)
+	vlo, vhi, vt = lo[first], hi[first], t[first]
+	source = np.asarray(arrays.points, dtype=np.float64)
+	points = source[vlo] + vt[:, None] * (source[vhi] - source[vlo])
+	out_attributes = {name: vals[vlo] + vt * (vals[vhi] - vals[vlo]) for name, vals in attributes.items()}
+
+	# Each crossing edge is met by two faces of a cell; keep one corner per (cell, vertex)
+	corner_first, _ = _dedupe_keys(edge_cell * np.int64(first.shape[0]) + vertex)
+	corner_cell = edge_cell[corner_first]
+	corner_vertex = vertex[corner_first]
+	counts = np.bincount(corner_cell, minlength=cells.shape[0])
+	centre = np.stack([np.bincount(corner_cell, weights=points[corner_vertex, k], minlength=cells.shape[0]) for k in range(3)], axis=1)
+	centre /= np.maximum(counts, 1)[:, None]
+	normal = np.asarray(normal, dtype=np.float64)
+	normal = normal / max(float(np.linalg.norm(normal)), 1e-30)
+	u_axis = np.cross(normal, (1.0, 0.0, 0.0) if abs(normal[0]) < 0.9 else (0.0, 1.0, 0.0))
+	u_axis /= np.linalg.norm(u_axis)
+	v_axis = np.cross(normal, u_axis)
+	rel = points[corner_vertex] - centre[corner_cell]
+	angle = np.arctan2(rel @ v_axis, rel @ u_axis)
+	order = np.lexsort((angle, corner_cell))
+	keep_cell = counts >= 3
+	order = order[keep_cell[corner_cell[order]]]
+	polygon_vertices = corner_vertex[order]
+	offsets = np.zeros(int(keep_cell.sum()) + 1, dtype=np.int64)
+	np.cumsum(counts[keep_cell], out=offsets[1:])
+
+	used = np.flatnonzero(np.bincount(polygon_vertices, minlength=points.shape[0]))
+	remap = np.full(points.shape[0], -1, dtype=np.int64)
+	remap[used] = np.arange(used.shape[0], dtype=np.int64)
+	return points[used], offsets, remap[polygon_vertices], cells[keep_cell], {name: vals[used] for name, vals in out_attributes.items()}
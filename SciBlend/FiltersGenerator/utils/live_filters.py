@@ -0,0 +1,96 @@
+import bpy
+import time
+from bpy.app.handlers import persistent
+
+_LIVE_DEBOUNCE_SEC = 0.05
+
+# Filter kind -> scene settings attribute
+_LIVE_FILTERS = {
+	'SLICE': 'filters_slice_settings',
+	'CLIP': 'filters_clip_settings',
+}
+
+_live_timer_running = False
+_live_last_change_time = 0.0
+_live_pending = set()
+_live_updating = False
+_plane_signatures = {}
+
+
+def _plane_signature(settings):
+	plane = getattr(settings, 'plane_object', None)
+	src = getattr(settings, 'target_object', None)
+	if plane is None or src is None:
+		return None
+	try:
+		return (plane.name, src.name, tuple(round(v, 6) for row in plane.matrix_world for v in row), tuple(round(v, 6) for row in src.matrix_world for v in row), getattr(settings, 'side', ''))
+	except Exception:
+		return None
+
+
+def _run_live_update(kind: str, context, settings) -> None:
+	if kind == 'SLICE':
+		from ..operators.slice_live import rebuild_slice_surface_for_settings
+		rebuild_slice_surface_for_settings(context, settings, live=True)
+	elif kind == 'CLIP':
+		from ..operators.clip_live import rebuild_clip_surface_for_settings
+		rebuild_clip_surface_for_settings(context, settings, live=True)
+
+
+def _debounced_live_update():
+	"""Timer callback: rebuild the pending live filters once the plane has stopped changing for the debounce time."""
+	global _live_timer_running, _live_updating
+	if time.monotonic() - _live_last_change_time < _LIVE_DEBOUNCE_SEC:
+		return _LIVE_DEBOUNCE_SEC
+	_live_timer_running = False
+	pending = sorted(_live_pending)
+	_live_pending.clear()
+	scene = getattr(bpy.context, 'scene', None)
+	if scene is None:
+		return None
+	_live_updating = True
+	try:
+		for kind in pending:
+			settings = getattr(scene, _LIVE_FILTERS[kind], None)
+			if settings is None or not getattr(settings, 'live_update', False):
+				continue
+			try:
+				_run_live_update(kind, bpy.context, settings)
+			except Exception as e:
+				print(f"[Filters] Live {kind.lower()} update failed: {e}")
+	finally:
+		_live_updating = False
+	return None
+
+
+def schedule_live_update(kind: str) -> None:
+	"""Queue a debounced live rebuild of one plane filter ('SLICE' or 'CLIP')."""
+	global _live_timer_running, _live_last_change_time
+	_live_pending.add(kind)
+	_live_last_change_time = time.monotonic()
+	if not _live_timer_running:
+		_live_timer_running = True
+		try:
+			bpy.app.timers.register(_debounced_live_update, first_interval=_LIVE_DEBOUNCE_SEC)
+		except Exception:
+			_live_timer_running = False
+
+
+@persistent
+def live_filter_depsgraph_handler(scene, depsgraph=None):
+	"""depsgraph_update_post handler that schedules live slice/clip rebuilds when their plane or domain moves."""
+	if _live_updating or scene is None:
+		return
+	for kind, prop in _LIVE_FILTERS.items():
+		settings = getattr(scene, prop, None)
+		if settings is None or not getattr(settings, 'live_update', False):
+			_plane_signatures.pop(kind, None)
+			continue
+		signature = _plane_signature(settings)
+		if signature is None:
+			continue
+		if _plane_signatures.get(kind) != signature:
+			first = kind not in _plane_signatures
+			_plane_signatures[kind] = signature
+			if not first:
+				schedule_live_update(kind)
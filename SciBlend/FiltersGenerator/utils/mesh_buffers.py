@@ -0,0 +1,256 @@
+import bpy
+import numpy as np
+from typing import Optional
+
+
+def world_points(obj: bpy.types.Object) -> np.ndarray:
+	"""Return the world-space vertex positions of a mesh object as an (N, 3) float64 array."""
+	mesh = obj.data
+	co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+	mesh.vertices.foreach_get('co', co)
+	world = np.array([tuple(row) for row in obj.matrix_world], dtype=np.float64)
+	return co.reshape(-1, 3).astype(np.float64) @ world[:3, :3].T + world[:3, 3]
+
+
+def read_point_attribute(mesh: bpy.types.Mesh, name: str) -> Optional[np.ndarray]:
+	"""Return a FLOAT point attribute as a float64 array, or None if it is missing or not a point scalar."""
+	attr = mesh.attributes.get(name) if mesh is not None else None
+	if not attr or getattr(attr, 'domain', '') not in {'POINT', 'VERTEX'} or getattr(attr, 'data_type', '') != 'FLOAT':
+		return None
+	values = np.empty(len(attr.data), dtype=np.float32)
+	try:
+		attr.data.foreach_get('value', values)
+	except Exception:
+		return None
+	return values.astype(np.float64)
+
+
+def read_point_attributes(mesh: bpy.types.Mesh, count: int, names: Optional[set] = None) -> dict:
+	"""Read every FLOAT point attribute holding exactly `count` values into float32 arrays keyed by name.
+
+	Internal attributes (leading '.') are skipped; when `names` is given, only attributes in it are read.
+	"""
+	buffers = {}
+	for attr in getattr(mesh, 'attributes', []):
+		if getattr(attr, 'domain', '') not in {'POINT', 'VERTEX'} or getattr(attr, 'data_type', '') != 'FLOAT':
+			continue
+		if attr.name.startswith('.') or len(attr.data) != count:
+			continue
+		if names is not None and attr.name not in names:
+			continue
+		buf = np.empty(count, dtype=np.float32)
+		try:
+			attr.data.foreach_get('value', buf)
+		except Exception:
+			continue
+		buffers[attr.name] = buf
+	return buffers
+
+
+def weld_points(points: np.ndarray, tolerance: float = 1e-4) -> tuple:
+	"""Merge points closer than `tolerance` on a quantization grid.
+
+	Returns (representative point indices, inverse map from every input point to its welded index).
+	"""
+	if points.shape[0] == 0:
+		return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+	quantized = np.round(points / tolerance).astype(np.int64)
+	quantized -= quantized.min(axis=0)
+	extent = quantized.max(axis=0) + 1
+	if float(extent[0]) * float(extent[1]) * float(extent[2]) < 2.0 ** 62:
+		# Pack the three grid coordinates into one integer key; 1-D unique is far cheaper than row-wise unique
+		keys = (quantized[:, 0] * extent[1] + quantized[:, 1]) * extent[2] + quantized[:, 2]
+		_, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+	else:
+		_, first, inverse = np.unique(quantized, axis=0, return_index=True, return_inverse=True)
+	return first, inverse.reshape(-1)
+
+
+def compact_polygons(num_points: int, face_offsets: np.ndarray, face_vertices: np.ndarray, points: np.ndarray = None, weld_tolerance: float = 0.0, weld_map: tuple = None) -> tuple:
+	"""Keep only the points used by the polygons, optionally welding coincident ones.
+
+	`weld_map` is a precomputed (representative indices, inverse) pair from weld_points over all `num_points`;
+	without it, welding is computed over the used points when `weld_tolerance` is positive. Returns (source point
+	index per output vertex, face offsets, remapped face vertices, kept face mask). Faces that collapse onto a
+	repeated consecutive vertex after welding are dropped.
+	"""
+	if weld_map is None and weld_tolerance > 0.0 and points is not None and face_vertices.shape[0] > 0:
+		used = np.flatnonzero(np.bincount(face_vertices, minlength=num_points))
+		first, inverse = weld_points(points[used], weld_tolerance)
+		full_inverse = np.full(num_points, -1, dtype=np.int64)
+		full_inverse[used] = inverse
+		weld_map = (used[first], full_inverse)
+	source = np.arange(num_points, dtype=np.int64)
+	keep = np.ones(face_offsets.shape[0] - 1, dtype=bool)
+	if weld_map is not None:
+		source, inverse = weld_map
+		face_vertices = inverse[face_vertices]
+		sizes = np.diff(face_offsets)
+		nonempty = sizes > 0
+		if nonempty.any():
+			nxt = np.arange(1, face_vertices.shape[0] + 1, dtype=np.int64)
+			nxt[face_offsets[1:][nonempty] - 1] = face_offsets[:-1][nonempty]
+			repeated = (face_vertices == face_vertices[nxt]).astype(np.int64)
+			collapsed = np.zeros_like(keep)
+			collapsed[nonempty] = np.add.reduceat(repeated, face_offsets[:-1][nonempty]) > 0
+			keep &= ~collapsed
+		if not keep.all():
+			face_vertices = face_vertices[np.repeat(keep, sizes)]
+			face_offsets = np.zeros(int(keep.sum()) + 1, dtype=np.int64)
+			np.cumsum(sizes[keep], out=face_offsets[1:])
+	used = np.flatnonzero(np.bincount(face_vertices, minlength=source.shape[0]))
+	remap = np.full(source.shape[0], -1, dtype=np.int64)
+	remap[used] = np.arange(used.shape[0], dtype=np.int64)
+	return source[used], face_offsets, remap[face_vertices], keep
+
+
+def boundary_surface(arrays, face_ids: np.ndarray, face_cells: np.ndarray, flip: np.ndarray, point_fields: dict, weld_tolerance: float = 0.0, weld_map: tuple = None) -> Optional[tuple]:
+	"""Turn exposed cell faces into a surface result, or None when nothing is left.
+
+	The result is (points, face offsets, face vertices, cell per face, point attributes, face attributes), the
+	layout every filter hands to write_surface; point fields are picked per output vertex.
+	"""
+	if face_ids.shape[0] == 0:
+		return None
+	face_offsets, face_vertices = arrays.face_polygons(face_ids, flip)
+	points = np.asarray(arrays.points)
+	vertex_source, face_offsets, face_vertices, kept = compact_polygons(arrays.num_points, face_offsets, face_vertices, points, weld_tolerance, weld_map)
+	face_cells = face_cells[kept]
+	if face_cells.shape[0] == 0:
+		return None
+	attributes = {name: values[vertex_source] for name, values in point_fields.items()}
+	return points[vertex_source], face_offsets, face_vertices, face_cells, attributes, {}
+
+
+def write_mesh_geometry(mesh: bpy.types.Mesh, points: np.ndarray, face_offsets: np.ndarray, face_vertices: np.ndarray) -> None:
+	"""Replace the geometry of a mesh with polygons given as CSR arrays, using bulk foreach_set writes."""
+	mesh.clear_geometry()
+	num_faces = int(face_offsets.shape[0] - 1)
+	mesh.vertices.add(int(points.shape[0]))
+	mesh.vertices.foreach_set('co', np.ascontiguousarray(points, dtype=np.float32).ravel())
+	mesh.loops.add(int(face_vertices.shape[0]))
+	mesh.loops.foreach_set('vertex_index', np.ascontiguousarray(face_vertices, dtype=np.int32))
+	mesh.polygons.add(num_faces)
+	mesh.polygons.foreach_set('loop_start', np.ascontiguousarray(face_offsets[:-1], dtype=np.int32))
+	mesh.update(calc_edges=True)
+
+
+def set_float_attribute(mesh: bpy.types.Mesh, name: str, domain: str, values: np.ndarray) -> None:
+	"""Create or replace a FLOAT attribute and fill it in one call."""
+	existing = mesh.attributes.get(name)
+	if existing is not None:
+		try:
+			mesh.attributes.remove(existing)
+		except Exception:
+			pass
+	attr = mesh.attributes.new(name=name, type='FLOAT', domain=domain)
+	attr.data.foreach_set('value', np.ascontiguousarray(values, dtype=np.float32))
+
+
+def write_surface(mesh: bpy.types.Mesh, surface: tuple, cell_attributes: dict, names: Optional[set] = None) -> None:
+	"""Write a filter result (see boundary_surface) to a mesh: geometry, point attributes and baked cell attributes.
+
+	`names` restricts the cell attributes as in write_cell_attributes.
+	"""
+	points, face_offsets, face_vertices, face_cells, point_attributes, face_attributes = surface
+	write_mesh_geometry(mesh, points, face_offsets, face_vertices)
+	for name, values in point_attributes.items():
+		set_float_attribute(mesh, name, 'POINT', values)
+	write_cell_attributes(mesh, cell_attributes, face_cells, names)
+	for name, values in face_attributes.items():
+		set_float_attribute(mesh, name, 'FACE', values)
+
+
+def material_attribute_names(obj: bpy.types.Object) -> set:
+	"""Return the attribute names read by Attribute nodes in the object's materials, including nested node groups."""
+	names = set()
+	seen = set()
+
+	def _walk(tree):
+		if tree is None or tree.name in seen:
+			return
+		seen.add(tree.name)
+		for node in tree.nodes:
+			if node.type == 'ATTRIBUTE' and getattr(node, 'attribute_name', ''):
+				names.add(node.attribute_name)
+			elif node.type == 'GROUP':
+				_walk(getattr(node, 'node_tree', None))
+
+	for slot in getattr(obj, 'material_slots', []):
+		material = getattr(slot, 'material', None)
+		if material is not None and getattr(material, 'use_nodes', False):
+			_walk(material.node_tree)
+	return names
+
+
+def modifier_attribute_names(obj: bpy.types.Object) -> set:
+	"""Return the attribute names the object's Geometry Nodes modifiers read.
+
+	These are attribute inputs of the modifier and unlinked Named Attribute nodes in its node tree, including
+	nested node groups.
+	"""
+	names = set()
+	seen = set()
+
+	def _walk(tree):
+		if tree is None or tree.name in seen:
+			return
+		seen.add(tree.name)
+		for node in tree.nodes:
+			if node.bl_idname == 'GeometryNodeInputNamedAttribute':
+				socket = node.inputs.get('Name')
+				if socket is not None and not socket.is_linked and socket.default_value:
+					names.add(socket.default_value)
+			elif node.type == 'GROUP':
+				_walk(getattr(node, 'node_tree', None))
+
+	for modifier in getattr(obj, 'modifiers', []):
+		if modifier.type != 'NODES':
+			continue
+		for key in modifier.keys():
+			value = modifier[key]
+			if key.endswith('_attribute_name') and isinstance(value, str) and value:
+				names.add(value)
+		_walk(getattr(modifier, 'node_group', None))
+	return names
+
+
+def live_attribute_names(obj: bpy.types.Object) -> Optional[set]:
+	"""Return the attributes a live update of an existing output must transfer, or None to transfer all of them.
+
+	These are the attributes its materials and Geometry Nodes modifiers read, so a live update skips everything
+	nothing displays. An output where neither reads any attribute gets everything.
+	"""
+	if obj is None:
+		return None
+	names = material_attribute_names(obj) | modifier_attribute_names(obj)
+	return names or None
+
+
+def copy_point_attributes(src_mesh: bpy.types.Mesh, dst_mesh: bpy.types.Mesh, vertex_source: np.ndarray, num_model_points: int, names: Optional[set] = None) -> None:
+	"""Copy FLOAT point attributes of the source mesh onto the output vertices picked by `vertex_source`.
+
+	When `names` is given, only attributes in it are copied.
+	"""
+	for src_attr in src_mesh.attributes:
+		if getattr(src_attr, 'domain', '') != 'POINT' or getattr(src_attr, 'data_type', '') != 'FLOAT':
+			continue
+		if src_attr.name.startswith('.') or len(src_attr.data) != num_model_points:
+			continue
+		if names is not None and src_attr.name not in names:
+			continue
+		buf = np.empty(num_model_points, dtype=np.float32)
+		src_attr.data.foreach_get('value', buf)
+		set_float_attribute(dst_mesh, src_attr.name, 'POINT', buf[vertex_source])
+
+
+def write_cell_attributes(mesh: bpy.types.Mesh, cell_attributes: dict, face_cells: np.ndarray, names: Optional[set] = None) -> None:
+	"""Bake the first component of each cell attribute onto FACE-domain `cell_<name>` attributes.
+
+	When `names` is given, only output attributes whose `cell_<name>` is in it are written.
+	"""
+	for name in sorted(cell_attributes.keys()):
+		if names is not None and f"cell_{name}" not in names:
+			continue
+		column = np.asarray(cell_attributes[name])[face_cells, 0]
+		set_float_attribute(mesh, f"cell_{name}", 'FACE', np.nan_to_num(column, nan=0.0))
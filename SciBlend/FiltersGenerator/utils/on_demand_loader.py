@@ -1,16 +1,34 @@
 import bpy
 import os
+import re
 import logging
-from collections import deque
-from typing import Optional, Tuple
-from ...operators.utils.volume_mesh_data import get_model, register_model, unregister_model
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Optional, Tuple
+from bpy.app.handlers import persistent
+from ...operators.utils.volume_mesh_data import VolumeMeshData, get_model, register_model, unregister_model, estimate_model_nbytes
+from ...operators.utils.volume_mesh_store import find_sidecar, read_sidecar, load_model_sidecar, save_model_sidecar
 
 logger = logging.getLogger(__name__)
 if not logger.handlers:
 	logger.setLevel(logging.INFO)
 
 _SUPPORTED_EXTS = ('.vtk', '.vtu', '.pvtu')
-_LRU_QUEUE: deque[str] = deque(maxlen=16)
+# Out-of-core imports keep only a compacted skin, whose vertices do not match the points of the file's grid
+SKIN_ONLY_ERROR = "Imported as an out-of-core skin: volume filters need a regular import of the file"
+# Lazily loaded models keyed by object name, least recently used first; values are footprints in bytes.
+_LRU_CACHE: "OrderedDict[str, int]" = OrderedDict()
+_CACHE_STATS = {'hits': 0, 'misses': 0, 'evictions': 0, 'prefetched': 0, 'restored': 0}
+
+# Name of the mesh the VTK importer creates for each frame
+FRAME_NAME_RE = re.compile(r'^Frame_(\d+)$')
+
+# Background prefetch of neighbouring Frame_{n} models. Only file reads run on the worker thread (VTK files or
+# topology sidecars, flagged by the last tuple item); file resolution, registration and eviction always happen
+# on Blender's main thread.
+_PREFETCH_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_PREFETCH_PENDING: "dict[str, Tuple[int, Future, bool]]" = {}
+_PREFETCH_STATE = {'generation': 0, 'last_frame': None, 'direction': 1, 'keep': '', 'max_cached': 0, 'budget': 0, 'timer': False}
 
 
 def _safe_info(msg: str) -> None:
@@ -33,17 +51,58 @@ def _safe_error(msg: str) -> None:
 			pass
 
 
-def _get_scene_on_demand_settings(context) -> Tuple[bool, str, int]:
-	"""Return tuple (enabled, root_dir, max_cached) from scene settings, with safe defaults."""
-	sc = getattr(context, 'scene', None)
-	if not sc:
-		_safe_error("On-demand: no scene in context")
-		return False, '', 0
+def _read_on_demand_settings(sc) -> Tuple[bool, str, int, int]:
 	enabled = bool(getattr(sc, 'on_demand_volume_enabled', False))
 	root = str(getattr(sc, 'on_demand_data_root', '') or '')
 	max_cached = int(getattr(sc, 'on_demand_max_cached', 4) or 0)
-	_safe_info(f"On-demand: enabled={enabled} root='{root}' max_cached={max_cached}")
-	return enabled, root, max_cached
+	budget_mb = float(getattr(sc, 'on_demand_cache_budget_mb', 0.0) or 0.0)
+	return enabled, root, max_cached, int(budget_mb * 1024 * 1024)
+
+
+def _get_scene_on_demand_settings(context) -> Tuple[bool, str, int, int]:
+	"""Return tuple (enabled, root_dir, max_cached, budget_bytes) from scene settings, with safe defaults."""
+	sc = getattr(context, 'scene', None)
+	if not sc:
+		_safe_error("On-demand: no scene in context")
+		return False, '', 0, 0
+	enabled, root, max_cached, budget = _read_on_demand_settings(sc)
+	_safe_info(f"On-demand: enabled={enabled} root='{root}' max_cached={max_cached} budget_mb={budget / (1024 * 1024):.0f}")
+	return enabled, root, max_cached, budget
+
+
+def _cache_nbytes() -> int:
+	return sum(_LRU_CACHE.values())
+
+
+def _touch(name: str) -> None:
+	"""Mark a cached entry as most recently used and refresh its footprint.
+
+	A model grows after registration as filters cache arrays on it, so the size recorded when it was registered
+	would undercount it.
+	"""
+	if name in _LRU_CACHE:
+		model = get_model(name)
+		if model is not None:
+			_LRU_CACHE[name] = estimate_model_nbytes(model)
+		_LRU_CACHE.move_to_end(name)
+
+
+def _evict_to_limits(max_cached: int, budget_bytes: int, keep: Iterable[str] = ()) -> None:
+	"""Evict least recently used models until both the count and byte limits hold; names in `keep` are never evicted."""
+	keep = set(keep)
+	def _over() -> bool:
+		if max_cached > 0 and len(_LRU_CACHE) > max_cached:
+			return True
+		return budget_bytes > 0 and _cache_nbytes() > budget_bytes
+
+	while _over():
+		victim = next((n for n in _LRU_CACHE if n not in keep), None)
+		if victim is None:
+			break
+		nbytes = _LRU_CACHE.pop(victim)
+		unregister_model(victim)
+		_CACHE_STATS['evictions'] += 1
+		_safe_info(f"On-demand: evicted '{victim}' ({nbytes / (1024 * 1024):.1f} MB) from registry")
 
 
 def _find_candidate_file(root_dir: str, obj: bpy.types.Object) -> Optional[str]:
@@ -90,9 +149,18 @@ def _find_candidate_file(root_dir: str, obj: bpy.types.Object) -> Optional[str]:
 
 
 def _load_volume_model_from_file(filepath: str):
-	"""Load a VolumeMeshData from a VTK file without creating a Blender mesh object."""
+	"""Load a VolumeMeshData from a VTK file without creating a Blender mesh object.
+
+	The topology is read into flat arrays with numpy, which keeps the GIL free for most of the work when this runs
+	on the prefetch thread; the vertex, face and cell objects are only built if something asks for them. Grids with
+	polyhedral cells fall back to building the objects directly.
+	"""
 	try:
-		from .vtk_read import read_volume_data_from_vtk
+		from .vtk_read import read_volume_arrays_from_vtk, read_volume_data_from_vtk
+		arrays = read_volume_arrays_from_vtk(filepath)
+		if arrays is not None:
+			_safe_info(f"On-demand: loaded model with {arrays.num_points} verts, {arrays.num_faces} faces, {arrays.num_cells} cells")
+			return VolumeMeshData(arrays)
 		volume_data, _ = read_volume_data_from_vtk(filepath)
 		for i, v in enumerate(volume_data.vertices):
 			try:
@@ -106,16 +174,45 @@ def _load_volume_model_from_file(filepath: str):
 		return None
 
 
+def _load_sidecar_file(path: str):
+	"""Open a topology sidecar as a lazily materialized model; safe to run on the prefetch thread."""
+	return VolumeMeshData(read_sidecar(path))
+
+
+def is_skin_only(obj: bpy.types.Object) -> bool:
+	"""Return True for meshes imported as an out-of-core skin, which have no volume model to load."""
+	try:
+		return bool(obj.get('sciblend_volume_skin_only', False))
+	except Exception:
+		return False
+
+
 def ensure_model_for_object(context, obj: bpy.types.Object):
 	"""Ensure a VolumeMeshData model is registered for obj.name using on-demand loading if enabled.
 
-	If the model exists, returns it. If on-demand is disabled or loading fails, returns None.
+	If the model exists, returns it. A model persisted as a topology sidecar is restored even when on-demand
+	loading is disabled. If no model can be found or loaded, returns None; out-of-core skins always get None
+	rather than a full in-memory read of their grid.
 	"""
+	if is_skin_only(obj):
+		_safe_error(f"On-demand: '{obj.name}': {SKIN_ONLY_ERROR}")
+		return None
 	model = get_model(obj.name)
 	if model is not None:
+		if obj.name in _LRU_CACHE:
+			_touch(obj.name)
+			_CACHE_STATS['hits'] += 1
+			_, _, max_cached, budget_bytes = _read_on_demand_settings(context.scene)
+			_evict_to_limits(max_cached, budget_bytes, keep=(obj.name,))
 		_safe_info(f"On-demand: model already in registry for '{obj.name}'")
 		return model
-	enabled, root_dir, max_cached = _get_scene_on_demand_settings(context)
+	enabled, root_dir, max_cached, budget_bytes = _get_scene_on_demand_settings(context)
+	model = load_model_sidecar(obj)
+	if model is not None:
+		_CACHE_STATS['restored'] += 1
+		_safe_info(f"On-demand: restored '{obj.name}' from topology sidecar")
+		_register_cached(obj.name, model, max_cached, budget_bytes)
+		return model
 	if not enabled:
 		_safe_info("On-demand: disabled")
 		return None
@@ -124,31 +221,241 @@ def ensure_model_for_object(context, obj: bpy.types.Object):
 		_safe_error(f"On-demand: no file found for '{obj.name}'")
 		return None
 	_safe_info(f"On-demand: loading '{filepath}'")
-	model = _load_volume_model_from_file(filepath)
+	_CACHE_STATS['misses'] += 1
+	model = None
+	pending = _PREFETCH_PENDING.pop(obj.name, None)
+	if pending is not None and not pending[1].cancel():
+		_safe_info(f"On-demand: waiting for in-flight prefetch of '{obj.name}'")
+		try:
+			model = pending[1].result()
+		except Exception:
+			model = None
+	if model is None:
+		model = _load_volume_model_from_file(filepath)
 	if model is None:
 		_safe_error("On-demand: load returned None")
 		return None
-	register_model(obj.name, model)
-	_safe_info(f"On-demand: registered model for '{obj.name}'")
+	_register_cached(obj.name, model, max_cached, budget_bytes)
+	if bool(getattr(getattr(context, 'scene', None), 'on_demand_persist_topology', False)):
+		save_model_sidecar(obj, model, filepath)
+	return model
+
+
+def _register_cached(name: str, model, max_cached: int, budget_bytes: int) -> None:
+	"""Register a lazily obtained model and account for it in the LRU."""
+	register_model(name, model)
+	_safe_info(f"On-demand: registered model for '{name}'")
 	try:
-		_LRU_QUEUE.append(obj.name)
-		while max_cached > 0 and len(_LRU_QUEUE) > max_cached:
-			old = _LRU_QUEUE.popleft()
-			if old != obj.name:
-				unregister_model(old)
-				_safe_info(f"On-demand: evicted '{old}' from registry")
+		_LRU_CACHE[name] = estimate_model_nbytes(model)
+		_touch(name)
+		_evict_to_limits(max_cached, budget_bytes, keep=(name,))
 	except Exception as e:
 		_safe_error(f"On-demand: LRU error: {e}")
-	return model
+
+
+def get_cache_stats() -> dict:
+	"""Return a snapshot of the on-demand cache: entry count, footprint in bytes, pending prefetches and counters."""
+	stats = dict(_CACHE_STATS)
+	stats['entries'] = len(_LRU_CACHE)
+	stats['nbytes'] = _cache_nbytes()
+	stats['prefetching'] = len(_PREFETCH_PENDING)
+	return stats
 
 
 def clear_on_demand_cache():
-	"""Clear all lazily registered models and the LRU queue."""
+	"""Clear all lazily registered models, pending prefetches, the LRU order and the statistics counters."""
+	cancel_prefetches()
 	try:
-		while _LRU_QUEUE:
-			name = _LRU_QUEUE.popleft()
+		while _LRU_CACHE:
+			name, _ = _LRU_CACHE.popitem(last=False)
 			unregister_model(name)
 			_safe_info(f"On-demand: cleared '{name}'")
 	except Exception as e:
 		_safe_error(f"On-demand: clear error: {e}")
-		pass 
\ No newline at end of file
+	for key in _CACHE_STATS:
+		_CACHE_STATS[key] = 0
+
+
+def _get_prefetch_executor() -> ThreadPoolExecutor:
+	global _PREFETCH_EXECUTOR
+	if _PREFETCH_EXECUTOR is None:
+		_PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sciblend_prefetch")
+	return _PREFETCH_EXECUTOR
+
+
+def frame_objects(scene) -> dict:
+	"""Map frame numbers to the imported `Frame_{n}` mesh objects of a scene."""
+	frames = {}
+	for obj in getattr(scene, 'objects', []):
+		match = FRAME_NAME_RE.match(obj.name)
+		if match and getattr(obj, 'type', None) == 'MESH':
+			frames[int(match.group(1))] = obj
+	return frames
+
+
+def _predict_frame_objects(scene, frame: int, direction: int, count: int) -> list:
+	"""Return the objects shown on the next `count` frames in playback direction, honouring range wrap and loops."""
+	frames = frame_objects(scene)
+	if not frames:
+		return []
+	first = min(frames)
+	span = max(frames) - first + 1
+	start = int(getattr(scene, 'frame_start', first))
+	end = int(getattr(scene, 'frame_end', first + span - 1))
+	result = []
+	for k in range(1, count + 1):
+		f = frame + direction * k
+		if end > start:
+			f = start + (f - start) % (end - start + 1)
+		obj = frames.get(f)
+		if obj is None:
+			# Looped imports keyframe Frame_{n} again every `span` frames
+			obj = frames.get(first + (f - first) % span)
+		if obj is not None and obj not in result:
+			result.append(obj)
+	return result
+
+
+def _prefetch_slots(max_cached: int, budget_bytes: int) -> int:
+	"""Number of models that can be prefetched without evicting the current frame's model, or -1 if unbounded."""
+	slots = -1
+	if max_cached > 0:
+		slots = max(0, max_cached - 1)
+	if budget_bytes > 0 and _LRU_CACHE:
+		avg = _cache_nbytes() / float(len(_LRU_CACHE))
+		if avg > 0:
+			by_budget = max(0, int(budget_bytes // avg) - 1)
+			slots = by_budget if slots < 0 else min(slots, by_budget)
+	return slots
+
+
+def cancel_prefetches() -> None:
+	"""Cancel queued prefetches and discard the results of any that are already running."""
+	_PREFETCH_STATE['generation'] += 1
+	for name, (_, future, _) in list(_PREFETCH_PENDING.items()):
+		if future.cancel():
+			_PREFETCH_PENDING.pop(name, None)
+
+
+def _register_prefetched(name: str, model) -> None:
+	nbytes = estimate_model_nbytes(model)
+	budget = _PREFETCH_STATE['budget']
+	keep = _PREFETCH_STATE['keep']
+	reserved = _LRU_CACHE.get(keep, 0)
+	if budget > 0 and nbytes + reserved > budget:
+		_safe_info(f"On-demand: dropped prefetched '{name}' ({nbytes / (1024 * 1024):.1f} MB exceeds budget)")
+		return
+	register_model(name, model)
+	_LRU_CACHE[name] = nbytes
+	_CACHE_STATS['prefetched'] += 1
+	_evict_to_limits(_PREFETCH_STATE['max_cached'], budget, keep=(keep, name))
+	_safe_info(f"On-demand: prefetched '{name}'")
+
+
+def _drain_prefetch_results():
+	"""Timer callback registering finished prefetches on the main thread; reschedules itself while work is pending."""
+	for name, (generation, future, restored) in list(_PREFETCH_PENDING.items()):
+		if not future.done():
+			continue
+		_PREFETCH_PENDING.pop(name, None)
+		if future.cancelled() or generation != _PREFETCH_STATE['generation']:
+			continue
+		try:
+			model = future.result()
+		except Exception as e:
+			_safe_error(f"On-demand: prefetch of '{name}' failed: {e}")
+			continue
+		if model is None or get_model(name) is not None:
+			continue
+		try:
+			if restored:
+				_CACHE_STATS['restored'] += 1
+			_register_prefetched(name, model)
+		except Exception as e:
+			_safe_error(f"On-demand: prefetch registration error: {e}")
+	if _PREFETCH_PENDING:
+		return 0.1
+	_PREFETCH_STATE['timer'] = False
+	return None
+
+
+def schedule_prefetch(scene, frame: int) -> None:
+	"""Queue background loads for the models of the frames that follow `frame` in the playback direction.
+
+	A jump or a change of direction cancels prefetches that were queued for the previous position.
+	"""
+	enabled, root_dir, max_cached, budget = _read_on_demand_settings(scene)
+	count = int(getattr(scene, 'on_demand_prefetch_frames', 0) or 0)
+	if not enabled or count <= 0:
+		return
+	last = _PREFETCH_STATE['last_frame']
+	direction = _PREFETCH_STATE['direction']
+	if last is not None and frame != last:
+		step_dir = 1 if frame > last else -1
+		if abs(frame - last) > 1 or step_dir != direction:
+			cancel_prefetches()
+		direction = step_dir
+	_PREFETCH_STATE['last_frame'] = frame
+	_PREFETCH_STATE['direction'] = direction
+	_PREFETCH_STATE['max_cached'] = max_cached
+	_PREFETCH_STATE['budget'] = budget
+	current = frame_objects(scene).get(frame)
+	_PREFETCH_STATE['keep'] = current.name if current is not None else ''
+
+	wanted = _predict_frame_objects(scene, frame, direction, count)
+	slots = _prefetch_slots(max_cached, budget)
+	if slots >= 0:
+		wanted = wanted[:slots]
+	wanted_names = {obj.name for obj in wanted}
+	for name, (_, future, _) in list(_PREFETCH_PENDING.items()):
+		if name not in wanted_names and future.cancel():
+			_PREFETCH_PENDING.pop(name, None)
+
+	generation = _PREFETCH_STATE['generation']
+	for obj in wanted:
+		if is_skin_only(obj):
+			continue
+		if get_model(obj.name) is not None:
+			_touch(obj.name)
+			continue
+		pending = _PREFETCH_PENDING.get(obj.name)
+		if pending is not None:
+			# Still wanted after a jump: adopt the in-flight load into the current generation
+			_PREFETCH_PENDING[obj.name] = (generation, pending[1], pending[2])
+			continue
+		# Only the path lookup touches the object; the sidecar itself is opened on the worker
+		sidecar = find_sidecar(obj)
+		if sidecar:
+			future = _get_prefetch_executor().submit(_load_sidecar_file, sidecar)
+			_PREFETCH_PENDING[obj.name] = (generation, future, True)
+			continue
+		filepath = _find_candidate_file(root_dir, obj)
+		if not filepath:
+			continue
+		future = _get_prefetch_executor().submit(_load_volume_model_from_file, filepath)
+		_PREFETCH_PENDING[obj.name] = (generation, future, False)
+	if _PREFETCH_PENDING and not _PREFETCH_STATE['timer']:
+		_PREFETCH_STATE['timer'] = True
+		try:
+			bpy.app.timers.register(_drain_prefetch_results, first_interval=0.1)
+		except Exception:
+			_PREFETCH_STATE['timer'] = False
+
+
+@persistent
+def on_demand_frame_change_handler(scene, depsgraph=None):
+	"""frame_change_post handler that prefetches the models of upcoming frames."""
+	try:
+		schedule_prefetch(scene, int(scene.frame_current))
+	except Exception as e:
+		_safe_error(f"On-demand: prefetch scheduling error: {e}")
+
+
+def shutdown_prefetch() -> None:
+	"""Cancel pending prefetches and release the worker thread."""
+	global _PREFETCH_EXECUTOR
+	cancel_prefetches()
+	_PREFETCH_PENDING.clear()
+	if _PREFETCH_EXECUTOR is not None:
+		_PREFETCH_EXECUTOR.shutdown(wait=False)
+		_PREFETCH_EXECUTOR = None
@@ -0,0 +1,191 @@
+import numpy as np
+
+
+class PointGrid:
+    """Uniform-grid bucket index over a point cloud answering batched exact k-nearest-neighbour queries.
+
+    Points are sorted by bucket into CSR arrays. A query searches rings of buckets around its own bucket until
+    its k-th best distance is closer than anything outside the searched block.
+
+    Buckets are sized so that the occupied ones hold about `points_per_bucket` points, which for points on a
+    surface or curve means far smaller buckets than filling the bounding box would give. Such grids keep their
+    non-empty buckets in a sorted key table, and queries that find nothing within a few rings (far from every
+    point) are answered by a coarse grid sized to the bounding box instead.
+    """
+
+    # Upper bound on (queries x buckets) handled per batch, limiting temporary memory
+    _BATCH_CELLS = 1 << 20
+    # Dense bucket tables are used up to this many buckets per point; larger grids look buckets up by key
+    _DENSE_LIMIT = 4
+    # Rings searched on a refined grid before the remaining queries fall back to the coarse grid
+    _FINE_RINGS = 2
+
+    def __init__(self, points, points_per_bucket: float = 3.0, adaptive: bool = True):
+        self.points = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 3)
+        n = self.points.shape[0]
+        if n == 0:
+            self.bbox_min = np.zeros(3)
+            self.bbox_max = np.zeros(3)
+        else:
+            self.bbox_min = self.points.min(axis=0)
+            self.bbox_max = self.points.max(axis=0)
+        self.origin = self.bbox_min
+        self._extent = np.maximum(self.bbox_max - self.bbox_min, 1e-12)
+        # Flat axes get a single layer of buckets
+        self._active = self._extent > self._extent.max() * 1e-6
+        ppb = max(points_per_bucket, 1e-6)
+        buckets = max(1.0, n / ppb)
+        volume = float(np.prod(self._extent[self._active]))
+        size = (volume / buckets) ** (1.0 / max(1, int(self._active.sum())))
+        self._coarse = None
+        if adaptive and n > 0:
+            refined = False
+            for _ in range(4):
+                dims, cell_size = self._layout(size)
+                mean = n / np.unique(self._flat(self._coords(self.points, dims, cell_size), dims)).shape[0]
+                if mean <= 1.5 * ppb:
+                    break
+                # Occupied buckets of a surface grow with the inverse square of their size
+                size *= (ppb / mean) ** 0.5
+                refined = True
+            if refined:
+                self._coarse = PointGrid(self.points, points_per_bucket, adaptive=False)
+        self._build(size)
+        self._shells = {}
+
+    def _layout(self, size: float) -> tuple:
+        dims = np.where(self._active, np.clip(np.ceil(self._extent / max(size, 1e-12)), 1, 1 << 20), 1).astype(np.int64)
+        return dims, self._extent / dims
+
+    def _build(self, size: float) -> None:
+        self.dims, self.cell_size = self._layout(size)
+        n = self.points.shape[0]
+        keys = self._flat(self._coords(self.points))
+        self.order = np.argsort(keys, kind='stable')
+        # Points in bucket order, so the candidates of one bucket are contiguous in memory
+        self._sorted_points = self.points[self.order]
+        total = int(np.prod(self.dims))
+        if total <= self._DENSE_LIMIT * max(n, 1):
+            self._bucket_keys = None
+            counts = np.bincount(keys, minlength=total)
+            self.starts = np.zeros(total + 1, dtype=np.int64)
+            np.cumsum(counts, out=self.starts[1:])
+            occupied = int(np.count_nonzero(counts))
+        else:
+            sorted_keys = keys[self.order]
+            self._bucket_keys, first = np.unique(sorted_keys, return_index=True)
+            self.starts = np.append(first, n).astype(np.int64)
+            occupied = self._bucket_keys.shape[0]
+        self.points_per_bucket = n / max(1, occupied)
+
+    def _coords(self, positions: np.ndarray, dims=None, cell_size=None) -> np.ndarray:
+        dims = self.dims if dims is None else dims
+        cell_size = self.cell_size if cell_size is None else cell_size
+        coords = np.floor((positions - self.origin) / cell_size).astype(np.int64)
+        return np.clip(coords, 0, dims - 1)
+
+    def _flat(self, coords: np.ndarray, dims=None) -> np.ndarray:
+        dims = self.dims if dims is None else dims
+        return (coords[:, 0] * dims[1] + coords[:, 1]) * dims[2] + coords[:, 2]
+
+    def _bucket_ranges(self, cells: np.ndarray) -> tuple:
+        """Return (first sorted point, point count) of each flat bucket id."""
+        if self._bucket_keys is None:
+            first = self.starts[cells]
+            return first, self.starts[cells + 1] - first
+        slot = np.minimum(np.searchsorted(self._bucket_keys, cells), self._bucket_keys.shape[0] - 1)
+        first = self.starts[slot]
+        return first, np.where(self._bucket_keys[slot] == cells, self.starts[slot + 1] - first, 0)
+
+    def _shell(self, r: int, first: bool) -> np.ndarray:
+        """Bucket offsets at Chebyshev distance r (all offsets up to r for the first ring), clipped to the grid."""
+        key = (r, first)
+        offsets = self._shells.get(key)
+        if offsets is None:
+            axes = [np.arange(-l, l + 1) for l in np.minimum(r, self.dims - 1)]
+            offsets = np.stack(np.meshgrid(*axes, indexing='ij'), axis=-1).reshape(-1, 3)
+            ring = np.abs(offsets).max(axis=1)
+            offsets = offsets[ring <= r] if first else offsets[ring == r]
+            self._shells[key] = offsets
+        return offsets
+
+    def query(self, positions, k: int = 8) -> tuple:
+        """Return (indices, distances), each (N, k), sorted by distance; missing neighbours are -1 / inf."""
+        positions = np.ascontiguousarray(positions, dtype=np.float64).reshape(-1, 3)
+        num = positions.shape[0]
+        k = max(1, int(k))
+        best_idx = np.full((num, k), -1, dtype=np.int64)
+        best_d2 = np.full((num, k), np.inf)
+        if num == 0 or self.points.shape[0] == 0:
+            return best_idx, best_d2
+        home = self._coords(positions)
+        # Visit queries in bucket order so neighbouring queries gather from the same memory
+        active = np.argsort(self._flat(home), kind='stable')
+        # Start with the surrounding block when one bucket is unlikely to hold k points
+        first = 1 if k > self.points_per_bucket and self.dims.max() > 1 else 0
+        last = int(self.dims.max()) if self._coarse is None else max(first, self._FINE_RINGS)
+        for r in range(first, last + 1):
+            shell = self._shell(r, r == first)
+            for batch in np.array_split(active, max(1, (active.shape[0] * shell.shape[0]) // self._BATCH_CELLS)):
+                self._merge_shell(positions, home, batch, shell, best_idx, best_d2)
+            # Distance from each query to the outside of its searched block; sides at the grid edge are closed
+            lo = home[active] - r
+            hi = home[active] + r
+            gap_lo = np.where(lo <= 0, np.inf, positions[active] - (self.origin + lo * self.cell_size))
+            gap_hi = np.where(hi >= self.dims - 1, np.inf, (self.origin + (hi + 1) * self.cell_size) - positions[active])
+            margin = np.minimum(gap_lo, gap_hi).min(axis=1)
+            done = np.isinf(margin) | (best_d2[active, k - 1] <= margin * margin)
+            active = active[~done]
+            if active.shape[0] == 0:
+                break
+        if active.shape[0] > 0 and self._coarse is not None:
+            idx, dist = self._coarse.query(positions[active], k)
+            best_idx[active] = idx
+            best_d2[active] = dist * dist
+        return best_idx, np.sqrt(best_d2)
+
+    def _merge_shell(self, positions, home, batch, shell, best_idx, best_d2) -> None:
+        """Merge the points of one ring of buckets into the running k best of a batch of queries."""
+        k = best_idx.shape[1]
+        coords = home[batch][:, None, :] + shell[None, :, :]
+        rows, cols = np.nonzero(np.all((coords >= 0) & (coords < self.dims), axis=2))
+        if rows.shape[0] == 0:
+            return
+        first, counts = self._bucket_ranges(self._flat(coords[rows, cols]))
+        per_query = np.bincount(rows, weights=counts, minlength=batch.shape[0]).astype(np.int64)
+        width = int(per_query.max())
+        if width == 0:
+            return
+        total = int(counts.sum())
+        owner = np.repeat(rows, counts)
+        # Positions of the candidates in the bucket-ordered point array
+        candidates = np.repeat(first - np.cumsum(counts) + counts, counts) + np.arange(total)
+        row_start = np.zeros(batch.shape[0] + 1, dtype=np.int64)
+        np.cumsum(per_query, out=row_start[1:])
+        slot = np.arange(total) - row_start[owner]
+        diff = self._sorted_points[candidates] - positions[batch[owner]]
+        # Dense (queries, k + width) table holding the current best followed by the new candidates
+        table = np.full((batch.shape[0], k + width), np.inf)
+        table[:, :k] = best_d2[batch]
+        table[owner, k + slot] = np.einsum('ij,ij->i', diff, diff)
+        if k < table.shape[1]:
+            part = np.argpartition(table, k - 1, axis=1)[:, :k]
+        else:
+            part = np.broadcast_to(np.arange(k), table.shape)
+        part_d2 = np.take_along_axis(table, part, axis=1)
+        order = np.argsort(part_d2, axis=1)
+        part = np.take_along_axis(part, order, axis=1)
+        previous = best_idx[batch]
+        from_new = part >= k
+        rows_new = np.nonzero(from_new)[0]
+        chosen = np.take_along_axis(previous, np.minimum(part, k - 1), axis=1)
+        picked = row_start[rows_new] + part[from_new] - k
+        # Rows with fewer than k points so far may pick padding columns, which stay without a neighbour
+        chosen[from_new] = np.where(picked < row_start[rows_new + 1], self.order[candidates[np.minimum(picked, total - 1)]], -1)
+        best_d2[batch] = np.take_along_axis(part_d2, order, axis=1)
+        best_idx[batch] = chosen
+
+    def nearest(self, positions) -> tuple:
+        """Return (index, distance) of the nearest point for every position."""
+        idx, dist = self.query(positions, 1)
+        return idx[:, 0], dist[:, 0]
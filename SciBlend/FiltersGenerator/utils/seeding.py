@@ -0,0 +1,112 @@
+import numpy as np
+from .point_grid import PointGrid
+
+
+def _box(bbox_min, bbox_max) -> tuple:
+    bmin = np.asarray(bbox_min, dtype=np.float64).reshape(3)
+    bmax = np.asarray(bbox_max, dtype=np.float64).reshape(3)
+    return np.minimum(bmin, bmax), np.maximum(bmin, bmax)
+
+
+def grid_seeds(bbox_min, bbox_max, count: int) -> np.ndarray:
+    """About `count` seeds at the centers of a regular lattice filling the box with near-cubic spacing.
+
+    Flat axes (zero extent) get a single layer, so a planar box yields a 2-D lattice.
+    """
+    bmin, bmax = _box(bbox_min, bbox_max)
+    extent = bmax - bmin
+    count = max(1, int(count))
+    active = extent > extent.max() * 1e-9 if extent.max() > 0.0 else np.zeros(3, dtype=bool)
+    dims = np.ones(3, dtype=np.int64)
+    if active.any():
+        spacing = (float(np.prod(extent[active])) / count) ** (1.0 / int(active.sum()))
+        dims[active] = np.maximum(1, np.round(extent[active] / spacing)).astype(np.int64)
+    axes = [bmin[i] + (np.arange(dims[i]) + 0.5) * extent[i] / dims[i] for i in range(3)]
+    return np.stack(np.meshgrid(*axes, indexing='ij'), axis=-1).reshape(-1, 3)
+
+
+def random_seeds(bbox_min, bbox_max, count: int, rng: np.random.Generator) -> np.ndarray:
+    """`count` seeds drawn uniformly in the box."""
+    bmin, bmax = _box(bbox_min, bbox_max)
+    return bmin + rng.random((max(0, int(count)), 3)) * (bmax - bmin)
+
+
+def poisson_disk_seeds(bbox_min, bbox_max, count: int, rng: np.random.Generator, min_distance: float = 0.0, max_rounds: int = 32) -> np.ndarray:
+    """Up to `count` seeds in the box, no two closer than `min_distance`, by batched dart throwing.
+
+    Each round draws a batch of candidates, drops those near accepted seeds, and among the survivors keeps the ones
+    whose random priority is lowest within `min_distance`. Candidates whose neighbourhood could not be checked
+    completely are retried in later rounds, so the spacing guarantee is exact. When `min_distance` is 0 a spacing
+    is chosen that random packing can comfortably reach for `count` seeds.
+    """
+    bmin, bmax = _box(bbox_min, bbox_max)
+    extent = bmax - bmin
+    count = max(0, int(count))
+    if count == 0:
+        return np.zeros((0, 3))
+    active = extent > extent.max() * 1e-9 if extent.max() > 0.0 else np.zeros(3, dtype=bool)
+    if not active.any():
+        return bmin[None, :].copy()
+    dim = int(active.sum())
+    radius = float(min_distance)
+    if radius <= 0.0:
+        radius = 0.7 * (float(np.prod(extent[active])) / count) ** (1.0 / dim)
+    accepted = np.zeros((0, 3))
+    neighbours = 16
+    for _ in range(max(1, int(max_rounds))):
+        missing = count - accepted.shape[0]
+        if missing <= 0:
+            break
+        candidates = bmin + rng.random((2 * missing + 16, 3)) * extent
+        if accepted.shape[0] > 0:
+            _, dist = PointGrid(accepted).nearest(candidates)
+            candidates = candidates[dist >= radius]
+        if candidates.shape[0] == 0:
+            continue
+        priority = rng.permutation(candidates.shape[0])
+        k = min(neighbours, candidates.shape[0])
+        idx, dist = PointGrid(candidates).query(candidates, k)
+        close = (dist < radius) & (idx >= 0)
+        # Exclude the candidate itself wherever it appears among its neighbours
+        close &= idx != np.arange(candidates.shape[0])[:, None]
+        beaten = np.any(close & (priority[np.maximum(idx, 0)] < priority[:, None]), axis=1)
+        # If even the k-th neighbour is close, closer candidates may be missing from the list
+        truncated = (k < candidates.shape[0]) & (dist[:, -1] < radius)
+        keep = ~beaten & ~truncated
+        chosen = candidates[keep][np.argsort(priority[keep])][:missing]
+        accepted = np.concatenate([accepted, chosen])
+    return accepted
+
+
+def triangle_areas(points: np.ndarray, triangles: np.ndarray) -> np.ndarray:
+    a = points[triangles[:, 0]]
+    return 0.5 * np.linalg.norm(np.cross(points[triangles[:, 1]] - a, points[triangles[:, 2]] - a), axis=1)
+
+
+def surface_seeds(points, triangles, count: int, rng: np.random.Generator, weights=None) -> np.ndarray:
+    """`count` seeds on a triangle surface, distributed by area times optional per-triangle weights.
+
+    Triangles are picked by inverting the cumulative weight and points are placed uniformly inside them.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+    count = max(0, int(count))
+    if triangles.shape[0] == 0 or count == 0:
+        return np.zeros((0, 3))
+    mass = triangle_areas(points, triangles)
+    if weights is not None:
+        mass = mass * np.maximum(np.nan_to_num(np.asarray(weights, dtype=np.float64), nan=0.0), 0.0)
+    total = float(mass.sum())
+    if total <= 0.0:
+        return np.zeros((0, 3))
+    cumulative = np.cumsum(mass)
+    picked = np.minimum(np.searchsorted(cumulative, rng.random(count) * total, side='right'), triangles.shape[0] - 1)
+    # Folding the unit square onto the triangle keeps the distribution uniform
+    u = rng.random(count)
+    v = rng.random(count)
+    fold = u + v > 1.0
+    u[fold] = 1.0 - u[fold]
+    v[fold] = 1.0 - v[fold]
+    tri = triangles[picked]
+    a = points[tri[:, 0]]
+    return a + u[:, None] * (points[tri[:, 1]] - a) + v[:, None] * (points[tri[:, 2]] - a)
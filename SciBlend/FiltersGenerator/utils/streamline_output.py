@@ -0,0 +1,172 @@
+import bpy
+import numpy as np
+from ...compat import set_gn_modifier_input
+
+TUBE_GROUP_NAME = "SciBlend_Streamline_Tubes"
+TUBE_MODIFIER_NAME = "SciBlend_Tubes"
+
+
+def pack_polylines(lines: list) -> tuple:
+    """Concatenate (M, 3) polylines into (points, edges, line_id); lines with fewer than two points are skipped."""
+    lines = [np.asarray(line, dtype=np.float64).reshape(-1, 3) for line in lines]
+    lines = [line for line in lines if line.shape[0] >= 2]
+    if not lines:
+        return np.zeros((0, 3)), np.zeros((0, 2), dtype=np.int64), np.zeros(0, dtype=np.int64)
+    counts = np.array([line.shape[0] for line in lines], dtype=np.int64)
+    points = np.concatenate(lines)
+    line_id = np.repeat(np.arange(counts.shape[0]), counts)
+    # Every point except the last of its line starts an edge to its successor
+    starts = np.ones(points.shape[0], dtype=bool)
+    starts[np.cumsum(counts) - 1] = False
+    first = np.nonzero(starts)[0]
+    edges = np.stack([first, first + 1], axis=1)
+    return points, edges, line_id
+
+
+def integration_time(points: np.ndarray, line_id: np.ndarray, speed: np.ndarray, seed_index: np.ndarray) -> np.ndarray:
+    """Time along each polyline, zero at its seed point and negative before it.
+
+    Each segment takes its length over the mean speed of its ends, a trapezoid estimate of the integral of
+    ds / |v| that needs no per-step bookkeeping and works for fixed and adaptive steps alike.
+    """
+    time = np.zeros(points.shape[0])
+    if points.shape[0] < 2:
+        return time
+    same = line_id[1:] == line_id[:-1]
+    seg = np.linalg.norm(np.diff(points, axis=0), axis=1) / np.maximum(0.5 * (speed[1:] + speed[:-1]), 1e-12)
+    seg[~same] = 0.0
+    time[1:] = np.cumsum(seg)
+    # Shift every line so its seed sits at time zero
+    return time - time[seed_index[line_id]]
+
+
+def write_streamline_mesh(mesh: bpy.types.Mesh, points: np.ndarray, edges: np.ndarray, point_attributes: dict) -> None:
+    """Fill an empty mesh with loose edges and point attributes using bulk foreach_set.
+
+    Attribute values are float32 or int arrays with one value per point; int arrays become INT attributes.
+    """
+    mesh.vertices.add(points.shape[0])
+    mesh.vertices.foreach_set('co', np.ascontiguousarray(points, dtype=np.float32).ravel())
+    mesh.edges.add(edges.shape[0])
+    mesh.edges.foreach_set('vertices', np.ascontiguousarray(edges, dtype=np.int32).ravel())
+    for name, values in point_attributes.items():
+        if np.issubdtype(np.asarray(values).dtype, np.integer):
+            attr = mesh.attributes.new(name=name, type='INT', domain='POINT')
+            attr.data.foreach_set('value', np.ascontiguousarray(values, dtype=np.int32))
+        else:
+            attr = mesh.attributes.new(name=name, type='FLOAT', domain='POINT')
+            attr.data.foreach_set('value', np.ascontiguousarray(values, dtype=np.float32))
+    mesh.update()
+
+
+def _new_input(ng, name, socket_type, default, min_value=None):
+    sock = ng.interface.new_socket(name, in_out='INPUT', socket_type=socket_type)
+    sock.default_value = default
+    if min_value is not None:
+        sock.min_value = min_value
+    return sock
+
+
+def get_streamline_tube_group():
+    """Return the shared geometry-nodes group turning streamline edges into tubes with optional arrow heads.
+
+    The group converts the edges to curves, sweeps a circle along them and, when enabled, instances cones at
+    evenly spaced points aligned with the curve tangent. Point attributes such as speed carry over to the tubes.
+    """
+    existing = bpy.data.node_groups.get(TUBE_GROUP_NAME)
+    if existing:
+        return existing
+
+    ng = bpy.data.node_groups.new(TUBE_GROUP_NAME, 'GeometryNodeTree')
+    ng.interface.new_socket('Geometry', in_out='INPUT', socket_type='NodeSocketGeometry')
+    _new_input(ng, 'Radius', 'NodeSocketFloat', 0.02, 0.0)
+    _new_input(ng, 'Resolution', 'NodeSocketInt', 8, 3)
+    _new_input(ng, 'Arrows', 'NodeSocketBool', False)
+    _new_input(ng, 'Arrow Spacing', 'NodeSocketFloat', 1.0, 1e-4)
+    _new_input(ng, 'Arrow Size', 'NodeSocketFloat', 0.08, 0.0)
+    ng.interface.new_socket('Geometry', in_out='OUTPUT', socket_type='NodeSocketGeometry')
+
+    nodes = ng.nodes
+    links = ng.links
+    group_input = nodes.new('NodeGroupInput')
+    group_input.location = (-800, 0)
+    group_output = nodes.new('NodeGroupOutput')
+    group_output.location = (800, 0)
+
+    to_curve = nodes.new('GeometryNodeMeshToCurve')
+    to_curve.location = (-550, 0)
+    links.new(group_input.outputs['Geometry'], to_curve.inputs['Mesh'])
+
+    profile = nodes.new('GeometryNodeCurvePrimitiveCircle')
+    profile.location = (-550, -200)
+    links.new(group_input.outputs['Resolution'], profile.inputs['Resolution'])
+    links.new(group_input.outputs['Radius'], profile.inputs['Radius'])
+
+    sweep = nodes.new('GeometryNodeCurveToMesh')
+    sweep.location = (-250, 0)
+    links.new(to_curve.outputs['Curve'], sweep.inputs['Curve'])
+    links.new(profile.outputs['Curve'], sweep.inputs['Profile Curve'])
+    if 'Fill Caps' in sweep.inputs:
+        sweep.inputs['Fill Caps'].default_value = True
+
+    # Arrow heads: evenly spaced points along the curves, dropped entirely when arrows are off
+    spaced = nodes.new('GeometryNodeCurveToPoints')
+    spaced.mode = 'LENGTH'
+    spaced.location = (-250, -300)
+    links.new(to_curve.outputs['Curve'], spaced.inputs['Curve'])
+    links.new(group_input.outputs['Arrow Spacing'], spaced.inputs['Length'])
+
+    hide = nodes.new('FunctionNodeBooleanMath')
+    hide.operation = 'NOT'
+    hide.location = (-250, -500)
+    links.new(group_input.outputs['Arrows'], hide.inputs[0])
+
+    drop = nodes.new('GeometryNodeDeleteGeometry')
+    drop.domain = 'POINT'
+    drop.location = (0, -300)
+    links.new(spaced.outputs['Points'], drop.inputs['Geometry'])
+    links.new(hide.outputs[0], drop.inputs['Selection'])
+
+    cone = nodes.new('GeometryNodeMeshCone')
+    cone.location = (0, -550)
+    links.new(group_input.outputs['Resolution'], cone.inputs['Vertices'])
+    links.new(group_input.outputs['Arrow Size'], cone.inputs['Radius Bottom'])
+    cone_depth = nodes.new('ShaderNodeMath')
+    cone_depth.operation = 'MULTIPLY'
+    cone_depth.inputs[1].default_value = 2.5
+    cone_depth.location = (-250, -650)
+    links.new(group_input.outputs['Arrow Size'], cone_depth.inputs[0])
+    links.new(cone_depth.outputs[0], cone.inputs['Depth'])
+
+    instance = nodes.new('GeometryNodeInstanceOnPoints')
+    instance.location = (250, -300)
+    links.new(drop.outputs['Geometry'], instance.inputs['Points'])
+    links.new(cone.outputs['Mesh'], instance.inputs['Instance'])
+    links.new(spaced.outputs['Rotation'], instance.inputs['Rotation'])
+
+    realize = nodes.new('GeometryNodeRealizeInstances')
+    realize.location = (450, -300)
+    links.new(instance.outputs['Instances'], realize.inputs['Geometry'])
+
+    join = nodes.new('GeometryNodeJoinGeometry')
+    join.location = (600, 0)
+    links.new(realize.outputs['Geometry'], join.inputs['Geometry'])
+    links.new(sweep.outputs['Mesh'], join.inputs['Geometry'])
+    links.new(join.outputs['Geometry'], group_output.inputs['Geometry'])
+    return ng
+
+
+def apply_tube_modifier(obj: bpy.types.Object, radius: float, arrows: bool) -> None:
+    """Add or update the shared tube modifier on a streamline object."""
+    group = get_streamline_tube_group()
+    modifier = obj.modifiers.get(TUBE_MODIFIER_NAME)
+    if not modifier:
+        modifier = obj.modifiers.new(name=TUBE_MODIFIER_NAME, type='NODES')
+    modifier.node_group = group
+    for item in group.interface.items_tree:
+        if getattr(item, 'in_out', '') != 'INPUT':
+            continue
+        if item.name == 'Radius':
+            set_gn_modifier_input(modifier, item.identifier, float(radius))
+        elif item.name == 'Arrows':
+            set_gn_modifier_input(modifier, item.identifier, bool(arrows))
@@ -1,6 +1,7 @@
 import os
-from typing import Tuple
-from ...operators.utils.volume_mesh_data import VolumeMeshData, VolumeVertex, VolumeFace, VolumeCell
+import numpy as np
+from typing import Optional, Tuple
+from ...operators.utils.volume_mesh_data import VolumeMeshData, VolumeMeshArrays, VolumeVertex, VolumeFace, VolumeCell
 
 VTK_POLYHEDRON = 42
 VTK_TETRA = 10
@@ -9,6 +10,15 @@ VTK_HEXAHEDRON = 12
 VTK_WEDGE = 13
 VTK_PYRAMID = 14
 
+# Faces of the linear volume cells as local point indices, in owner orientation
+_CELL_FACES = {
+	VTK_TETRA: [[0,2,1], [0,1,3], [1,2,3], [0,3,2]],
+	VTK_HEXAHEDRON: [[0,3,2,1], [4,5,6,7], [0,1,5,4], [1,2,6,5], [2,3,7,6], [3,0,4,7]],
+	VTK_WEDGE: [[0,2,1], [3,4,5], [0,1,4,3], [1,2,5,4], [2,0,3,5]],
+	VTK_PYRAMID: [[0,1,2,3], [0,1,4], [1,2,4], [2,3,4], [3,0,4]],
+	VTK_VOXEL: [[0,1,3,2], [4,5,7,6], [0,2,6,4], [1,3,7,5], [0,1,5,4], [2,3,7,6]],
+}
+
 
 def _process_face(volume_data: VolumeMeshData, current_cell: VolumeCell, original_indices):
 	face_key = tuple(sorted(original_indices))
@@ -25,11 +35,8 @@ def _process_face(volume_data: VolumeMeshData, current_cell: VolumeCell, origina
 		current_cell.faces.append(new_face)
 
 
-def read_volume_data_from_vtk(filepath: str) -> Tuple[VolumeMeshData, dict]:
-	"""Read a VTK/VTU/PVTU file and return (VolumeMeshData, point_data). point_data may be empty.
-
-	This function avoids Blender Operator/RNA construction and is safe to call on-demand.
-	"""
+def _read_vtk_dataset(filepath: str):
+	"""Read a VTK/VTU/PVTU/VTP/PVTP file into a VTK dataset that has points; raises RuntimeError otherwise."""
 	try:
 		from vtkmodules.vtkIOLegacy import vtkPolyDataReader
 		from vtkmodules.vtkIOXML import (
@@ -73,20 +80,105 @@ def read_volume_data_from_vtk(filepath: str) -> Tuple[VolumeMeshData, dict]:
 		num_points = 0
 	if num_points == 0:
 		raise RuntimeError("VTK data has no points")
+	return data
+
+
+def read_volume_arrays_from_vtk(filepath: str) -> Optional[VolumeMeshArrays]:
+	"""Read a VTK file straight into flat topology arrays, the same model read_volume_data_from_vtk builds.
+
+	Faces are generated per cell type and matched by their sorted point ids with numpy, so no Python objects are
+	created per point, face or cell. Returns None for grids with polyhedral cells, which need the object reader.
+	"""
+	from vtkmodules.util.numpy_support import vtk_to_numpy
+	data = _read_vtk_dataset(filepath)
+	points = np.asarray(vtk_to_numpy(data.GetPoints().GetData()), dtype=np.float64).reshape(-1, 3)
+	num_cells = int(data.GetNumberOfCells())
+	entry_cell, entry_local, entry_vertices = [], [], []
+	if hasattr(data, 'GetCellTypesArray') and num_cells > 0:
+		types = np.asarray(vtk_to_numpy(data.GetCellTypesArray()), dtype=np.int64)
+		if np.any(types == VTK_POLYHEDRON):
+			return None
+		cells = data.GetCells()
+		offsets = np.asarray(vtk_to_numpy(cells.GetOffsetsArray()), dtype=np.int64)
+		conn = np.asarray(vtk_to_numpy(cells.GetConnectivityArray()), dtype=np.int64)
+		for cell_type, templates in _CELL_FACES.items():
+			sel = np.flatnonzero(types == cell_type)
+			if sel.shape[0] == 0:
+				continue
+			for local, template in enumerate(templates):
+				ids = np.full((sel.shape[0], 4), -1, dtype=np.int64)
+				ids[:, :len(template)] = conn[offsets[sel][:, None] + np.asarray(template)]
+				entry_cell.append(sel)
+				entry_local.append(np.full(sel.shape[0], local, dtype=np.int64))
+				entry_vertices.append(ids)
+	if entry_cell:
+		entry_cell = np.concatenate(entry_cell)
+		entry_local = np.concatenate(entry_local)
+		entry_vertices = np.concatenate(entry_vertices)
+		# Visit the faces of each cell in cell order, then template order, as the object reader does
+		order = np.lexsort((entry_local, entry_cell))
+		entry_cell = entry_cell[order]
+		entry_vertices = entry_vertices[order]
+	else:
+		entry_cell = np.zeros(0, dtype=np.int64)
+		entry_vertices = np.zeros((0, 4), dtype=np.int64)
+	num_entries = entry_cell.shape[0]
 
+	# Entries with the same sorted point ids are one face: owned by its first cell, neighbour of its last
+	keys = np.sort(entry_vertices, axis=1)
+	by_key = np.lexsort(keys.T[::-1]) if num_entries else np.zeros(0, dtype=np.int64)
+	sorted_keys = keys[by_key]
+	starts = np.ones(num_entries, dtype=bool)
+	if num_entries > 1:
+		starts[1:] = np.any(sorted_keys[1:] != sorted_keys[:-1], axis=1)
+	group_of_sorted = np.cumsum(starts) - 1
+	group = np.empty(num_entries, dtype=np.int64)
+	group[by_key] = group_of_sorted
+	num_groups = int(group_of_sorted[-1]) + 1 if num_entries else 0
+	first = np.full(num_groups, num_entries, dtype=np.int64)
+	np.minimum.at(first, group, np.arange(num_entries, dtype=np.int64))
+	last = np.full(num_groups, -1, dtype=np.int64)
+	np.maximum.at(last, group, np.arange(num_entries, dtype=np.int64))
+	# Faces are numbered in order of first appearance
+	face_order = np.argsort(first, kind='stable')
+	face_id = np.empty(num_groups, dtype=np.int64)
+	face_id[face_order] = np.arange(num_groups, dtype=np.int64)
+	first = first[face_order]
+	last = last[face_order]
+	face_rows = entry_vertices[first]
+	face_sizes = np.count_nonzero(face_rows >= 0, axis=1)
+	face_offsets = np.zeros(num_groups + 1, dtype=np.int64)
+	np.cumsum(face_sizes, out=face_offsets[1:])
+	face_vertices = face_rows[face_rows >= 0]
+	face_owner = entry_cell[first]
+	face_neighbour = np.where(last != first, entry_cell[last], -1)
+	cell_face_offsets = np.zeros(num_cells + 1, dtype=np.int64)
+	np.cumsum(np.bincount(entry_cell, minlength=num_cells), out=cell_face_offsets[1:])
+	cell_faces = face_id[group]
+
+	cell_attributes = {}
+	cd = data.GetCellData()
+	for k in range(cd.GetNumberOfArrays() if cd is not None else 0):
+		array = cd.GetArray(k)
+		if array is None:
+			continue
+		name = array.GetName() or f"CellArray_{k}"
+		values = np.asarray(vtk_to_numpy(array), dtype=np.float64)
+		cell_attributes[name] = values.reshape(num_cells, -1)
+	return VolumeMeshArrays(points, face_offsets, face_vertices, face_owner, face_neighbour, cell_face_offsets, cell_faces, cell_attributes)
+
+
+def read_volume_data_from_vtk(filepath: str) -> Tuple[VolumeMeshData, dict]:
+	"""Read a VTK/VTU/PVTU file and return (VolumeMeshData, point_data). point_data may be empty.
+
+	This function avoids Blender Operator/RNA construction and is safe to call on-demand.
+	"""
+	data = _read_vtk_dataset(filepath)
 	volume_data = VolumeMeshData()
 	vtk_points = data.GetPoints()
 	for i in range(vtk_points.GetNumberOfPoints()):
 		volume_data.vertices.append(VolumeVertex(vtk_points.GetPoint(i), original_index=i))
 
-	cell_definitions = {
-		VTK_TETRA: [[0,2,1], [0,1,3], [1,2,3], [0,3,2]],
-		VTK_HEXAHEDRON: [[0,3,2,1], [4,5,6,7], [0,1,5,4], [1,2,6,5], [2,3,7,6], [3,0,4,7]],
-		VTK_WEDGE: [[0,2,1], [3,4,5], [0,1,4,3], [1,2,5,4], [2,0,3,5]],
-		VTK_PYRAMID: [[0,1,2,3], [0,1,4], [1,2,4], [2,3,4], [3,0,4]],
-		VTK_VOXEL: [[0,1,3,2], [4,5,7,6], [0,2,6,4], [1,3,7,5], [0,1,5,4], [2,3,7,6]],
-	}
-
 	try:
 		num_cells = int(data.GetNumberOfCells()) if hasattr(data, 'GetNumberOfCells') else 0
 	except Exception:
@@ -115,8 +207,8 @@ def read_volume_data_from_vtk(filepath: str) -> Tuple[VolumeMeshData, dict]:
 				face = vtk_cell.GetFace(k)
 				face_indices = [face.GetPointId(j) for j in range(face.GetNumberOfPoints())]
 				_process_face(volume_data, new_cell, face_indices)
-		elif cell_type in cell_definitions:
-			face_v_indices_list = cell_definitions[cell_type]
+		elif cell_type in _CELL_FACES:
+			face_v_indices_list = _CELL_FACES[cell_type]
 			for face_v_indices in face_v_indices_list:
 				original_indices = [vtk_cell.GetPointId(j) for j in face_v_indices]
 				_process_face(volume_data, new_cell, original_indices)
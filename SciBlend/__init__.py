@@ -558,10 +558,13 @@ try:
     from .FiltersGenerator.properties.slice_settings import FiltersSliceSettings
     from .FiltersGenerator.properties.calculator_settings import FiltersCalculatorSettings
     from .FiltersGenerator.properties.interpolation_settings import FiltersInterpolationSettings
+    from .FiltersGenerator.properties.conversion_settings import FiltersConversionSettings
+    from .FiltersGenerator.properties.sequence_settings import FiltersSequenceSettings
     from .FiltersGenerator.properties.modifier_item import ModifierItem, CollectionModifiersSettings
     from .FiltersGenerator.operators.create_emitter import FILTERS_OT_create_emitter
     from .FiltersGenerator.operators.place_emitter import FILTERS_OT_place_emitter
     from .FiltersGenerator.operators.generate_streamline import FILTERS_OT_generate_streamline
+    from .FiltersGenerator.operators.generate_pathlines import FILTERS_OT_generate_pathlines
     from .FiltersGenerator.operators.volume_import import FILTERS_OT_volume_import_vdb_sequence
     from .FiltersGenerator.operators.volume_update import FILTERS_OT_volume_update_material, FILTERS_OT_volume_compute_range
     from .FiltersGenerator.operators.volume_list_operators import (
@@ -576,6 +579,8 @@ try:
     from .FiltersGenerator.operators.slice_live import FILTERS_OT_slice_ensure_plane, FILTERS_OT_build_slice_surface
     from .FiltersGenerator.operators.calculator import FILTERS_OT_calculator_apply, FILTERS_OT_calculator_append_var, FILTERS_OT_calculator_append_attr, FILTERS_OT_calculator_append_func
     from .FiltersGenerator.operators.interpolate import FILTERS_OT_apply_interpolation, FILTERS_OT_compute_attribute_range
+    from .FiltersGenerator.operators.convert_data import FILTERS_OT_convert_data
+    from .FiltersGenerator.operators.filter_sequence import FILTERS_OT_filter_sequence, FILTERS_OT_cancel_filter_sequence
     from .FiltersGenerator.operators.collection_modifiers import (
         FILTERS_OT_modifier_item_add,
         FILTERS_OT_modifier_item_remove,
@@ -609,11 +614,14 @@ try:
         FiltersSliceSettings,
         FiltersCalculatorSettings,
         FiltersInterpolationSettings,
+        FiltersConversionSettings,
+        FiltersSequenceSettings,
         ModifierItem,
         CollectionModifiersSettings,
         FILTERS_OT_create_emitter,
         FILTERS_OT_place_emitter,
         FILTERS_OT_generate_streamline,
+        FILTERS_OT_generate_pathlines,
         FILTERS_OT_volume_import_vdb_sequence,
         FILTERS_OT_volume_update_material,
         FILTERS_OT_volume_compute_range,
@@ -633,6 +641,9 @@ try:
         FILTERS_OT_calculator_append_func,
         FILTERS_OT_apply_interpolation,
         FILTERS_OT_compute_attribute_range,
+        FILTERS_OT_convert_data,
+        FILTERS_OT_filter_sequence,
+        FILTERS_OT_cancel_filter_sequence,
         FILTERS_OT_modifier_item_add,
         FILTERS_OT_modifier_item_remove,
         FILTERS_OT_modifier_item_move_up,
@@ -733,7 +744,9 @@ class SCIBLEND_OT_clear_on_demand_cache(bpy.types.Operator):
     def execute(self, context):
         try:
             from .FiltersGenerator.utils.on_demand_loader import clear_on_demand_cache
+            from .FiltersGenerator.utils.filter_cache import clear_result_cache
             clear_on_demand_cache()
+            clear_result_cache()
             self.report({'INFO'}, "On-demand cache cleared")
         except Exception as e:
             self.report({'ERROR'}, f"Failed to clear cache: {e}")
@@ -826,6 +839,24 @@ class SciBlendPanel(bpy.types.Panel):
         col.prop(context.scene, "on_demand_volume_enabled", text="Enabled")
         col.prop(context.scene, "on_demand_data_root", text="Data Root")
         col.prop(context.scene, "on_demand_max_cached", text="Max Cached Models")
+        col.prop(context.scene, "on_demand_cache_budget_mb", text="Memory Budget (MB)")
+        col.prop(context.scene, "on_demand_prefetch_frames", text="Prefetch Frames")
+        col.prop(context.scene, "on_demand_persist_topology", text="Persist Topology Sidecars")
+        try:
+            from .FiltersGenerator.utils.on_demand_loader import get_cache_stats
+            stats = get_cache_stats()
+            col.label(text=f"Cached: {stats['entries']} models, {stats['nbytes'] / (1024 * 1024):.1f} MB")
+            col.label(text=f"Hits: {stats['hits']}  Misses: {stats['misses']}  Evictions: {stats['evictions']}")
+            col.label(text=f"Prefetched: {stats['prefetched']}  In flight: {stats['prefetching']}  Restored: {stats['restored']}")
+        except Exception:
+            pass
+        col.prop(context.scene, "filters_result_cache_mb", text="Filter Result Cache (MB)")
+        try:
+            from .FiltersGenerator.utils.filter_cache import get_result_cache_stats
+            stats = get_result_cache_stats()
+            col.label(text=f"Filter results: {stats['entries']}, {stats['nbytes'] / (1024 * 1024):.1f} MB  Hits: {stats['hits']}  Misses: {stats['misses']}")
+        except Exception:
+            pass
         col.operator("sciblend.clear_on_demand_cache", text="Clear Cache", icon='TRASH')
 
 classes_pre = (
@@ -929,7 +960,57 @@ def register():
     bpy.types.Object.volume_mesh_info = bpy.props.PointerProperty(type=VolumeMeshInfo)
     bpy.types.Scene.on_demand_volume_enabled = bpy.props.BoolProperty(name="On-demand Volume Topology", default=False)
     bpy.types.Scene.on_demand_data_root = bpy.props.StringProperty(name="Data Root", default="", subtype='DIR_PATH')
-    bpy.types.Scene.on_demand_max_cached = bpy.props.IntProperty(name="Max Cached Models", default=4, min=0, soft_max=32)
+    bpy.types.Scene.on_demand_max_cached = bpy.props.IntProperty(name="Max Cached Models", description="Maximum number of on-demand models kept in memory (0 disables the limit)", default=4, min=0, soft_max=32)
+    bpy.types.Scene.on_demand_cache_budget_mb = bpy.props.FloatProperty(
+        name="Memory Budget (MB)",
+        description="Evict least recently used on-demand models when their estimated footprint exceeds this budget (0 disables the limit)",
+        default=2048.0,
+        min=0.0,
+        soft_max=65536.0,
+    )
+    bpy.types.Scene.on_demand_prefetch_frames = bpy.props.IntProperty(
+        name="Prefetch Frames",
+        description="Number of upcoming Frame_{n} models to load in the background during playback (0 disables prefetching)",
+        default=2,
+        min=0,
+        soft_max=8,
+    )
+    bpy.types.Scene.filters_result_cache_mb = bpy.props.FloatProperty(
+        name="Filter Result Cache (MB)",
+        description="Keep clip, slice, threshold and contour results for revisited frames and settings within this budget (0 disables the cache)",
+        default=512.0,
+        min=0.0,
+        soft_max=16384.0,
+    )
+    bpy.types.Scene.on_demand_persist_topology = bpy.props.BoolProperty(
+        name="Persist Topology Sidecars",
+        description="Save volumetric topology models as binary sidecar files so live filters work after reopening the .blend without re-reading VTK files. Costs a write per import; unsaved files keep their sidecars in the temporary directory",
+        default=False,
+    )
+    try:
+        from .FiltersGenerator.utils.on_demand_loader import on_demand_frame_change_handler
+        if on_demand_frame_change_handler not in bpy.app.handlers.frame_change_post:
+            bpy.app.handlers.frame_change_post.append(on_demand_frame_change_handler)
+    except Exception as e:
+        print(f"SciBlend: on-demand prefetch handler not registered: {e}")
+    try:
+        from .FiltersGenerator.utils.grid_field import grid_field_load_post_handler
+        if grid_field_load_post_handler not in bpy.app.handlers.load_post:
+            bpy.app.handlers.load_post.append(grid_field_load_post_handler)
+    except Exception as e:
+        print(f"SciBlend: grid cache cleanup handler not registered: {e}")
+    try:
+        from .FiltersGenerator.utils.live_filters import live_filter_depsgraph_handler
+        if live_filter_depsgraph_handler not in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.append(live_filter_depsgraph_handler)
+    except Exception as e:
+        print(f"SciBlend: live filter handler not registered: {e}")
+    try:
+        from .operators.utils.volume_mesh_store import persist_sidecars_handler
+        if persist_sidecars_handler not in bpy.app.handlers.save_pre:
+            bpy.app.handlers.save_pre.append(persist_sidecars_handler)
+    except Exception as e:
+        print(f"SciBlend: topology sidecar handler not registered: {e}")
 
     if LEGEND_AVAILABLE:
         bpy.types.Scene.legend_settings = bpy.props.PointerProperty(type=LegendSettings)
@@ -989,6 +1070,8 @@ def register():
         from .FiltersGenerator.properties.slice_settings import FiltersSliceSettings
         from .FiltersGenerator.properties.calculator_settings import FiltersCalculatorSettings
         from .FiltersGenerator.properties.interpolation_settings import FiltersInterpolationSettings
+        from .FiltersGenerator.properties.conversion_settings import FiltersConversionSettings
+        from .FiltersGenerator.properties.sequence_settings import FiltersSequenceSettings
         from .FiltersGenerator.properties.modifier_item import CollectionModifiersSettings
         bpy.types.Scene.filters_emitter_settings = bpy.props.PointerProperty(type=FiltersEmitterSettings)
         bpy.types.Scene.filters_volume_settings = bpy.props.PointerProperty(type=VolumeRenderingSettings)
@@ -998,6 +1081,8 @@ def register():
         bpy.types.Scene.filters_slice_settings = bpy.props.PointerProperty(type=FiltersSliceSettings)
         bpy.types.Scene.filters_calculator_settings = bpy.props.PointerProperty(type=FiltersCalculatorSettings)
         bpy.types.Scene.filters_interpolation_settings = bpy.props.PointerProperty(type=FiltersInterpolationSettings)
+        bpy.types.Scene.filters_conversion_settings = bpy.props.PointerProperty(type=FiltersConversionSettings)
+        bpy.types.Scene.filters_sequence_settings = bpy.props.PointerProperty(type=FiltersSequenceSettings)
         bpy.types.Scene.filters_modifier_settings = bpy.props.PointerProperty(type=CollectionModifiersSettings)
 
 
@@ -1013,6 +1098,33 @@ def unregister():
         except Exception:
             pass
 
+    try:
+        from .FiltersGenerator.utils.on_demand_loader import on_demand_frame_change_handler, shutdown_prefetch
+        if on_demand_frame_change_handler in bpy.app.handlers.frame_change_post:
+            bpy.app.handlers.frame_change_post.remove(on_demand_frame_change_handler)
+        shutdown_prefetch()
+    except Exception:
+        pass
+    try:
+        from .FiltersGenerator.utils.grid_field import grid_field_load_post_handler, clear_grid_field_cache
+        if grid_field_load_post_handler in bpy.app.handlers.load_post:
+            bpy.app.handlers.load_post.remove(grid_field_load_post_handler)
+        clear_grid_field_cache(remove_files=True)
+    except Exception:
+        pass
+    try:
+        from .FiltersGenerator.utils.live_filters import live_filter_depsgraph_handler
+        if live_filter_depsgraph_handler in bpy.app.handlers.depsgraph_update_post:
+            bpy.app.handlers.depsgraph_update_post.remove(live_filter_depsgraph_handler)
+    except Exception:
+        pass
+    try:
+        from .operators.utils.volume_mesh_store import persist_sidecars_handler
+        if persist_sidecars_handler in bpy.app.handlers.save_pre:
+            bpy.app.handlers.save_pre.remove(persist_sidecars_handler)
+    except Exception:
+        pass
+
     for cls in reversed(classes):
         try:
             if SHADER_AVAILABLE and cls.__name__ == 'ShaderGeneratorSettings':
@@ -1060,6 +1172,14 @@ def unregister():
         del bpy.types.Scene.on_demand_data_root
     if hasattr(bpy.types.Scene, 'on_demand_max_cached'):
         del bpy.types.Scene.on_demand_max_cached
+    if hasattr(bpy.types.Scene, 'on_demand_cache_budget_mb'):
+        del bpy.types.Scene.on_demand_cache_budget_mb
+    if hasattr(bpy.types.Scene, 'on_demand_prefetch_frames'):
+        del bpy.types.Scene.on_demand_prefetch_frames
+    if hasattr(bpy.types.Scene, 'on_demand_persist_topology'):
+        del bpy.types.Scene.on_demand_persist_topology
+    if hasattr(bpy.types.Scene, 'filters_result_cache_mb'):
+        del bpy.types.Scene.filters_result_cache_mb
     if hasattr(bpy.types.Scene, 'filters_emitter_settings'):
         del bpy.types.Scene.filters_emitter_settings
     if hasattr(bpy.types.Scene, 'filters_volume_settings'):
@@ -1078,6 +1198,10 @@ def unregister():
         del bpy.types.Scene.filters_calculator_settings
     if hasattr(bpy.types.Scene, 'filters_interpolation_settings'):
         del bpy.types.Scene.filters_interpolation_settings
+    if hasattr(bpy.types.Scene, 'filters_conversion_settings'):
+        del bpy.types.Scene.filters_conversion_settings
+    if hasattr(bpy.types.Scene, 'filters_sequence_settings'):
+        del bpy.types.Scene.filters_sequence_settings
 
     if SCIBLENDNODES_AVAILABLE:
         try:
@@ -1,13 +1,80 @@
 import bpy
+import sys
+from itertools import islice
+import numpy as np
 
 
 class VolumeMeshData:
-	"""Container for a single volumetric mesh instance to avoid global state."""
-	def __init__(self):
-		self.cells = []
-		self.faces = []
-		self.vertices = []
-		self.face_map = {}
+	"""Container for a single volumetric mesh instance to avoid global state.
+
+	A model can also be created from a VolumeMeshArrays (for example when restored from a sidecar file);
+	its vertex, face and cell objects are then only built the first time they are accessed.
+	"""
+	def __init__(self, arrays: "VolumeMeshArrays | None" = None):
+		self._cells = []
+		self._faces = []
+		self._vertices = []
+		self._face_map = {}
+		self._arrays = arrays
+		self._needs_objects = arrays is not None
+		self._cell_attribute_names = None
+
+	def _materialize(self) -> None:
+		if self._needs_objects:
+			self._needs_objects = False
+			self._arrays.fill_model(self)
+
+	@property
+	def is_materialized(self) -> bool:
+		"""Return True when the vertex, face and cell objects exist."""
+		return not self._needs_objects
+
+	@property
+	def cells(self):
+		self._materialize()
+		return self._cells
+
+	@property
+	def faces(self):
+		self._materialize()
+		return self._faces
+
+	@property
+	def vertices(self):
+		self._materialize()
+		return self._vertices
+
+	@property
+	def face_map(self):
+		self._materialize()
+		return self._face_map
+
+	@property
+	def arrays(self) -> "VolumeMeshArrays":
+		"""Flat array view of the topology, built from the objects on first use and cached."""
+		if self._arrays is None:
+			self._arrays = VolumeMeshArrays.from_model(self)
+		return self._arrays
+
+	def cell_attribute_names(self) -> list:
+		"""Sorted cell attribute names, cheap enough for UI callbacks: never builds the array view.
+
+		Taken from the arrays when they exist, otherwise collected from the cells once and cached.
+		"""
+		if self._arrays is not None:
+			return sorted(self._arrays.cell_attributes.keys())
+		if self._cell_attribute_names is None:
+			names = set()
+			for cell in self._cells:
+				names.update(cell.attributes.keys())
+			self._cell_attribute_names = sorted(names)
+		return self._cell_attribute_names
+
+	def invalidate_arrays(self) -> None:
+		"""Drop the cached array view after the object topology was edited."""
+		self._materialize()
+		self._arrays = None
+		self._cell_attribute_names = None
 
 
 class VolumeVertex:
@@ -46,6 +113,372 @@ class VolumeCell:
 		self.attributes = {}
 
 
+class VolumeMeshArrays:
+	"""Flat NumPy representation of a VolumeMeshData topology.
+
+	Vertex indices are positions in `VolumeMeshData.vertices` (equal to `blender_v_index` for imported meshes)
+	and cell indices are positions in `VolumeMeshData.cells`. Faces are stored in CSR form with their vertices
+	in owner orientation; boundary faces have a neighbour of -1. Cell attributes are (C, k) float arrays with
+	NaN where a cell lacks the attribute.
+	"""
+	def __init__(self, points, face_offsets, face_vertices, face_owner, face_neighbour, cell_face_offsets, cell_faces, cell_attributes=None):
+		self.points = points
+		self.face_offsets = face_offsets
+		self.face_vertices = face_vertices
+		self.face_owner = face_owner
+		self.face_neighbour = face_neighbour
+		self.cell_face_offsets = cell_face_offsets
+		self.cell_faces = cell_faces
+		self.cell_attributes = dict(cell_attributes or {})
+		self._derived = {}
+
+	@property
+	def num_points(self) -> int:
+		return int(self.points.shape[0])
+
+	@property
+	def num_faces(self) -> int:
+		return int(self.face_owner.shape[0])
+
+	@property
+	def num_cells(self) -> int:
+		return int(self.cell_face_offsets.shape[0] - 1)
+
+	def topology_arrays(self) -> dict:
+		"""Return the named topology arrays, excluding cell attributes."""
+		return {
+			'points': self.points,
+			'face_offsets': self.face_offsets,
+			'face_vertices': self.face_vertices,
+			'face_owner': self.face_owner,
+			'face_neighbour': self.face_neighbour,
+			'cell_face_offsets': self.cell_face_offsets,
+			'cell_faces': self.cell_faces,
+		}
+
+	@property
+	def nbytes(self) -> int:
+		total = sum(int(a.nbytes) for a in self.topology_arrays().values())
+		total += sum(int(a.nbytes) for a in self.cell_attributes.values())
+		for value in self._derived.values():
+			for a in (value if isinstance(value, tuple) else (value,)):
+				total += int(getattr(a, 'nbytes', 0))
+		return total
+
+	def cell_points(self) -> tuple:
+		"""Return the cell-to-point incidence as CSR (offsets, point indices), each cell's points sorted and unique."""
+		cached = self._derived.get('cell_points')
+		if cached is not None:
+			return cached
+		num_cells = self.num_cells
+		face_sizes = np.diff(self.face_offsets)
+		cell_of_entry = np.repeat(np.arange(num_cells, dtype=np.int64), np.diff(self.cell_face_offsets))
+		_, pts = csr_gather(self.face_offsets, self.face_vertices, self.cell_faces)
+		cells = np.repeat(cell_of_entry, face_sizes[self.cell_faces])
+		# Entries are grouped by cell already, so a stable sort sees short natural runs and stays near-linear
+		keys = np.sort(cells * max(1, self.num_points) + pts, kind='stable')
+		if keys.shape[0] > 1:
+			keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+		cells = keys // max(1, self.num_points)
+		pts = keys % max(1, self.num_points)
+		offsets = np.zeros(num_cells + 1, dtype=np.int64)
+		np.cumsum(np.bincount(cells, minlength=num_cells), out=offsets[1:])
+		cached = (offsets, pts)
+		self._derived['cell_points'] = cached
+		return cached
+
+	def point_cells(self) -> tuple:
+		"""Return the point-to-cell incidence as CSR (offsets, cell indices), the transpose of cell_points."""
+		cached = self._derived.get('point_cells')
+		if cached is not None:
+			return cached
+		offsets, pts = self.cell_points()
+		cells = np.repeat(np.arange(self.num_cells, dtype=np.int64), np.diff(offsets))
+		order = np.argsort(pts, kind='stable')
+		point_offsets = np.zeros(self.num_points + 1, dtype=np.int64)
+		np.cumsum(np.bincount(pts, minlength=self.num_points), out=point_offsets[1:])
+		cached = (point_offsets, cells[order])
+		self._derived['point_cells'] = cached
+		return cached
+
+	def cell_volumes(self) -> np.ndarray:
+		"""Return the volume of every cell from the divergence theorem over its fan-triangulated faces."""
+		cached = self._derived.get('cell_volumes')
+		if cached is not None:
+			return cached
+		points = np.asarray(self.points, dtype=np.float64)
+		if points.shape[0]:
+			# Centre the coordinates so the signed tetrahedra do not cancel at large offsets
+			points = points - points.mean(axis=0)
+		sizes = np.diff(self.face_offsets)
+		tri_count = np.maximum(sizes - 2, 0)
+		tri_face = np.repeat(np.arange(self.num_faces, dtype=np.int64), tri_count)
+		fan = np.arange(tri_face.shape[0], dtype=np.int64) - (np.cumsum(tri_count) - tri_count)[tri_face] + 1
+		base = self.face_offsets[:-1][tri_face]
+		p0 = points[self.face_vertices[base]]
+		p1 = points[self.face_vertices[base + fan]]
+		p2 = points[self.face_vertices[base + fan + 1]]
+		signed = np.einsum('ij,ij->i', p0, np.cross(p1, p2)) / 6.0
+		face_volume = np.bincount(tri_face, weights=signed, minlength=self.num_faces)
+		owner = self.face_owner
+		neighbour = self.face_neighbour
+		volumes = np.bincount(owner[owner >= 0], weights=face_volume[owner >= 0], minlength=self.num_cells)
+		volumes -= np.bincount(neighbour[neighbour >= 0], weights=face_volume[neighbour >= 0], minlength=self.num_cells)
+		cached = np.abs(volumes)
+		self._derived['cell_volumes'] = cached
+		return cached
+
+	def cell_point_volumes(self) -> np.ndarray:
+		"""Return each cell's volume split among its points, aligned with the entries of cell_points.
+
+		Cells are cut into tetrahedra from their point mean to their fan-triangulated faces; a tetrahedron gives a
+		quarter of its volume to each face corner, and the quarters at the mean are spread evenly over the cell's
+		points. The shares of a cell weight its points so that a linear field averages to its value at the cell's
+		volume centroid.
+		"""
+		cached = self._derived.get('cell_point_volumes')
+		if cached is not None:
+			return cached
+		offsets, pts = self.cell_points()
+		num_points = max(1, self.num_points)
+		counts = np.diff(offsets)
+		keys = np.repeat(np.arange(self.num_cells, dtype=np.int64), counts) * num_points + pts
+		points = np.asarray(self.points, dtype=np.float64)
+		centroids = self.cell_centroids()
+		entry_cell = np.repeat(np.arange(self.num_cells, dtype=np.int64), np.diff(self.cell_face_offsets))
+		sizes = np.diff(self.face_offsets)
+		tri_count = np.maximum(sizes - 2, 0)[self.cell_faces]
+		tri_entry = np.repeat(np.arange(self.cell_faces.shape[0], dtype=np.int64), tri_count)
+		fan = np.arange(tri_entry.shape[0], dtype=np.int64) - (np.cumsum(tri_count) - tri_count)[tri_entry] + 1
+		base = self.face_offsets[:-1][self.cell_faces[tri_entry]]
+		tri_cell = entry_cell[tri_entry]
+		corners = [self.face_vertices[base], self.face_vertices[base + fan], self.face_vertices[base + fan + 1]]
+		centre = centroids[tri_cell]
+		edges = [points[c] - centre for c in corners]
+		quarter = np.abs(np.einsum('ij,ij->i', edges[0], np.cross(edges[1], edges[2]))) / 24.0
+		shares = np.zeros(keys.shape[0], dtype=np.float64)
+		for c in corners:
+			shares += np.bincount(np.searchsorted(keys, tri_cell * num_points + c), weights=quarter, minlength=keys.shape[0])
+		at_centre = np.bincount(tri_cell, weights=quarter, minlength=self.num_cells)
+		shares += np.repeat(at_centre / np.maximum(counts, 1), counts)
+		self._derived['cell_point_volumes'] = shares
+		return shares
+
+	def cell_centroids(self) -> np.ndarray:
+		"""Return the (C, 3) mean of each cell's unique points; cells without points get NaN."""
+		cached = self._derived.get('cell_centroids')
+		if cached is not None:
+			return cached
+		offsets, pts = self.cell_points()
+		counts = np.diff(offsets)
+		points = np.asarray(self.points, dtype=np.float64)
+		owners = np.repeat(np.arange(self.num_cells), counts)
+		sums = np.stack([np.bincount(owners, weights=points[:, k][pts], minlength=self.num_cells) for k in range(3)], axis=1)
+		with np.errstate(invalid='ignore', divide='ignore'):
+			cached = np.where(counts[:, None] > 0, sums / np.maximum(counts, 1)[:, None], np.nan)
+		self._derived['cell_centroids'] = cached
+		return cached
+
+	def cell_bounds(self) -> tuple:
+		"""Return per-cell axis-aligned bounds as ((C, 3) minimum, (C, 3) maximum); empty cells get inverted bounds."""
+		cached = self._derived.get('cell_bounds')
+		if cached is not None:
+			return cached
+		offsets, pts = self.cell_points()
+		lo = np.full((self.num_cells, 3), np.inf, dtype=np.float64)
+		hi = np.full((self.num_cells, 3), -np.inf, dtype=np.float64)
+		nonempty = np.diff(offsets) > 0
+		if nonempty.any():
+			points = np.asarray(self.points, dtype=np.float64)
+			starts = offsets[:-1][nonempty]
+			for k in range(3):
+				column = points[:, k][pts]
+				lo[nonempty, k] = np.minimum.reduceat(column, starts)
+				hi[nonempty, k] = np.maximum.reduceat(column, starts)
+		cached = (lo, hi)
+		self._derived['cell_bounds'] = cached
+		return cached
+
+	def cell_grid(self) -> tuple:
+		"""Return a uniform grid index over the cells, binned by centroid.
+
+		The result is (bin offsets, cells sorted by bin, (B, 3) bin minimum, (B, 3) bin maximum), where the bin bounds
+		enclose the bounds of every member cell. Bins hold about 64 cells.
+		"""
+		cached = self._derived.get('cell_grid')
+		if cached is not None:
+			return cached
+		centroids = self.cell_centroids()
+		cell_lo, cell_hi = self.cell_bounds()
+		valid = ~np.isnan(centroids[:, 0])
+		resolution = max(1, int(round((max(1, int(valid.sum())) / 64.0) ** (1.0 / 3.0))))
+		num_bins = resolution ** 3
+		cells = np.flatnonzero(valid)
+		if cells.shape[0]:
+			origin = centroids[cells].min(axis=0)
+			extent = np.maximum(centroids[cells].max(axis=0) - origin, 1e-30)
+			ijk = np.clip(((centroids[cells] - origin) / extent * resolution).astype(np.int64), 0, resolution - 1)
+			bins = (ijk[:, 0] * resolution + ijk[:, 1]) * resolution + ijk[:, 2]
+		else:
+			bins = np.zeros(0, dtype=np.int64)
+		order = np.argsort(bins, kind='stable')
+		bin_cells = cells[order]
+		counts = np.bincount(bins, minlength=num_bins)
+		bin_offsets = np.zeros(num_bins + 1, dtype=np.int64)
+		np.cumsum(counts, out=bin_offsets[1:])
+		bin_lo = np.full((num_bins, 3), np.inf, dtype=np.float64)
+		bin_hi = np.full((num_bins, 3), -np.inf, dtype=np.float64)
+		filled = counts > 0
+		if filled.any():
+			starts = bin_offsets[:-1][filled]
+			bin_lo[filled] = np.minimum.reduceat(cell_lo[bin_cells], starts, axis=0)
+			bin_hi[filled] = np.maximum.reduceat(cell_hi[bin_cells], starts, axis=0)
+		cached = (bin_offsets, bin_cells, bin_lo, bin_hi)
+		self._derived['cell_grid'] = cached
+		return cached
+
+	def classify_by_plane(self, normal, offset: float) -> tuple:
+		"""Classify cells against the plane normal . x + offset = 0 in model space.
+
+		Returns (side of each centroid as int8 -1/0/+1, cells whose bounds cross the plane). Grid bins entirely on
+		one side label all their cells at once; only cells in straddling bins are tested individually.
+		"""
+		normal = np.asarray(normal, dtype=np.float64)
+		bin_offsets, bin_cells, bin_lo, bin_hi = self.cell_grid()
+		side = np.zeros(self.num_cells, dtype=np.int8)
+		filled = np.diff(bin_offsets) > 0
+		with np.errstate(invalid='ignore'):
+			centre = (bin_lo + bin_hi) * 0.5 @ normal + offset
+			radius = (bin_hi - bin_lo) * 0.5 @ np.abs(normal)
+		positive = filled & (centre - radius > 0.0)
+		negative = filled & (centre + radius < 0.0)
+		counts = np.diff(bin_offsets)
+		side[bin_cells] = np.repeat(np.where(positive, 1, np.where(negative, -1, 0)).astype(np.int8), counts)
+		straddling = np.flatnonzero(filled & ~positive & ~negative)
+		_, members = csr_gather(bin_offsets, bin_cells, straddling)
+		side[members] = np.sign(self.cell_centroids()[members] @ normal + offset).astype(np.int8)
+		cell_lo, cell_hi = self.cell_bounds()
+		member_centre = (cell_lo[members] + cell_hi[members]) * 0.5 @ normal + offset
+		member_radius = (cell_hi[members] - cell_lo[members]) * 0.5 @ np.abs(normal)
+		crossing = members[np.abs(member_centre) <= member_radius]
+		return side, np.sort(crossing)
+
+	def exposed_faces(self, cell_mask) -> tuple:
+		"""Return faces separating selected cells from unselected cells or the exterior.
+
+		The result is (face indices, selected cell per face, flip flags); flipped faces belong to their neighbour and
+		must be reversed so normals point away from the selected cell, like VolumeFace.get_vertices_for_cell.
+		"""
+		mask = np.asarray(cell_mask, dtype=bool)
+		owner = self.face_owner
+		neighbour = self.face_neighbour
+		owner_in = np.zeros(owner.shape[0], dtype=bool)
+		valid_owner = owner >= 0
+		owner_in[valid_owner] = mask[owner[valid_owner]]
+		neigh_in = np.zeros(neighbour.shape[0], dtype=bool)
+		valid_neigh = neighbour >= 0
+		neigh_in[valid_neigh] = mask[neighbour[valid_neigh]]
+		from_owner = np.flatnonzero(owner_in & ~neigh_in)
+		from_neigh = np.flatnonzero(neigh_in & ~owner_in)
+		faces = np.concatenate((from_owner, from_neigh))
+		cells = np.concatenate((owner[from_owner], neighbour[from_neigh]))
+		flip = np.concatenate((np.zeros(from_owner.shape[0], dtype=bool), np.ones(from_neigh.shape[0], dtype=bool)))
+		return faces, cells, flip
+
+	def face_polygons(self, face_ids, flip=None) -> tuple:
+		"""Return CSR (offsets, vertex indices) polygons for the given faces, reversing those flagged in flip."""
+		return csr_gather(self.face_offsets, self.face_vertices, face_ids, flip)
+
+	@classmethod
+	def from_model(cls, model: VolumeMeshData) -> "VolumeMeshArrays":
+		"""Flatten the object topology of a model into arrays."""
+		vertices = model.vertices
+		faces = model.faces
+		cells = model.cells
+		v_index = {id(v): i for i, v in enumerate(vertices)}
+		c_index = {id(c): i for i, c in enumerate(cells)}
+		f_index = {id(f): i for i, f in enumerate(faces)}
+		points = np.array([tuple(v.co) for v in vertices], dtype=np.float64).reshape(-1, 3)
+		face_sizes = np.fromiter((len(f.vertices) for f in faces), dtype=np.int64, count=len(faces))
+		face_offsets = np.zeros(len(faces) + 1, dtype=np.int64)
+		np.cumsum(face_sizes, out=face_offsets[1:])
+		face_vertices = np.fromiter((v_index[id(v)] for f in faces for v in f.vertices), dtype=np.int64, count=int(face_offsets[-1]))
+		face_owner = np.fromiter((c_index.get(id(f.owner), -1) for f in faces), dtype=np.int64, count=len(faces))
+		face_neighbour = np.fromiter((c_index.get(id(f.neighbour), -1) for f in faces), dtype=np.int64, count=len(faces))
+		cell_sizes = np.fromiter((len(c.faces) for c in cells), dtype=np.int64, count=len(cells))
+		cell_face_offsets = np.zeros(len(cells) + 1, dtype=np.int64)
+		np.cumsum(cell_sizes, out=cell_face_offsets[1:])
+		cell_faces = np.fromiter((f_index[id(f)] for c in cells for f in c.faces), dtype=np.int64, count=int(cell_face_offsets[-1]))
+		widths = {}
+		for c in cells:
+			for name, val in c.attributes.items():
+				k = len(val) if isinstance(val, (list, tuple)) else 1
+				widths[name] = max(widths.get(name, 1), k)
+		cell_attributes = {}
+		for name, width in widths.items():
+			arr = np.full((len(cells), width), np.nan, dtype=np.float64)
+			for i, c in enumerate(cells):
+				val = c.attributes.get(name)
+				if val is None:
+					continue
+				try:
+					row = tuple(val) if isinstance(val, (list, tuple)) else (val,)
+					arr[i, :len(row)] = row
+				except Exception:
+					continue
+			cell_attributes[name] = arr
+		return cls(points, face_offsets, face_vertices, face_owner, face_neighbour, cell_face_offsets, cell_faces, cell_attributes)
+
+	def fill_model(self, model: VolumeMeshData) -> None:
+		"""Build vertex, face and cell objects for a model from these arrays."""
+		model._vertices = vertices = []
+		for i, co in enumerate(self.points.tolist()):
+			v = VolumeVertex(tuple(co), original_index=i)
+			v.blender_v_index = i
+			vertices.append(v)
+		names = list(self.cell_attributes.keys())
+		columns = [self.cell_attributes[n].tolist() for n in names]
+		model._cells = cells = []
+		for i in range(self.num_cells):
+			cell = VolumeCell()
+			for name, col in zip(names, columns):
+				row = col[i]
+				if row and row[0] == row[0]:
+					cell.attributes[name] = tuple(row)
+			cells.append(cell)
+		offsets = self.face_offsets.tolist()
+		fv = self.face_vertices.tolist()
+		owners = self.face_owner.tolist()
+		neighbours = self.face_neighbour.tolist()
+		model._faces = faces = []
+		model._face_map = face_map = {}
+		for i in range(self.num_faces):
+			idx = fv[offsets[i]:offsets[i + 1]]
+			face = VolumeFace([vertices[j] for j in idx])
+			face.owner = cells[owners[i]] if owners[i] >= 0 else None
+			face.neighbour = cells[neighbours[i]] if neighbours[i] >= 0 else None
+			faces.append(face)
+			face_map[tuple(sorted(idx))] = face
+		c_offsets = self.cell_face_offsets.tolist()
+		cf = self.cell_faces.tolist()
+		for i, cell in enumerate(cells):
+			cell.faces = [faces[j] for j in cf[c_offsets[i]:c_offsets[i + 1]]]
+
+
+def csr_gather(offsets, values, rows, reverse=None) -> tuple:
+	"""Gather the CSR rows listed in `rows` into a new CSR (offsets, values), optionally reversing flagged rows."""
+	rows = np.asarray(rows, dtype=np.int64)
+	starts = offsets[rows]
+	sizes = offsets[rows + 1] - starts
+	new_offsets = np.zeros(rows.shape[0] + 1, dtype=np.int64)
+	np.cumsum(sizes, out=new_offsets[1:])
+	local = np.arange(int(new_offsets[-1]), dtype=np.int64) - np.repeat(new_offsets[:-1], sizes)
+	if reverse is not None:
+		rev = np.repeat(np.asarray(reverse, dtype=bool), sizes)
+		local = np.where(rev, np.repeat(sizes, sizes) - 1 - local, local)
+	return new_offsets, np.asarray(values)[np.repeat(starts, sizes) + local]
+
+
 VOLUME_MODEL_REGISTRY = {}
 
 
@@ -62,4 +495,60 @@ def get_model(object_name: str) -> VolumeMeshData | None:
 def unregister_model(object_name: str) -> None:
 	"""Remove a registered VolumeMeshData entry if present."""
 	if object_name in VOLUME_MODEL_REGISTRY:
-		VOLUME_MODEL_REGISTRY.pop(object_name, None) 
\ No newline at end of file
+		VOLUME_MODEL_REGISTRY.pop(object_name, None) 
+
+
+def _sampled_nbytes(items, measure, max_samples: int = 256) -> int:
+	"""Estimate the total size of items by measuring an evenly strided sample and extrapolating."""
+	count = len(items)
+	if count == 0:
+		return 0
+	stride = max(1, count // max_samples)
+	sampled = 0
+	total = 0
+	for i in range(0, count, stride):
+		try:
+			total += measure(items[i])
+		except Exception:
+			continue
+		sampled += 1
+	if sampled == 0:
+		return 0
+	return int(total * (count / float(sampled)))
+
+
+def _vertex_nbytes(v: VolumeVertex) -> int:
+	co = getattr(v, 'co', ())
+	return sys.getsizeof(v) + sys.getsizeof(v.__dict__) + sys.getsizeof(co) + sum(sys.getsizeof(c) for c in co)
+
+
+def _face_nbytes(f: VolumeFace) -> int:
+	return sys.getsizeof(f) + sys.getsizeof(f.__dict__) + sys.getsizeof(f.vertices)
+
+
+def _cell_nbytes(c: VolumeCell) -> int:
+	size = sys.getsizeof(c) + sys.getsizeof(c.__dict__) + sys.getsizeof(c.faces) + sys.getsizeof(c.attributes)
+	for val in c.attributes.values():
+		size += sys.getsizeof(val)
+		if isinstance(val, (list, tuple)):
+			size += sum(sys.getsizeof(x) for x in val)
+	return size
+
+
+def estimate_model_nbytes(model: VolumeMeshData) -> int:
+	"""Estimate the in-memory footprint of a model in bytes, including the face map and any cached arrays."""
+	if model is None:
+		return 0
+	arrays = getattr(model, '_arrays', None)
+	total = sys.getsizeof(model) + (arrays.nbytes if arrays is not None else 0)
+	if not model.is_materialized:
+		return int(total)
+	total += sys.getsizeof(model.vertices) + sys.getsizeof(model.faces) + sys.getsizeof(model.cells)
+	total += _sampled_nbytes(model.vertices, _vertex_nbytes)
+	total += _sampled_nbytes(model.faces, _face_nbytes)
+	total += _sampled_nbytes(model.cells, _cell_nbytes)
+	face_map = model.face_map
+	if face_map:
+		keys = list(islice(face_map.keys(), 256))
+		total += sys.getsizeof(face_map) + int(sum(sys.getsizeof(k) for k in keys) * (len(face_map) / float(len(keys))))
+	return int(total)
@@ -0,0 +1,194 @@
+import bpy
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+import numpy as np
+from typing import Optional
+from bpy.app.handlers import persistent
+from .volume_mesh_data import VolumeMeshData, VolumeMeshArrays
+
+SIDECAR_DIRNAME = "sciblend_topology"
+SIDECAR_EXT = ".sbtopo"
+KEY_PROP = "sciblend_topology_key"
+FILE_PROP = "sciblend_topology_file"
+
+_MAGIC = b"SBTOPO01"
+_ALIGN = 64
+_HASH_CHUNK = 1 << 20
+
+
+def source_file_key(filepath: str) -> str:
+	"""Return a content key for a source file: SHA-1 of its size plus its first and last MiB.
+
+	Hashing only the ends keeps the key cheap for multi-GB datasets while still changing whenever a solver
+	rewrites the file.
+	"""
+	h = hashlib.sha1()
+	size = os.path.getsize(filepath)
+	h.update(str(size).encode('ascii'))
+	with open(filepath, 'rb') as fh:
+		h.update(fh.read(_HASH_CHUNK))
+		if size > 2 * _HASH_CHUNK:
+			fh.seek(size - _HASH_CHUNK)
+			h.update(fh.read(_HASH_CHUNK))
+	return h.hexdigest()
+
+
+def sidecar_dirs() -> list:
+	"""Return candidate sidecar directories: next to the saved .blend first, then the temporary directory."""
+	dirs = []
+	blend = getattr(bpy.data, 'filepath', '') or ''
+	if blend:
+		dirs.append(os.path.join(os.path.dirname(bpy.path.abspath(blend)), SIDECAR_DIRNAME))
+	dirs.append(os.path.join(tempfile.gettempdir(), SIDECAR_DIRNAME))
+	return dirs
+
+
+def _aligned(offset: int) -> int:
+	return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def write_sidecar(path: str, arrays: VolumeMeshArrays) -> None:
+	"""Write arrays to a sidecar file: magic, header length, JSON header, then 64-byte aligned raw arrays."""
+	named = dict(arrays.topology_arrays())
+	for name, arr in arrays.cell_attributes.items():
+		named[f"cell:{name}"] = arr
+	entries = {}
+	offset = 0
+	for name, arr in named.items():
+		arr = np.ascontiguousarray(arr)
+		named[name] = arr
+		entries[name] = {'dtype': arr.dtype.str, 'shape': list(arr.shape), 'offset': offset}
+		offset = _aligned(offset + arr.nbytes)
+	header = json.dumps({'version': 1, 'arrays': entries}).encode('utf-8')
+	data_start = _aligned(len(_MAGIC) + 8 + len(header))
+	os.makedirs(os.path.dirname(path), exist_ok=True)
+	tmp_path = f"{path}.tmp"
+	with open(tmp_path, 'wb') as fh:
+		fh.write(_MAGIC)
+		fh.write(len(header).to_bytes(8, 'little'))
+		fh.write(header)
+		for name, arr in named.items():
+			fh.seek(data_start + entries[name]['offset'])
+			fh.write(arr.tobytes())
+	os.replace(tmp_path, path)
+
+
+def read_sidecar(path: str) -> VolumeMeshArrays:
+	"""Open a sidecar file as read-only memory-mapped arrays."""
+	with open(path, 'rb') as fh:
+		if fh.read(len(_MAGIC)) != _MAGIC:
+			raise ValueError(f"Not a SciBlend topology file: {path}")
+		header_len = int.from_bytes(fh.read(8), 'little')
+		header = json.loads(fh.read(header_len).decode('utf-8'))
+	data_start = _aligned(len(_MAGIC) + 8 + header_len)
+	mapped = {}
+	for name, entry in header.get('arrays', {}).items():
+		shape = tuple(entry['shape'])
+		if int(np.prod(shape)) == 0:
+			mapped[name] = np.zeros(shape, dtype=np.dtype(entry['dtype']))
+			continue
+		mapped[name] = np.memmap(path, dtype=np.dtype(entry['dtype']), mode='r', offset=data_start + entry['offset'], shape=shape)
+	cell_attributes = {name[len("cell:"):]: arr for name, arr in mapped.items() if name.startswith("cell:")}
+	return VolumeMeshArrays(
+		mapped['points'],
+		mapped['face_offsets'],
+		mapped['face_vertices'],
+		mapped['face_owner'],
+		mapped['face_neighbour'],
+		mapped['cell_face_offsets'],
+		mapped['cell_faces'],
+		cell_attributes,
+	)
+
+
+def save_model_sidecar(obj: bpy.types.Object, model: VolumeMeshData, source_path: str) -> Optional[str]:
+	"""Persist a model as a sidecar keyed by its source file and record the key on the object.
+
+	Returns the sidecar path, or None when the source file cannot be hashed or the file cannot be written.
+	"""
+	try:
+		key = source_file_key(source_path)
+	except Exception as e:
+		print(f"[SciBlend] Topology sidecar: cannot hash '{source_path}': {e}")
+		return None
+	path = os.path.join(sidecar_dirs()[0], key + SIDECAR_EXT)
+	try:
+		if not os.path.isfile(path):
+			write_sidecar(path, model.arrays)
+	except Exception as e:
+		print(f"[SciBlend] Topology sidecar: write failed for '{path}': {e}")
+		return None
+	try:
+		obj[KEY_PROP] = key
+		obj[FILE_PROP] = path
+	except Exception:
+		pass
+	return path
+
+
+def find_sidecar(obj: bpy.types.Object) -> Optional[str]:
+	"""Return the sidecar path recorded for an object, searching the known sidecar directories by key."""
+	key = str(obj.get(KEY_PROP, '') or '')
+	if not key:
+		return None
+	recorded = str(obj.get(FILE_PROP, '') or '')
+	candidates = [recorded] if recorded else []
+	candidates += [os.path.join(d, key + SIDECAR_EXT) for d in sidecar_dirs()]
+	for path in candidates:
+		if os.path.isfile(path):
+			return path
+	return None
+
+
+def load_model_sidecar(obj: bpy.types.Object) -> Optional[VolumeMeshData]:
+	"""Restore the model of an object from its sidecar; object lists are built lazily on first access."""
+	path = find_sidecar(obj)
+	if not path:
+		return None
+	try:
+		return VolumeMeshData(read_sidecar(path))
+	except Exception as e:
+		print(f"[SciBlend] Topology sidecar: read failed for '{path}': {e}")
+		return None
+
+
+def persist_sidecars_with_blend(blend_path: str = '') -> int:
+	"""Copy sidecars referenced by objects into the directory next to the .blend; returns the number copied."""
+	blend = blend_path or getattr(bpy.data, 'filepath', '') or ''
+	if not blend:
+		return 0
+	target_dir = os.path.join(os.path.dirname(bpy.path.abspath(blend)), SIDECAR_DIRNAME)
+	copied = 0
+	for obj in bpy.data.objects:
+		key = str(obj.get(KEY_PROP, '') or '')
+		if not key:
+			continue
+		target = os.path.join(target_dir, key + SIDECAR_EXT)
+		if not os.path.isfile(target):
+			source = find_sidecar(obj)
+			if not source or os.path.abspath(source) == os.path.abspath(target):
+				continue
+			try:
+				os.makedirs(target_dir, exist_ok=True)
+				shutil.copy2(source, target)
+				copied += 1
+			except Exception as e:
+				print(f"[SciBlend] Topology sidecar: copy failed for '{source}': {e}")
+				continue
+		try:
+			obj[FILE_PROP] = target
+		except Exception:
+			pass
+	return copied
+
+
+@persistent
+def persist_sidecars_handler(filepath=None, *args):
+	"""save_pre handler that keeps topology sidecars next to the .blend being written."""
+	try:
+		persist_sidecars_with_blend(filepath if isinstance(filepath, str) else '')
+	except Exception as e:
+		print(f"[SciBlend] Topology sidecar: persist on save failed: {e}")
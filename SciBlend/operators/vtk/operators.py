@@ -11,6 +11,7 @@ from datetime import datetime, timedelta
 from ..utils.scene import clear_scene, keyframe_visibility_single_frame, enforce_constant_interpolation
 from ..utils.scene import get_import_target_collection
 from ..utils.volume_mesh_data import VolumeMeshData, VolumeVertex, VolumeFace, VolumeCell, register_model
+from ..utils.volume_mesh_store import save_model_sidecar
 
 # VTK cell type ids
 VTK_VERTEX = 1
@@ -55,6 +56,10 @@ class ImportVTKAnimationOperator(Operator, ImportHelper):
 	create_smooth_groups: BoolProperty(name="Create Smooth Groups", default=True)
 	height_scale: FloatProperty(name="Height Scale", default=1.0, min=0.01, max=100.0)
 	component_name_map_json: StringProperty(name="Component Name Map (JSON)", description="Optional JSON mapping of base array name to list of component names.", default="")
+	parallel_pieces: BoolProperty(name="Read Pieces in Parallel", description="Read the pieces of .pvtu/.pvtp files concurrently and keep only the merged skin faces; no volume model is built, so filters need on-demand loading enabled to load it from the file", default=False)
+	piece_workers: IntProperty(name="Piece Workers", description="Worker threads for piece reading (0 = one per CPU)", default=0, min=0, max=64)
+	out_of_core: BoolProperty(name="Out-of-Core Skin", description="Stream cells of .vtu/.vtk/.pvtu grids in chunks through disk-backed face runs and import only the skin, for grids larger than memory; volume filters are not available on such meshes", default=False)
+	chunk_cells: IntProperty(name="Chunk Cells", description="Cells processed per chunk in out-of-core mode; bounds peak memory", default=500000, min=1000)
 
 	def _vtk_available(self) -> bool:
 		"""Return True if VTK modules can be imported in the current environment."""
@@ -86,17 +91,35 @@ class ImportVTKAnimationOperator(Operator, ImportHelper):
 			filepath = os.path.join(self.directory, file_elem.name)
 			frame = self.start_frame_number + i
 			per_item_start = time.time()
-			volume_data, point_data, edges = self._read_grid(filepath)
-			if not volume_data or len(volume_data.vertices) == 0:
-				self.report({'ERROR'}, f"Failed to read file {file_elem.name}: No vertices found.")
-				continue
-			obj = self._create_mesh(context, volume_data, point_data, f"Frame_{frame}", edges)
+			volume_data = None
+			extension = os.path.splitext(filepath)[1].lower()
+			if (self.out_of_core and extension in ('.vtu', '.vtk', '.pvtu')) or (self.parallel_pieces and extension in ('.pvtu', '.pvtp')):
+				try:
+					skin = self._read_skin(filepath, extension)
+				except Exception as e:
+					self.report({'ERROR'}, f"Failed to read file {file_elem.name}: {e}")
+					continue
+				if skin['points'].shape[0] == 0:
+					self.report({'ERROR'}, f"Failed to read file {file_elem.name}: No vertices found.")
+					continue
+				obj = self._create_skin_mesh(context, skin, f"Frame_{frame}")
+				if self.out_of_core:
+					# The streamed skin is compacted, so filters must not load the whole grid for it
+					obj["sciblend_volume_skin_only"] = True
+			else:
+				volume_data, point_data, edges = self._read_grid(filepath)
+				if not volume_data or len(volume_data.vertices) == 0:
+					self.report({'ERROR'}, f"Failed to read file {file_elem.name}: No vertices found.")
+					continue
+				obj = self._create_mesh(context, volume_data, point_data, f"Frame_{frame}", edges)
 			try:
 				obj["sciblend_volume_source_dir"] = self.directory or ""
 				obj["sciblend_volume_source_file"] = file_elem.name or ""
 				obj["sciblend_volume_format"] = os.path.splitext(filepath)[1].lower()
 			except Exception:
 				pass
+			if getattr(context.scene, 'on_demand_persist_topology', False) and volume_data is not None and volume_data.cells:
+				save_model_sidecar(obj, volume_data, filepath)
 			rotation = axis_conversion(from_forward='-Z', from_up='Y', to_forward=self.axis_forward, to_up=self.axis_up).to_4x4()
 			scale = mathutils.Matrix.Scale(self.scale_factor, 4)
 			obj.matrix_world = rotation @ scale
@@ -118,6 +141,30 @@ class ImportVTKAnimationOperator(Operator, ImportHelper):
 			print(f"[VTK] Imported {os.path.basename(file_elem.name)} ({processed}/{num_frames}) in {duration:.2f}s. ETA ~ {eta_dt.strftime('%H:%M:%S')}")
 		return {'FINISHED'}
 
+	def _component_name_map(self) -> dict:
+		"""Return the parsed component name map, or an empty dict when it is unset or invalid."""
+		try:
+			name_map = json.loads(getattr(self, 'component_name_map_json', '') or '{}')
+		except Exception:
+			name_map = {}
+		return name_map if isinstance(name_map, dict) else {}
+
+	def _read_skin(self, filepath, extension):
+		"""Read only the boundary surface of a file, piece-wise in parallel and/or out of core."""
+		from .partitioned import read_partitioned_skin, merge_piece_skins
+		name_map = self._component_name_map()
+		if not self.out_of_core:
+			# All points are kept so mesh vertex i is point i of the volume model filters load from the file
+			return read_partitioned_skin(filepath, name_map, self.piece_workers, all_points=True)
+		from .out_of_core import read_skin_out_of_core
+
+		def _reader(path, piece_name_map):
+			return read_skin_out_of_core(path, piece_name_map, self.chunk_cells)
+		if extension == '.pvtu':
+			# Pieces are streamed one at a time so that memory stays bounded by a single chunk
+			return read_partitioned_skin(filepath, name_map, 1, piece_reader=_reader)
+		return merge_piece_skins([_reader(filepath, name_map)])
+
 	def _read_grid(self, filepath):
 		"""Read a VTK file and build an instance-based topological volume model and point data, returning also extracted line/polylines as edge pairs.
 
@@ -258,10 +305,7 @@ class ImportVTKAnimationOperator(Operator, ImportHelper):
 		
 		point_data = {}
 		pd = data.GetPointData()
-		try:
-			name_map = json.loads(getattr(self, 'component_name_map_json', '') or '{}')
-		except Exception:
-			name_map = {}
+		name_map = self._component_name_map()
 		for k in range(pd.GetNumberOfArrays()):
 			array = pd.GetArray(k)
 			base_name = array.GetName() or f"Array_{k}"
@@ -414,4 +458,46 @@ class ImportVTKAnimationOperator(Operator, ImportHelper):
 
 		return obj
 
+	def _create_skin_mesh(self, context, skin, name):
+		"""Create a Blender mesh from a merged skin (see partitioned.merge_piece_skins) using bulk writes."""
+		import numpy as np
+		mesh = bpy.data.meshes.new(name)
+		obj = bpy.data.objects.new(name, mesh)
+		if hasattr(self, '_target_collection') and self._target_collection is not None:
+			self._target_collection.objects.link(obj)
+		else:
+			context.collection.objects.link(obj)
+
+		points = skin['points']
+		face_offsets = skin['face_offsets']
+		mesh.vertices.add(int(points.shape[0]))
+		mesh.vertices.foreach_set('co', np.ascontiguousarray(points, dtype=np.float32).ravel())
+		mesh.loops.add(int(skin['face_vertices'].shape[0]))
+		mesh.loops.foreach_set('vertex_index', np.ascontiguousarray(skin['face_vertices'], dtype=np.int32))
+		mesh.polygons.add(int(face_offsets.shape[0] - 1))
+		mesh.polygons.foreach_set('loop_start', np.ascontiguousarray(face_offsets[:-1], dtype=np.int32))
+		mesh.update(calc_edges=True)
+		edges = skin['edges']
+		if edges.shape[0]:
+			first_edge = len(mesh.edges)
+			mesh.edges.add(int(edges.shape[0]))
+			all_vertices = np.zeros(len(mesh.edges) * 2, dtype=np.int32)
+			mesh.edges.foreach_get('vertices', all_vertices)
+			all_vertices[first_edge * 2:] = edges.ravel()
+			mesh.edges.foreach_set('vertices', all_vertices)
+			mesh.update()
+
+		for attr_name, attr_values in skin['point_data'].items():
+			attr = mesh.attributes.new(name=attr_name, type='FLOAT', domain='POINT')
+			attr.data.foreach_set('value', np.ascontiguousarray(attr_values, dtype=np.float32))
+		for attr_name, attr_values in sorted(skin['face_attributes'].items()):
+			attr = mesh.attributes.new(name=f"cell_{attr_name}", type='FLOAT', domain='FACE')
+			attr.data.foreach_set('value', np.ascontiguousarray(attr_values, dtype=np.float32))
+
+		# No topology model is registered here; the filters load the volume from the source file on demand
+		if hasattr(obj, 'volume_mesh_info') and getattr(obj.volume_mesh_info, 'is_volume_mesh', None) is not None:
+			obj.volume_mesh_info.is_volume_mesh = True
+
+		return obj
+
 __all__ = ["ImportVTKAnimationOperator"] 
\ No newline at end of file
@@ -0,0 +1,420 @@
+import os
+import zlib
+import lzma
+import tempfile
+import numpy as np
+import xml.etree.ElementTree as ET
+from .operators import VTK_LINE, VTK_POLYLINE, VTK_TRIANGLE_STRIP, VTK_POLYGON, VTK_POLYHEDRON
+from .partitioned import _CELL_FACES, _SURFACE_FACES, _GHOST_ARRAY, _GLOBAL_IDS, _skin_mask, _duplicate_groups, point_data_columns
+
+DEFAULT_CHUNK_CELLS = 500000
+
+_XML_TYPES = {
+	'Int8': 'i1', 'UInt8': 'u1', 'Int16': 'i2', 'UInt16': 'u2', 'Int32': 'i4', 'UInt32': 'u4',
+	'Int64': 'i8', 'UInt64': 'u8', 'Float32': 'f4', 'Float64': 'f8',
+}
+_DECOMPRESSORS = {'vtkZLibDataCompressor': zlib.decompress, 'vtkLZMADataCompressor': lzma.decompress}
+
+
+class NotStreamableError(Exception):
+	"""Raised when a file cannot be read in chunks straight from disk."""
+
+
+class _AppendedXMLSource:
+	"""Chunked reader for .vtu files whose arrays are stored as raw appended data, optionally block-compressed.
+
+	Only the XML header is parsed up front; array ranges are read (and decompressed block by block) on request.
+	"""
+
+	def __init__(self, path: str):
+		self.path = path
+		header, self._data_start = self._split_header(path)
+		root = ET.fromstring(header + b'</VTKFile>')
+		if root.get('type') != 'UnstructuredGrid':
+			raise NotStreamableError("not an unstructured grid")
+		compressor = root.get('compressor')
+		if compressor and compressor not in _DECOMPRESSORS:
+			raise NotStreamableError(f"unsupported compressor {compressor}")
+		self._decompress = _DECOMPRESSORS.get(compressor)
+		self._endian = '>' if root.get('byte_order') == 'BigEndian' else '<'
+		self._header_dtype = np.dtype(self._endian + ('u8' if root.get('header_type') == 'UInt64' else 'u4'))
+		pieces = root.findall('./UnstructuredGrid/Piece')
+		if len(pieces) != 1:
+			raise NotStreamableError("expected exactly one piece")
+		piece = pieces[0]
+		self.num_points = int(piece.get('NumberOfPoints'))
+		self.num_cells = int(piece.get('NumberOfCells'))
+		self._arrays = {}
+		self.point_arrays = []
+		self.cell_arrays = []
+		for section, names in (('PointData', self.point_arrays), ('CellData', self.cell_arrays), ('Points', None), ('Cells', None)):
+			element = piece.find(section)
+			for k, array in enumerate(element.findall('DataArray') if element is not None else []):
+				name = array.get('Name') or f"Array_{k}"
+				if array.get('format') != 'appended' or array.get('type') not in _XML_TYPES:
+					raise NotStreamableError(f"array {name} is not stored as appended data")
+				components = int(array.get('NumberOfComponents') or 1)
+				self._arrays[(section, name)] = {
+					'offset': int(array.get('offset')),
+					'dtype': np.dtype(self._endian + _XML_TYPES[array.get('type')]),
+					'components': components,
+					'blocks': None,
+				}
+				if names is not None:
+					names.append((name, components, [array.get(f'ComponentName{c}') for c in range(components)]))
+		if ('Points', 'Points') not in self._arrays:
+			points = piece.find('Points/DataArray')
+			if points is None:
+				raise NotStreamableError("missing points")
+			self._arrays[('Points', 'Points')] = self._arrays[('Points', points.get('Name') or 'Array_0')]
+		for required in ('connectivity', 'offsets', 'types'):
+			if ('Cells', required) not in self._arrays:
+				raise NotStreamableError(f"missing cell array {required}")
+
+	@staticmethod
+	def _split_header(path: str) -> tuple:
+		"""Return the XML text before <AppendedData> and the file offset of the first appended byte."""
+		marker = b'<AppendedData'
+		header = b''
+		with open(path, 'rb') as f:
+			while True:
+				block = f.read(1 << 20)
+				if not block:
+					raise NotStreamableError("no appended data")
+				header += block
+				pos = header.find(marker)
+				if pos < 0:
+					continue
+				tag_end = header.find(b'>', pos)
+				while tag_end < 0:
+					block = f.read(1 << 16)
+					if not block:
+						raise NotStreamableError("truncated appended data tag")
+					header += block
+					tag_end = header.find(b'>', pos)
+				tag = header[pos:tag_end]
+				if b'raw' not in tag:
+					raise NotStreamableError("appended data is not raw")
+				underscore = header.find(b'_', tag_end)
+				while underscore < 0:
+					block = f.read(1 << 16)
+					if not block:
+						raise NotStreamableError("truncated appended data")
+					header += block
+					underscore = header.find(b'_', tag_end)
+				return header[:pos], underscore + 1
+
+	def _read_bytes(self, f, start: int, count: int) -> bytes:
+		f.seek(start)
+		data = f.read(count)
+		if len(data) != count:
+			raise NotStreamableError("unexpected end of file")
+		return data
+
+	def read(self, section: str, name: str, start: int, stop: int) -> np.ndarray:
+		"""Return tuples [start, stop) of an array as an (n, components) array."""
+		info = self._arrays[(section, name)]
+		tuple_bytes = info['dtype'].itemsize * info['components']
+		first, last = start * tuple_bytes, stop * tuple_bytes
+		if last <= first:
+			return np.zeros((0, info['components']), dtype=info['dtype'].newbyteorder('='))
+		base = self._data_start + info['offset']
+		word = self._header_dtype.itemsize
+		with open(self.path, 'rb') as f:
+			if self._decompress is None:
+				raw = self._read_bytes(f, base + word + first, last - first)
+			else:
+				if info['blocks'] is None:
+					head = np.frombuffer(self._read_bytes(f, base, 3 * word), dtype=self._header_dtype)
+					num_blocks, block_size, last_size = int(head[0]), int(head[1]), int(head[2])
+					sizes = np.frombuffer(self._read_bytes(f, base + 3 * word, num_blocks * word), dtype=self._header_dtype).astype(np.int64)
+					starts = base + (3 + num_blocks) * word + np.concatenate(([0], np.cumsum(sizes)[:-1]))
+					info['blocks'] = (block_size, last_size or block_size, num_blocks, starts, sizes)
+				block_size, last_size, num_blocks, starts, sizes = info['blocks']
+				parts = []
+				for block in range(first // block_size, min(num_blocks, (last - 1) // block_size + 1)):
+					parts.append(self._decompress(self._read_bytes(f, int(starts[block]), int(sizes[block]))))
+				joined = b''.join(parts)
+				skip = first - (first // block_size) * block_size
+				raw = joined[skip:skip + last - first]
+		values = np.frombuffer(raw, dtype=info['dtype']).astype(info['dtype'].newbyteorder('='))
+		return values.reshape(stop - start, info['components'])
+
+	def read_points(self, start: int, stop: int) -> np.ndarray:
+		return self.read('Points', 'Points', start, stop).astype(np.float64)
+
+	def read_cells(self, start: int, stop: int) -> tuple:
+		"""Return (types, offsets, connectivity) of cells [start, stop); offsets are absolute and have stop-start+1 entries."""
+		types = self.read('Cells', 'types', start, stop).reshape(-1).astype(np.int64)
+		ends = self.read('Cells', 'offsets', max(start - 1, 0), stop).reshape(-1).astype(np.int64)
+		offsets = np.concatenate(([0], ends)) if start == 0 else ends
+		conn = self.read('Cells', 'connectivity', int(offsets[0]), int(offsets[-1])).reshape(-1).astype(np.int64)
+		return types, offsets, conn
+
+	def polyhedron_faces(self, cell: int) -> list:
+		raise NotStreamableError("polyhedra need the in-memory reader")
+
+
+class _InMemorySource:
+	"""Reader with the same interface over a grid loaded by VTK (legacy files, inline XML arrays, polyhedra).
+
+	The grid itself is held in memory, but faces are still processed in chunks and spilled like the streaming path.
+	"""
+
+	def __init__(self, path: str):
+		from vtkmodules.util.numpy_support import vtk_to_numpy
+		from vtkmodules.vtkIOLegacy import vtkUnstructuredGridReader
+		from vtkmodules.vtkIOXML import vtkXMLUnstructuredGridReader
+		reader = vtkUnstructuredGridReader() if path.lower().endswith('.vtk') else vtkXMLUnstructuredGridReader()
+		reader.SetFileName(path)
+		reader.Update()
+		self._data = reader.GetOutput()
+		if self._data is None or self._data.GetPoints() is None:
+			raise RuntimeError(f"No unstructured grid in {path}")
+		self.num_points = self._data.GetNumberOfPoints()
+		self.num_cells = self._data.GetNumberOfCells()
+		cells = self._data.GetCells()
+		self._types = np.asarray(vtk_to_numpy(self._data.GetCellTypesArray()), dtype=np.int64)
+		self._offsets = np.asarray(vtk_to_numpy(cells.GetOffsetsArray()), dtype=np.int64)
+		self._conn = np.asarray(vtk_to_numpy(cells.GetConnectivityArray()), dtype=np.int64)
+		self._values = {('Points', 'Points'): np.asarray(vtk_to_numpy(self._data.GetPoints().GetData()), dtype=np.float64)}
+		self.point_arrays = []
+		self.cell_arrays = []
+		for section, data, names in (('PointData', self._data.GetPointData(), self.point_arrays), ('CellData', self._data.GetCellData(), self.cell_arrays)):
+			for k in range(data.GetNumberOfArrays()):
+				array = data.GetArray(k)
+				if array is None:
+					continue
+				name = array.GetName() or f"Array_{k}"
+				components = array.GetNumberOfComponents()
+				self._values[(section, name)] = vtk_to_numpy(array).reshape(-1, components)
+				names.append((name, components, [array.GetComponentName(c) for c in range(components)]))
+
+	def read(self, section: str, name: str, start: int, stop: int) -> np.ndarray:
+		values = self._values[(section, name)]
+		return values.reshape(values.shape[0], -1)[start:stop]
+
+	def read_points(self, start: int, stop: int) -> np.ndarray:
+		return self._values[('Points', 'Points')][start:stop]
+
+	def read_cells(self, start: int, stop: int) -> tuple:
+		offsets = self._offsets[start:stop + 1]
+		return self._types[start:stop], offsets, self._conn[offsets[0]:offsets[-1]]
+
+	def polyhedron_faces(self, cell: int) -> list:
+		vtk_cell = self._data.GetCell(cell)
+		faces = []
+		for k in range(vtk_cell.GetNumberOfFaces()):
+			face = vtk_cell.GetFace(k)
+			faces.append([face.GetPointId(j) for j in range(face.GetNumberOfPoints())])
+		return faces
+
+
+def open_grid_source(path: str):
+	"""Return a chunked reader for an unstructured grid, streaming from disk when the file layout allows it."""
+	if path.lower().endswith('.vtu'):
+		try:
+			return _AppendedXMLSource(path)
+		except NotStreamableError as e:
+			print(f"[VTK] {os.path.basename(path)} is read into memory ({e})")
+	return _InMemorySource(path)
+
+
+def _chunk_faces(source, start: int, stop: int, ghost_name) -> tuple:
+	"""Return ({size: (faces, owner cells, surface flags)}, edges) for cells [start, stop)."""
+	types, offsets, conn = source.read_cells(start, stop)
+	base = offsets[0]
+	live = np.ones(types.shape[0], dtype=bool)
+	if ghost_name is not None:
+		live = source.read('CellData', ghost_name, start, stop).reshape(-1) == 0
+	blocks = {}
+
+	def _add(faces: np.ndarray, owners: np.ndarray, surface: bool):
+		if faces.shape[0] == 0:
+			return
+		entry = blocks.setdefault(faces.shape[1], ([], [], []))
+		entry[0].append(faces.astype(np.int64))
+		entry[1].append(owners.astype(np.int64) + start)
+		entry[2].append(np.full(faces.shape[0], surface, dtype=bool))
+
+	local = offsets[:-1] - base
+	for cell_type, templates in _CELL_FACES.items():
+		sel = np.flatnonzero((types == cell_type) & live)
+		for template in templates if sel.shape[0] else ():
+			_add(conn[local[sel][:, None] + np.asarray(template)], sel, False)
+	for cell_type, template in _SURFACE_FACES.items():
+		sel = np.flatnonzero((types == cell_type) & live)
+		if sel.shape[0]:
+			_add(conn[local[sel][:, None] + np.asarray(template)], sel, True)
+	sizes = np.diff(offsets)
+	polygons = np.flatnonzero((types == VTK_POLYGON) & live & (sizes >= 3))
+	for size in np.unique(sizes[polygons]):
+		sel = polygons[sizes[polygons] == size]
+		_add(conn[local[sel][:, None] + np.arange(size)], sel, True)
+	edges = []
+	for cell in np.flatnonzero(np.isin(types, (VTK_POLYHEDRON, VTK_TRIANGLE_STRIP, VTK_LINE, VTK_POLYLINE)) & live).tolist():
+		ids = conn[local[cell]:local[cell] + sizes[cell]]
+		if types[cell] == VTK_POLYHEDRON:
+			for face in source.polyhedron_faces(start + cell):
+				_add(np.asarray(face, dtype=np.int64)[None, :], np.array([cell]), False)
+		elif types[cell] == VTK_TRIANGLE_STRIP and ids.shape[0] >= 3:
+			tris = np.stack([ids[:-2], ids[1:-1], ids[2:]], axis=1)
+			tris[1::2, :2] = tris[1::2, 1::-1]
+			_add(tris, np.full(tris.shape[0], cell), True)
+		elif types[cell] in (VTK_LINE, VTK_POLYLINE) and ids.shape[0] >= 2:
+			edges.append(np.stack([ids[:-1], ids[1:]], axis=1))
+	result = {}
+	for size, (face_list, owner_list, surface_list) in blocks.items():
+		result[size] = (np.concatenate(face_list), np.concatenate(owner_list), np.concatenate(surface_list))
+	return result, edges
+
+
+def _run_dtype(size: int) -> np.dtype:
+	key = np.dtype([(f'k{i}', np.int64) for i in range(size)])
+	return np.dtype([('key', key), ('verts', np.int64, (size,)), ('cell', np.int64), ('surface', np.bool_)])
+
+
+def _spill_run(directory: str, size: int, index: int, faces: np.ndarray, owners: np.ndarray, surface: np.ndarray) -> str:
+	"""Write the local skin of one chunk, sorted by canonical face key, to a .npy run file."""
+	keep = _skin_mask(faces, surface)
+	faces, owners, surface = faces[keep], owners[keep], surface[keep]
+	keys = np.sort(faces, axis=1)
+	order = np.lexsort(keys.T[::-1])
+	run = np.empty(order.shape[0], dtype=_run_dtype(size))
+	for i in range(size):
+		run['key'][f'k{i}'] = keys[order, i]
+	run['verts'] = faces[order]
+	run['cell'] = owners[order]
+	run['surface'] = surface[order]
+	path = os.path.join(directory, f"faces_{size}_{index}.npy")
+	np.save(path, run)
+	return path
+
+
+def _merge_runs(paths: list, block_rows: int) -> np.ndarray:
+	"""K-way merge of sorted runs keeping the skin: keys seen once, and one copy of repeated surface faces.
+
+	At most `block_rows` rows per run are buffered; a key is only decided once every run has moved past it.
+	"""
+	runs = [np.load(path, mmap_mode='r') for path in paths]
+	positions = [0] * len(runs)
+	buffers = [None] * len(runs)
+	kept = []
+	while True:
+		for r, run in enumerate(runs):
+			if (buffers[r] is None or buffers[r].shape[0] == 0) and positions[r] < run.shape[0]:
+				buffers[r] = np.array(run[positions[r]:positions[r] + block_rows])
+				positions[r] += buffers[r].shape[0]
+		active = [r for r in range(len(runs)) if buffers[r] is not None and buffers[r].shape[0]]
+		if not active:
+			break
+		pending = [r for r in active if positions[r] < runs[r].shape[0]]
+		cuts = {}
+		if pending:
+			lasts = np.concatenate([buffers[r]['key'][-1:] for r in pending])
+			threshold = np.sort(lasts)[:1]
+			for r in active:
+				cuts[r] = int(np.searchsorted(buffers[r]['key'], threshold, side='left')[0])
+			if not any(cuts.values()):
+				# Every buffered row shares the bound key; read further into the runs that end on it
+				for r in pending:
+					if np.searchsorted(buffers[r]['key'], threshold, side='right')[0] == buffers[r].shape[0]:
+						more = np.array(runs[r][positions[r]:positions[r] + block_rows])
+						positions[r] += more.shape[0]
+						buffers[r] = np.concatenate([buffers[r], more])
+				continue
+		else:
+			cuts = {r: buffers[r].shape[0] for r in active}
+		taken = np.concatenate([buffers[r][:cuts[r]] for r in active])
+		for r in active:
+			buffers[r] = buffers[r][cuts[r]:]
+		keys = np.stack([taken['key'][name] for name in taken.dtype['key'].names], axis=1)
+		order, group, sizes = _duplicate_groups(keys)
+		first = np.concatenate(([True], group[1:] != group[:-1]))
+		surface = taken['surface'][order]
+		keep = ((sizes[group] == 1) & ~surface) | (first & surface)
+		kept.append(taken[order[keep]])
+	return np.concatenate(kept) if kept else np.zeros(0, dtype=runs[0].dtype if runs else _run_dtype(3))
+
+
+def read_skin_out_of_core(path: str, name_map: dict = None, chunk_cells: int = DEFAULT_CHUNK_CELLS, temp_dir: str = None) -> dict:
+	"""Extract the skin of an unstructured grid in fixed-size cell chunks; same result layout as read_piece_skin.
+
+	Each chunk's local skin is sorted by canonical face key and spilled to a run file; the runs are merged to keep
+	faces with no neighbour. Points, point data and cell data are then gathered chunk by chunk for the skin only,
+	so peak memory follows the chunk size and the skin rather than the whole grid.
+	"""
+	chunk_cells = max(1, int(chunk_cells))
+	source = open_grid_source(path)
+	try:
+		return _extract_skin(source, name_map, chunk_cells, temp_dir)
+	except NotStreamableError as e:
+		print(f"[VTK] {os.path.basename(path)} is read into memory ({e})")
+	return _extract_skin(_InMemorySource(path), name_map, chunk_cells, temp_dir)
+
+
+def _extract_skin(source, name_map: dict, chunk_cells: int, temp_dir: str) -> dict:
+	ghost_name = _GHOST_ARRAY if any(name == _GHOST_ARRAY for name, _, _ in source.cell_arrays) else None
+	faces = {}
+	edges = []
+	with tempfile.TemporaryDirectory(prefix="sciblend_skin_", dir=temp_dir) as directory:
+		runs = {}
+		for index, start in enumerate(range(0, source.num_cells, chunk_cells)):
+			blocks, chunk_edges = _chunk_faces(source, start, min(start + chunk_cells, source.num_cells), ghost_name)
+			edges.extend(chunk_edges)
+			for size, (block, owners, surface) in blocks.items():
+				runs.setdefault(size, []).append(_spill_run(directory, size, index, block, owners, surface))
+			del blocks
+		for size, paths in runs.items():
+			block_rows = max(1024, chunk_cells // max(1, len(paths)))
+			skin = _merge_runs(paths, block_rows)
+			faces[size] = (np.ascontiguousarray(skin['verts']), skin['surface'].copy(), skin['cell'].copy())
+	edges = np.concatenate(edges) if edges else np.zeros((0, 2), dtype=np.int64)
+
+	used = np.unique(np.concatenate([block.ravel() for block, _, _ in faces.values()] + [edges.ravel()]))
+	points = np.zeros((used.shape[0], 3), dtype=np.float64)
+	point_columns = {name: np.zeros((used.shape[0], components)) for name, components, _ in source.point_arrays}
+	for start in range(0, source.num_points, chunk_cells):
+		stop = min(start + chunk_cells, source.num_points)
+		lo, hi = np.searchsorted(used, (start, stop))
+		if hi == lo:
+			continue
+		rows = used[lo:hi] - start
+		points[lo:hi] = source.read_points(start, stop)[rows]
+		for name, column in point_columns.items():
+			column[lo:hi] = source.read('PointData', name, start, stop)[rows]
+
+	owners = np.concatenate([cells for _, _, cells in faces.values()]) if faces else np.zeros(0, dtype=np.int64)
+	owner_order = np.argsort(owners, kind='stable')
+	sorted_owners = owners[owner_order]
+	cell_names = [name for name, _, _ in source.cell_arrays if name != _GHOST_ARRAY]
+	cell_values = {name: np.zeros(owners.shape[0]) for name in cell_names}
+	for start in range(0, source.num_cells, chunk_cells):
+		stop = min(start + chunk_cells, source.num_cells)
+		lo, hi = np.searchsorted(sorted_owners, (start, stop))
+		if hi == lo:
+			continue
+		for name in cell_names:
+			cell_values[name][owner_order[lo:hi]] = source.read('CellData', name, start, stop)[sorted_owners[lo:hi] - start, 0]
+
+	point_data = {}
+	global_ids = None
+	for name, components, component_names in source.point_arrays:
+		if name == _GLOBAL_IDS:
+			global_ids = point_columns[name][:, 0].astype(np.int64)
+			continue
+		point_data.update(point_data_columns(name, point_columns[name], component_names, name_map or {}))
+	result_faces = {}
+	first = 0
+	for size, (block, surface, cells) in faces.items():
+		count = block.shape[0]
+		attributes = {name: values[first:first + count] for name, values in cell_values.items()}
+		result_faces[size] = (np.searchsorted(used, block), surface, attributes)
+		first += count
+	return {
+		'points': points,
+		'faces': result_faces,
+		'edges': np.searchsorted(used, edges),
+		'point_data': point_data,
+		'global_ids': global_ids,
+	}
@@ -0,0 +1,342 @@
+import os
+import numpy as np
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from .operators import (
+	VTK_LINE, VTK_POLYLINE, VTK_TRIANGLE, VTK_TRIANGLE_STRIP, VTK_POLYGON, VTK_PIXEL, VTK_QUAD,
+	VTK_TETRA, VTK_VOXEL, VTK_HEXAHEDRON, VTK_WEDGE, VTK_PYRAMID, VTK_POLYHEDRON,
+)
+
+# Faces of the linear volume cells, in the same vertex order as the object-model importer
+_CELL_FACES = {
+	VTK_TETRA: [[0, 2, 1], [0, 1, 3], [1, 2, 3], [0, 3, 2]],
+	VTK_HEXAHEDRON: [[0, 3, 2, 1], [4, 5, 6, 7], [0, 1, 5, 4], [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7]],
+	VTK_WEDGE: [[0, 2, 1], [3, 4, 5], [0, 1, 4, 3], [1, 2, 5, 4], [2, 0, 3, 5]],
+	VTK_PYRAMID: [[0, 1, 2, 3], [0, 1, 4], [1, 2, 4], [2, 3, 4], [3, 0, 4]],
+	VTK_VOXEL: [[0, 1, 3, 2], [4, 5, 7, 6], [0, 2, 6, 4], [1, 3, 7, 5], [0, 1, 5, 4], [2, 3, 7, 6]],
+}
+_SURFACE_FACES = {VTK_TRIANGLE: [0, 1, 2], VTK_QUAD: [0, 1, 2, 3], VTK_PIXEL: [0, 1, 3, 2]}
+_GHOST_ARRAY = "vtkGhostType"
+_GLOBAL_IDS = "GlobalNodeIds"
+
+
+def piece_files(filepath: str) -> list:
+	"""Return the piece files listed by a .pvtu/.pvtp file, resolved relative to it."""
+	root = ET.parse(filepath).getroot()
+	base = os.path.dirname(os.path.abspath(filepath))
+	sources = [piece.get('Source') for piece in root.iter('Piece') if piece.get('Source')]
+	return [s if os.path.isabs(s) else os.path.normpath(os.path.join(base, s)) for s in sources]
+
+
+def _duplicate_groups(keys: np.ndarray) -> tuple:
+	"""Group equal rows of a 2-D integer array; returns (row order, group id per sorted row, group sizes)."""
+	if keys.shape[0] == 0:
+		return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+	order = np.lexsort(keys.T[::-1])
+	sorted_keys = keys[order]
+	starts = np.concatenate(([True], np.any(sorted_keys[1:] != sorted_keys[:-1], axis=1)))
+	group = np.cumsum(starts) - 1
+	return order, group, np.bincount(group)
+
+
+def _skin_mask(faces: np.ndarray, surface: np.ndarray) -> np.ndarray:
+	"""Keep volume faces that occur once and one copy of each surface face; all faces have the same size."""
+	order, group, sizes = _duplicate_groups(np.sort(faces, axis=1))
+	keep = np.zeros(faces.shape[0], dtype=bool)
+	if faces.shape[0] == 0:
+		return keep
+	single = sizes[group] == 1
+	first = np.concatenate(([True], group[1:] != group[:-1]))
+	sorted_surface = surface[order]
+	keep[order] = (single & ~sorted_surface) | (first & sorted_surface)
+	return keep
+
+
+def point_data_columns(base_name: str, values: np.ndarray, component_names: list, name_map: dict) -> dict:
+	"""Split one point array (n, components) into float columns named like the object-model importer."""
+	labels = {3: ['X', 'Y', 'Z'], 6: ['XX', 'YY', 'ZZ', 'XY', 'YZ', 'XZ'], 9: ['XX', 'XY', 'XZ', 'YX', 'YY', 'YZ', 'ZX', 'ZY', 'ZZ']}
+	if base_name.strip().lower() == 'id':
+		base_name = 'id_attribute'
+	values = np.asarray(values, dtype=np.float64)
+	num_components = values.shape[1] if values.ndim > 1 else 1
+	if num_components <= 1:
+		return {base_name: values.reshape(-1)}
+	preferred = name_map.get(base_name) if isinstance(name_map, dict) else None
+	if not (isinstance(preferred, list) and len(preferred) == num_components):
+		preferred = None
+	columns = {}
+	for comp in range(num_components):
+		comp_raw = component_names[comp] if comp < len(component_names) else None
+		comp_name = str(comp_raw).strip() if comp_raw is not None else ""
+		if preferred is not None:
+			comp_name = str(preferred[comp])
+		if comp_name == "":
+			comp_name = labels[num_components][comp] if num_components in labels else str(comp)
+		columns[f"{base_name}_{comp_name}"] = values[:, comp]
+	columns[f"{base_name}_Magnitude"] = np.sqrt(np.sum(values * values, axis=1))
+	return columns
+
+
+def _point_columns(pd, name_map: dict, used: np.ndarray) -> dict:
+	"""Split the point arrays of a VTK dataset into float columns for the used points."""
+	from vtkmodules.util.numpy_support import vtk_to_numpy
+	columns = {}
+	for k in range(pd.GetNumberOfArrays()):
+		array = pd.GetArray(k)
+		if array is None:
+			continue
+		base_name = array.GetName() or f"Array_{k}"
+		if base_name == _GLOBAL_IDS:
+			continue
+		num_components = array.GetNumberOfComponents()
+		values = np.asarray(vtk_to_numpy(array), dtype=np.float64).reshape(-1, num_components)[used]
+		component_names = [array.GetComponentName(comp) for comp in range(num_components)]
+		columns.update(point_data_columns(base_name, values, component_names, name_map))
+	return columns
+
+
+def read_piece_skin(path: str, name_map: dict = None, all_points: bool = False) -> dict:
+	"""Read one piece file and return its local skin; touches no Blender data and can run on a worker thread.
+
+	Ghost cells are dropped. The result holds the used points (every point of the piece with `all_points`), faces
+	grouped by vertex count (local point indices, a surface flag and the first component of every cell array of
+	the owning cell), loose edges, point data columns and GlobalNodeIds when the piece has them.
+	"""
+	from vtkmodules.util.numpy_support import vtk_to_numpy
+	from vtkmodules.vtkIOXML import vtkXMLUnstructuredGridReader, vtkXMLPolyDataReader
+	is_poly = os.path.splitext(path)[1].lower() == '.vtp'
+	reader = vtkXMLPolyDataReader() if is_poly else vtkXMLUnstructuredGridReader()
+	reader.SetFileName(path)
+	reader.Update()
+	data = reader.GetOutput()
+	empty = {'points': np.zeros((0, 3)), 'faces': {}, 'edges': np.zeros((0, 2), dtype=np.int64), 'point_data': {}, 'global_ids': None}
+	if data is None or data.GetPoints() is None or data.GetNumberOfPoints() == 0:
+		return empty
+	points = np.asarray(vtk_to_numpy(data.GetPoints().GetData()), dtype=np.float64)
+
+	blocks = {}
+	edges = []
+
+	def _add(faces: np.ndarray, owners: np.ndarray, surface: bool):
+		if faces.shape[0] == 0:
+			return
+		entry = blocks.setdefault(faces.shape[1], ([], [], []))
+		entry[0].append(faces.astype(np.int64))
+		entry[1].append(owners.astype(np.int64))
+		entry[2].append(np.full(faces.shape[0], surface, dtype=bool))
+
+	cd = data.GetCellData()
+	if is_poly:
+		# Cell data of polydata is ordered verts, lines, polys, strips
+		first_poly = data.GetNumberOfVerts() + data.GetNumberOfLines()
+		first_strip = first_poly + data.GetNumberOfPolys()
+		for cell_array, kind in ((data.GetPolys(), 'poly'), (data.GetStrips(), 'strip'), (data.GetLines(), 'line')):
+			offsets = np.asarray(vtk_to_numpy(cell_array.GetOffsetsArray()), dtype=np.int64)
+			conn = np.asarray(vtk_to_numpy(cell_array.GetConnectivityArray()), dtype=np.int64)
+			sizes = np.diff(offsets)
+			if kind == 'poly':
+				for size in np.unique(sizes[sizes >= 3]):
+					sel = np.flatnonzero(sizes == size)
+					_add(conn[offsets[sel][:, None] + np.arange(size)], first_poly + sel, True)
+				continue
+			for cell in range(sizes.shape[0]):
+				ids = conn[offsets[cell]:offsets[cell + 1]]
+				if kind == 'strip' and ids.shape[0] >= 3:
+					tris = np.stack([ids[:-2], ids[1:-1], ids[2:]], axis=1)
+					tris[1::2, :2] = tris[1::2, 1::-1]
+					_add(tris, np.full(tris.shape[0], first_strip + cell), True)
+				elif kind == 'line' and ids.shape[0] >= 2:
+					edges.append(np.stack([ids[:-1], ids[1:]], axis=1))
+		num_cells = data.GetNumberOfCells()
+		ghost = None
+	else:
+		types = np.asarray(vtk_to_numpy(data.GetCellTypesArray()), dtype=np.int64)
+		cells = data.GetCells()
+		offsets = np.asarray(vtk_to_numpy(cells.GetOffsetsArray()), dtype=np.int64)
+		conn = np.asarray(vtk_to_numpy(cells.GetConnectivityArray()), dtype=np.int64)
+		num_cells = types.shape[0]
+		ghost = cd.GetArray(_GHOST_ARRAY) if cd is not None else None
+		live = np.ones(num_cells, dtype=bool) if ghost is None else np.asarray(vtk_to_numpy(ghost)) == 0
+		for cell_type, templates in _CELL_FACES.items():
+			sel = np.flatnonzero((types == cell_type) & live)
+			if sel.shape[0] == 0:
+				continue
+			starts = offsets[sel]
+			for template in templates:
+				_add(conn[starts[:, None] + np.asarray(template)], sel, False)
+		for cell_type, template in _SURFACE_FACES.items():
+			sel = np.flatnonzero((types == cell_type) & live)
+			if sel.shape[0]:
+				_add(conn[offsets[sel][:, None] + np.asarray(template)], sel, True)
+		sizes = np.diff(offsets)
+		polygons = np.flatnonzero((types == VTK_POLYGON) & live & (sizes >= 3))
+		for size in np.unique(sizes[polygons]):
+			sel = polygons[sizes[polygons] == size]
+			_add(conn[offsets[sel][:, None] + np.arange(size)], sel, True)
+		# Polyhedra and strips are rare; walk them through the VTK cell API
+		for cell in np.flatnonzero(np.isin(types, (VTK_POLYHEDRON, VTK_TRIANGLE_STRIP)) & live).tolist():
+			vtk_cell = data.GetCell(cell)
+			if types[cell] == VTK_POLYHEDRON:
+				for k in range(vtk_cell.GetNumberOfFaces()):
+					face = vtk_cell.GetFace(k)
+					ids = np.array([face.GetPointId(j) for j in range(face.GetNumberOfPoints())], dtype=np.int64)
+					_add(ids[None, :], np.array([cell]), False)
+			else:
+				ids = np.array([vtk_cell.GetPointId(j) for j in range(vtk_cell.GetNumberOfPoints())], dtype=np.int64)
+				tris = np.stack([ids[:-2], ids[1:-1], ids[2:]], axis=1)
+				tris[1::2, :2] = tris[1::2, 1::-1]
+				_add(tris, np.full(tris.shape[0], cell), True)
+		lines = np.flatnonzero(np.isin(types, (VTK_LINE, VTK_POLYLINE)) & live)
+		for cell in lines.tolist():
+			ids = conn[offsets[cell]:offsets[cell + 1]]
+			if ids.shape[0] >= 2:
+				edges.append(np.stack([ids[:-1], ids[1:]], axis=1))
+
+	cell_columns = {}
+	if cd is not None:
+		for k in range(cd.GetNumberOfArrays()):
+			array = cd.GetArray(k)
+			if array is None or array is ghost:
+				continue
+			values = np.asarray(vtk_to_numpy(array), dtype=np.float64)
+			column = values.reshape(values.shape[0], -1)[:, 0]
+			if column.shape[0] == num_cells:
+				cell_columns[array.GetName() or f"CellArray_{k}"] = column
+
+	faces = {}
+	for size, (face_list, owner_list, surface_list) in blocks.items():
+		block = np.concatenate(face_list)
+		owners = np.concatenate(owner_list)
+		surface = np.concatenate(surface_list)
+		keep = _skin_mask(block, surface)
+		owners = owners[keep]
+		attributes = {}
+		for name, column in cell_columns.items():
+			values = np.zeros(owners.shape[0], dtype=np.float64)
+			valid = owners >= 0
+			values[valid] = column[owners[valid]]
+			attributes[name] = values
+		faces[size] = (block[keep], surface[keep], attributes)
+	edges = np.concatenate(edges) if edges else np.zeros((0, 2), dtype=np.int64)
+
+	# Compact to the points the skin uses
+	used_mask = np.full(points.shape[0], all_points, dtype=bool)
+	for block, _, _ in faces.values():
+		used_mask[block.ravel()] = True
+	used_mask[edges.ravel()] = True
+	used = np.flatnonzero(used_mask)
+	remap = np.full(points.shape[0], -1, dtype=np.int64)
+	remap[used] = np.arange(used.shape[0], dtype=np.int64)
+	faces = {size: (remap[block], surface, attributes) for size, (block, surface, attributes) in faces.items()}
+	pd = data.GetPointData()
+	global_ids = pd.GetArray(_GLOBAL_IDS) if pd is not None else None
+	return {
+		'points': points[used],
+		'faces': faces,
+		'edges': remap[edges],
+		'point_data': _point_columns(pd, name_map or {}, used) if pd is not None else {},
+		'global_ids': np.asarray(vtk_to_numpy(global_ids), dtype=np.int64)[used] if global_ids is not None else None,
+	}
+
+
+def merge_piece_skins(pieces: list, all_points: bool = False) -> dict:
+	"""Merge local piece skins into the skin of the whole dataset.
+
+	Points shared by pieces are matched by GlobalNodeIds when every piece has them, else by exact coordinates.
+	Volume faces found in two pieces lie on a partition boundary and are removed; duplicated surface faces are
+	kept once. Returns points, CSR faces, per-face cell attributes, loose edges and point data columns.
+
+	With `all_points` (pieces read with all_points as well), the points are every piece's points concatenated
+	in piece order, duplicates included: the point order of VTK's parallel readers, so point i is point i of the
+	volume model loaded from the same file. Faces and edges then use the first copy of each shared point.
+	"""
+	pieces = [p for p in pieces if p['points'].shape[0] > 0]
+	if not pieces:
+		return {'points': np.zeros((0, 3)), 'face_offsets': np.zeros(1, dtype=np.int64), 'face_vertices': np.zeros(0, dtype=np.int64), 'face_attributes': {}, 'edges': np.zeros((0, 2), dtype=np.int64), 'point_data': {}}
+	starts = np.cumsum([0] + [p['points'].shape[0] for p in pieces])
+	points = np.concatenate([p['points'] for p in pieces])
+	if len(pieces) == 1:
+		keys = np.arange(points.shape[0], dtype=np.int64)[:, None]
+	elif all(p['global_ids'] is not None for p in pieces):
+		keys = np.concatenate([p['global_ids'] for p in pieces])[:, None]
+	else:
+		keys = np.ascontiguousarray(points).view(np.int64)
+	order, group, _ = _duplicate_groups(keys)
+	global_index = np.empty(points.shape[0], dtype=np.int64)
+	global_index[order] = group
+	representative = np.empty(group.shape[0] and int(group[-1]) + 1, dtype=np.int64)
+	representative[group[::-1]] = order[::-1]
+
+	point_names = set.intersection(*(set(p['point_data']) for p in pieces))
+	cell_names = set()
+	for p in pieces:
+		for _, _, attributes in p['faces'].values():
+			cell_names.update(attributes)
+
+	face_blocks = []
+	face_attributes = {name: [] for name in sorted(cell_names)}
+	for size in sorted({size for p in pieces for size in p['faces']}):
+		blocks = [(global_index[p['faces'][size][0] + start], p['faces'][size][1], p['faces'][size][2]) for p, start in zip(pieces, starts[:-1]) if size in p['faces']]
+		block = np.concatenate([b[0] for b in blocks])
+		surface = np.concatenate([b[1] for b in blocks])
+		keep = _skin_mask(block, surface)
+		face_blocks.append(block[keep])
+		for name in face_attributes:
+			column = np.concatenate([b[2].get(name, np.zeros(b[0].shape[0])) for b in blocks])
+			face_attributes[name].append(column[keep])
+	edges = np.concatenate([global_index[p['edges'] + start] for p, start in zip(pieces, starts[:-1])])
+	if edges.shape[0]:
+		edges = np.sort(edges, axis=1)
+		edges = edges[edges[:, 0] != edges[:, 1]]
+		order_e, group_e, _ = _duplicate_groups(edges)
+		first = np.concatenate(([True], group_e[1:] != group_e[:-1])) if group_e.shape[0] else np.zeros(0, dtype=bool)
+		edges = edges[order_e[first]]
+
+	if all_points:
+		source = np.arange(points.shape[0], dtype=np.int64)
+		remap = representative
+	else:
+		# Compact the merged points to those the skin uses
+		used_mask = np.zeros(representative.shape[0], dtype=bool)
+		for block in face_blocks:
+			used_mask[block.ravel()] = True
+		used_mask[edges.ravel()] = True
+		used = np.flatnonzero(used_mask)
+		remap = np.full(representative.shape[0], -1, dtype=np.int64)
+		remap[used] = np.arange(used.shape[0], dtype=np.int64)
+		source = representative[used]
+	sizes = np.concatenate([np.full(block.shape[0], block.shape[1], dtype=np.int64) for block in face_blocks]) if face_blocks else np.zeros(0, dtype=np.int64)
+	face_offsets = np.zeros(sizes.shape[0] + 1, dtype=np.int64)
+	np.cumsum(sizes, out=face_offsets[1:])
+	face_vertices = np.concatenate([remap[block].ravel() for block in face_blocks]) if face_blocks else np.zeros(0, dtype=np.int64)
+	return {
+		'points': points[source],
+		'face_offsets': face_offsets,
+		'face_vertices': face_vertices,
+		'face_attributes': {name: np.concatenate(columns) for name, columns in face_attributes.items()},
+		'edges': remap[edges],
+		'point_data': {name: np.concatenate([p['point_data'][name] for p in pieces])[source] for name in sorted(point_names)},
+	}
+
+
+def read_partitioned_skin(filepath: str, name_map: dict = None, max_workers: int = 0, piece_reader=None, all_points: bool = False) -> dict:
+	"""Read the pieces of a .pvtu/.pvtp file concurrently and return the merged skin (see merge_piece_skins).
+
+	Each worker reads one piece and reduces it to its local skin, so the full volumetric grid is never held in
+	memory at once. `piece_reader(path, name_map)` replaces read_piece_skin when given; `all_points` keeps every
+	point of the default reader's pieces.
+	"""
+	if piece_reader is None:
+		def piece_reader(path, piece_name_map):
+			return read_piece_skin(path, piece_name_map, all_points)
+	paths = piece_files(filepath)
+	if not paths:
+		raise RuntimeError(f"No pieces listed in {filepath}")
+	workers = max_workers if max_workers > 0 else (os.cpu_count() or 1)
+	workers = max(1, min(workers, len(paths)))
+	if workers == 1:
+		pieces = [piece_reader(path, name_map) for path in paths]
+	else:
+		with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sciblend_pieces") as executor:
+			pieces = list(executor.map(lambda path: piece_reader(path, name_map), paths))
+	return merge_piece_skins(pieces, all_points)